@@ -0,0 +1,251 @@
+"""Headless batch runs of scripted playthroughs, across a pool of processes.
+
+Each script is a list of lines of player input, played from the start of a
+saved game. Scripts are sharded across worker processes, each of which loads
+the saved game once, then plays every script it is given against a fork of
+it (see `Game.fork`), so that resetting the world between scripts costs next
+to nothing. The outcome, final score and timing of each script are gathered
+into a single `BatchReport`.
+
+Run with `python -m adventure.batch`, passing the name of a save file and
+any number of script files (one command per line).
+"""
+import argparse
+import os
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from adventure.commands import built_ins  # noqa: F401 (registers commands)
+from adventure.commands.dispatch import Dispatcher
+from adventure.commands.registry import registry
+from adventure.display.null import NullOutputter
+from adventure.exc import CommandArgumentError, UnknownCommandError
+from adventure.loaders import GameLoader
+
+
+ScriptResult = namedtuple('ScriptResult', (
+    'outcome', 'score', 'command_count', 'error_count', 'elapsed'
+))
+
+# Outcomes of a script
+WON = 'won'
+LOST = 'lost'
+UNFINISHED = 'unfinished'
+
+
+class ScriptRunner:
+    """Plays scripts against fresh forks of a single game."""
+
+    def __init__(self, game, command_registry=registry):
+        """Creates a new `ScriptRunner` instance.
+
+        Arguments:
+            game (Game): the game from whose state every script starts; it
+                is left unmodified
+            command_registry (CommandRegistry): the registry of commands
+                available to scripts (by default, the package-wide registry)
+        """
+        # Forks inherit the outputter of the game
+        game.outputter = NullOutputter()
+        self.game = game
+        self.dispatcher = Dispatcher(command_registry)
+
+    def run(self, script):
+        """Play a script until its end, or until the game is over.
+
+        Lines that do not name a command, or do not fit its arguments, are
+        counted as errors and otherwise skipped.
+
+        Arguments:
+            script (list): lines of player input
+
+        Return:
+            a ScriptResult object
+        """
+        start = time.perf_counter()
+        game = self.game.fork()
+        command_count = 0
+        error_count = 0
+        for line in script:
+            if game.is_over:
+                break
+            if not line.strip():
+                continue
+            command_count += 1
+            try:
+                self.dispatcher.dispatch(line, game)
+            except (UnknownCommandError, CommandArgumentError):
+                error_count += 1
+
+        if game.is_won:
+            outcome = WON
+        elif game.is_over:
+            outcome = LOST
+        else:
+            outcome = UNFINISHED
+        return ScriptResult(
+            outcome,
+            game.player.score,
+            command_count,
+            error_count,
+            time.perf_counter() - start
+        )
+
+
+class BatchReport:
+    """The aggregated results of a batch of scripts."""
+
+    def __init__(self, results, elapsed):
+        """Creates a new `BatchReport` instance.
+
+        Arguments:
+            results (list): a ScriptResult object per script, in the order
+                the scripts were given
+            elapsed (float): the time taken by the whole batch, in seconds
+        """
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def script_count(self):
+        return len(self.results)
+
+    @property
+    def command_count(self):
+        return sum(result.command_count for result in self.results)
+
+    @property
+    def error_count(self):
+        return sum(result.error_count for result in self.results)
+
+    @property
+    def outcomes(self):
+        """The number of scripts per outcome (won, lost or unfinished)."""
+        return Counter(result.outcome for result in self.results)
+
+    @property
+    def mean_score(self):
+        if not self.results:
+            return 0.0
+        return sum(result.score for result in self.results) / len(self.results)
+
+    @property
+    def throughput(self):
+        """The number of scripts played per second."""
+        return self.script_count / self.elapsed if self.elapsed else 0.0
+
+
+# The script runner of a worker process, set up by `_start_worker`
+_runner = None
+
+
+def _start_worker(file_name, directory, extension):
+    global _runner
+    loader = GameLoader(directory=directory, extension=extension)
+    _runner = ScriptRunner(loader.load(file_name))
+
+
+def _run_script(script):
+    return _runner.run(script)
+
+
+class BatchRunner:
+    """Plays batches of scripts from a save file, across worker processes."""
+
+    def __init__(self, file_name, directory=None, extension='json',
+                 processes=None):
+        """Creates a new `BatchRunner` instance.
+
+        Arguments:
+            file_name (str): name of the save file from which every script
+                starts (excluding extension)
+            directory (str): an optional path to the directory of the save
+                file (by default, the current working directory)
+            extension (str): the extension of the save file (by default,
+                JSON)
+            processes (int | None): the number of worker processes (by
+                default, the number of CPUs)
+        """
+        self.file_name = file_name
+        self.directory = os.path.abspath(directory or '.')
+        self.extension = extension
+        self.processes = processes or os.cpu_count() or 1
+
+    def run(self, scripts):
+        """Play every script, each from the start of the saved game.
+
+        Arguments:
+            scripts (list): scripts, each a list of lines of player input
+
+        Return:
+            a BatchReport object
+        """
+        start = time.perf_counter()
+        # Hand scripts out in a few chunks per worker, to keep workers busy
+        # without paying for a round trip per script
+        chunksize = max(1, len(scripts) // (self.processes * 4))
+        with ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_start_worker,
+                initargs=(self.file_name, self.directory, self.extension),
+        ) as executor:
+            results = list(
+                executor.map(_run_script, scripts, chunksize=chunksize)
+            )
+        return BatchReport(results, time.perf_counter() - start)
+
+
+def main(argv=None):
+    """Play script files from a save file, and report their results.
+
+    Arguments:
+        argv (list): command line arguments (by default, sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description='Play scripted playthroughs of a saved game.'
+    )
+    parser.add_argument('file_name', help='save file (without extension)')
+    parser.add_argument('scripts', nargs='+', help='script files')
+    parser.add_argument('--directory', help='directory of the save file')
+    parser.add_argument('--extension', default='json')
+    parser.add_argument('--processes', type=int)
+    args = parser.parse_args(argv)
+
+    scripts = []
+    for script_path in args.scripts:
+        with open(script_path) as script_file:
+            scripts.append(script_file.read().splitlines())
+    runner = BatchRunner(
+        args.file_name,
+        directory=args.directory,
+        extension=args.extension,
+        processes=args.processes
+    )
+    report = runner.run(scripts)
+
+    print('{:,} scripts, {:,} commands in {:.3f}s: {:,.1f} scripts/s'.format(
+        report.script_count,
+        report.command_count,
+        report.elapsed,
+        report.throughput
+    ))
+    print('{} won, {} lost, {} unfinished; mean score {:.2f}; {} error(s)'
+          .format(
+              report.outcomes[WON],
+              report.outcomes[LOST],
+              report.outcomes[UNFINISHED],
+              report.mean_score,
+              report.error_count
+          ))
+    for script_path, result in zip(args.scripts, report.results):
+        print('{}: {} with score {} in {:.1f}ms'.format(
+            script_path,
+            result.outcome,
+            result.score,
+            result.elapsed * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+from inspect import Parameter, signature
+
+from adventure.exc import CommandArgumentError
+
+
+class CommandBinding:
+    """Binds the words of player input to the arguments of a command function.
+
+    The signature of the function is inspected once, when the binding is
+    created. Words are then bound to its positional parameters in order, any
+    words left over being joined to the last one, so that a single parameter
+    can receive a name of several words (eg. "skeleton key"). If the function
+    accepts a `game` parameter, the game being run is passed to it by name.
+    """
+
+    __slots__ = (
+        'function', 'parameter_count', 'required_count', 'accepts_varargs',
+        'accepts_game'
+    )
+
+    def __init__(self, function):
+        """Creates a new `CommandBinding` instance.
+
+        Arguments:
+            function (callable): a command function
+        """
+        self.function = function
+        self.parameter_count = 0
+        self.required_count = 0
+        self.accepts_varargs = False
+        self.accepts_game = False
+        for parameter in signature(function).parameters.values():
+            if parameter.name == 'game':
+                self.accepts_game = True
+            elif parameter.kind == Parameter.VAR_POSITIONAL:
+                self.accepts_varargs = True
+            elif parameter.kind in (
+                    Parameter.POSITIONAL_ONLY,
+                    Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                self.parameter_count += 1
+                if parameter.default is Parameter.empty:
+                    self.required_count += 1
+
+    def bind(self, words):
+        """Group words into the positional arguments of the function.
+
+        Arguments:
+            words (list): the words following the command verb
+
+        Return:
+            a list of positional arguments
+
+        Raises:
+            CommandArgumentError: if there are too few words, or any words
+                for a function that accepts none
+        """
+        count = len(words)
+        if count < self.required_count:
+            raise CommandArgumentError(
+                'Expected at least {} argument(s), got {}'.format(
+                    self.required_count,
+                    count
+                )
+            )
+        if count <= self.parameter_count or self.accepts_varargs:
+            return words
+        if not self.parameter_count:
+            raise CommandArgumentError(
+                'Expected no arguments, got {}'.format(count)
+            )
+        last = self.parameter_count - 1
+        return words[:last] + [' '.join(words[last:])]
+
+    def call(self, words, game):
+        """Call the function with the given words and game.
+
+        Arguments:
+            words (list): the words following the command verb
+            game (Game): the game being run
+
+        Return:
+            the return value of the function
+        """
+        args = self.bind(words)
+        if self.accepts_game:
+            return self.function(*args, game=game)
+        return self.function(*args)
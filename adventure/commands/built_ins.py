@@ -1,32 +1,57 @@
 from adventure.commands.registry import command
-from adventure.display import outputter
+from adventure.display import get_outputter
 from adventure.display.helpers import concatenate_items, guess_article
 from adventure.models import Item, Person
+from adventure.navigation import get_navigation
 
 
-@command('look')
-def look(game):
-    """Describe the player's current location."""
-    location = game.player.location
-    outputter.display_location_name(location.name)
-    outputter.display_game_text(location.description)
+def describe_location(location):
+    """Return the game text describing a location, as shown by `look`.
+
+    The text is cached on the location, and only rendered anew once the
+    location, or an item or person it holds, has changed.
 
+    Arguments:
+        location (Location): the location to describe
+
+    Return:
+        a tuple of paragraphs (str) of game text
+    """
+    cached = location.render_cache
+    if cached is not None and cached[0] == location.version:
+        return cached[1]
+
+    paragraphs = [location.description]
     if location.items:
         item_names = [item.full_name for item in location.items]
-        item_text = 'You see {}.'.format(concatenate_items(item_names))
-        outputter.display_game_text(item_text)
+        paragraphs.append(
+            'You see {}.'.format(concatenate_items(item_names))
+        )
     if location.people:
         people_names = [person.name for person in location.people]
-        people_text = '{people} {verb} here.'.format(
+        paragraphs.append('{people} {verb} here.'.format(
             people=concatenate_items(people_names),
             verb='is' if len(location.people) == 1 else 'are'
-        )
-        outputter.display_game_text(people_text)
+        ))
+    paragraphs = tuple(paragraphs)
+    location.render_cache = (location.version, paragraphs)
+    return paragraphs
+
+
+@command('look')
+def look(game):
+    """Describe the player's current location."""
+    outputter = get_outputter(game)
+    location = game.player.location
+    outputter.display_location_name(location.name)
+    for paragraph in describe_location(location):
+        outputter.display_game_text(paragraph)
 
 
 @command('examine')
 def examine(target_name, game):
     """Describe a particular item or person in detail."""
+    outputter = get_outputter(game)
     obj = game.player.find_visible_object(target_name)
     if obj:
         outputter.display_game_text(obj.description)
@@ -37,21 +62,43 @@ def examine(target_name, game):
 @command('move')
 def move(direction, game):
     """Move the player in the specified direction."""
-    destination = None
-    for exit in game.player.location.exits:
-        if direction in (exit.direction.name, exit.direction.abbrev):
-            destination = exit.destination
-
-    if destination:
-        game.player.location = destination
+    outputter = get_outputter(game)
+    exit = game.player.location.find_exit(direction)
+    if exit:
+        game.player.location = exit.destination
         look(game)
     else:
         outputter.display_game_text("You can't go that way.")
 
 
+@command('go to')
+@command('goto')
+def goto(location_name, game):
+    """Move the player along the shortest route to a named location."""
+    outputter = get_outputter(game)
+    navigation = get_navigation(game)
+    route = navigation.find_route_to_name(game.player.location, location_name)
+    if route is None and not navigation.find_locations(location_name):
+        outputter.display_game_text(
+            "You don't know of anywhere called {}.".format(location_name)
+        )
+    elif route is None:
+        outputter.display_game_text("You can't find a way there.")
+    elif not route:
+        outputter.display_game_text("You're already there.")
+    else:
+        for exit in route:
+            game.player.location = exit.destination
+        outputter.display_game_text('You go {}.'.format(
+            concatenate_items([exit.direction.name for exit in route])
+        ))
+        look(game)
+
+
 @command('talk')
 def talk(person_name, game):
     """Start a conversation with another person."""
+    outputter = get_outputter(game)
     person = game.player.find_visible_object(person_name)
     if person:
         outputter.display_person_reaction(person.name, person.talk())
@@ -64,6 +111,7 @@ def talk(person_name, game):
 @command('inventory')
 def inventory(game):
     """List the items in the player's inventory."""
+    outputter = get_outputter(game)
     inventory = game.player.inventory
     if not len(inventory):
         outputter.display_game_text("You aren't carrying anything.")
@@ -76,6 +124,7 @@ def inventory(game):
 @command('get')
 def get(item_name, game):
     """Move an item from the player's current location to their inventory."""
+    outputter = get_outputter(game)
     item = game.player.find_visible_object(item_name)
     if item in game.player.location.items:
         game.player.location.items.remove(item)
@@ -102,6 +151,7 @@ def get(item_name, game):
 @command('leave')
 def drop(item_name, game):
     """Move an item from the player's inventory to the current location."""
+    outputter = get_outputter(game)
     item = game.player.find_visible_object(item_name)
     if item in game.player.inventory:
         game.player.location.items.append(item)
@@ -124,6 +174,7 @@ def drop(item_name, game):
 @command('wait')
 def wait(game):
     """Do nothing."""
+    outputter = get_outputter(game)
     outputter.display_game_text('You doze off for a while. Nothing happens.')
 
 
@@ -134,6 +185,7 @@ def wait(game):
 @command('attack')
 def attack(target_name, game):
     """Attack another person or object."""
+    outputter = get_outputter(game)
     target = game.player.find_visible_object(target_name)
     if isinstance(target, Person):
         outputter.display_game_text(
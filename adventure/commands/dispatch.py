@@ -0,0 +1,215 @@
+from collections import namedtuple
+
+from adventure.commands.registry import registry
+from adventure.display import get_outputter
+from adventure.exc import UnknownCommandError
+
+
+# Words that carry no meaning at the start of a command argument (eg. "get
+# the lamp"), though they may within one (eg. "examine jack of the woods")
+ARTICLES = frozenset(('a', 'an', 'the'))
+
+# Trie nodes map each word to the next node; this key marks complete verbs
+_VERB = None
+
+ParsedCommand = namedtuple('ParsedCommand', ('verb', 'binding', 'words'))
+
+
+def tokenize(text):
+    """Split player input into words.
+
+    The case of each word is preserved, so that names can be matched
+    exactly; verbs are matched regardless of case.
+
+    Arguments:
+        text (str): a line of player input
+
+    Return:
+        a list of words
+    """
+    return text.split()
+
+
+def strip_article(words):
+    """Drop the article a list of words starts with, if any.
+
+    A lone article is kept, as it can only be meant as a word of its own.
+
+    Arguments:
+        words (list): words of player input
+
+    Return:
+        a list of words
+    """
+    if len(words) > 1 and words[0].lower() in ARTICLES:
+        return words[1:]
+    return words
+
+
+def strip_articles(words, binding):
+    """Drop the article each argument of a command starts with, if any.
+
+    Arguments are grouped as `CommandBinding.bind` groups them: a word for
+    each positional parameter but the last, which takes the remaining words.
+
+    Arguments:
+        words (list): the words following the command verb
+        binding (CommandBinding): the binding of the command function
+
+    Return:
+        a list of words
+    """
+    stripped = []
+    position = 0
+    while position < len(words):
+        rest = strip_article(words[position:])
+        position = len(words) - len(rest)
+        if (binding.accepts_varargs
+                or len(stripped) < binding.parameter_count - 1):
+            stripped.append(words[position])
+            position += 1
+        else:
+            stripped.extend(rest)
+            break
+    return stripped
+
+
+class VerbTrie:
+    """Matches the leading words of player input against command verbs.
+
+    Verbs may span several words (eg. "pick up"), in which case the longest
+    verb matching the input is chosen.
+    """
+
+    def __init__(self):
+        """Creates a new, empty `VerbTrie` instance."""
+        self.root = {}
+
+    @classmethod
+    def compile(cls, command_registry):
+        """Build a trie of every verb and alias in a registry.
+
+        Arguments:
+            command_registry (CommandRegistry): the registry to compile
+
+        Return:
+            a VerbTrie object, whose verbs are paired with their bindings
+        """
+        trie = cls()
+        for verb in command_registry:
+            trie.add(verb, command_registry.get_binding(verb))
+        return trie
+
+    def add(self, verb, value):
+        """Add a verb to the trie.
+
+        Arguments:
+            verb (str): one or more space-separated words
+            value: the value to pair with the verb
+        """
+        node = self.root
+        for word in verb.lower().split():
+            node = node.setdefault(word, {})
+        node[_VERB] = (verb, value)
+
+    def match(self, words):
+        """Find the longest verb at the start of a list of words.
+
+        Arguments:
+            words (list): words of player input
+
+        Return:
+            a 3-tuple of (verb, value, number of words matched), or None if
+            no verb matches
+        """
+        node = self.root
+        longest = None
+        for position, word in enumerate(words):
+            node = node.get(word.lower())
+            if node is None:
+                break
+            if _VERB in node:
+                longest = node[_VERB], position + 1
+        if longest is None:
+            return None
+        (verb, value), count = longest
+        return verb, value, count
+
+
+class Dispatcher:
+    """Parses player input and calls the command function it names."""
+
+    def __init__(self, command_registry=registry, outputter=None):
+        """Creates a new `Dispatcher` instance.
+
+        Arguments:
+            command_registry (CommandRegistry): the registry of commands to
+                dispatch to (by default, the package-wide registry)
+            outputter (BaseOutputter): the outputter to which commands
+                display text, whose output is framed per command (by default,
+                the outputter of the game to which each command is
+                dispatched)
+        """
+        self.command_registry = command_registry
+        self.outputter = outputter
+        self.trie = None
+        self.version = None
+
+    def parse(self, text):
+        """Interpret a line of player input.
+
+        Arguments:
+            text (str): a line of player input
+
+        Return:
+            a ParsedCommand object
+
+        Raises:
+            UnknownCommandError: if the input does not start with a verb
+        """
+        if self.version != self.command_registry.version:
+            self.trie = VerbTrie.compile(self.command_registry)
+            self.version = self.command_registry.version
+        words = tokenize(text)
+        match = self.trie.match(words)
+        if match is None:
+            raise UnknownCommandError(
+                'Unknown command: {!r}'.format(text.strip())
+            )
+        verb, binding, count = match
+        return ParsedCommand(
+            verb,
+            binding,
+            strip_articles(words[count:], binding)
+        )
+
+    def dispatch(self, text, game, journal=None):
+        """Interpret a line of player input, and run the command it names.
+
+        All text displayed by the command is grouped into a single frame of
+        output, and any objects it instantiates join the world of the game.
+
+        Arguments:
+            text (str): a line of player input
+            game (Game): the game being run
+            journal (CommandJournal | None): an optional journal in which to
+                record the command, before it is run
+
+        Return:
+            the return value of the command function
+
+        Raises:
+            UnknownCommandError: if the input does not start with a verb
+            CommandArgumentError: if the input does not fit the arguments of
+                the command function
+        """
+        parsed = self.parse(text)
+        if journal is not None:
+            journal.record(
+                parsed.verb,
+                parsed.words,
+                parsed.binding.function
+            )
+        outputter = self.outputter or get_outputter(game)
+        with game.arena.activate(), outputter.frame():
+            return parsed.binding.call(parsed.words, game)
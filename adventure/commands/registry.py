@@ -1,3 +1,6 @@
+from functools import wraps
+
+
 class CommandRegistry(dict):
     """Registry to pair player commands with functions to handle those commands
 
@@ -5,6 +8,27 @@ class CommandRegistry(dict):
     contain the instance of the Game being run. All other arguments passed in
     will be user input.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Argument bindings of command functions, so that their signatures
+        # are only inspected once
+        self.bindings = {}
+        # Incremented on every change, to let dispatchers know when to
+        # recompile their verb tries
+        self.version = 0
+
+    def __setitem__(self, command, function):
+        super().__setitem__(command, function)
+        self.version += 1
+
+    def __delitem__(self, command):
+        super().__delitem__(command)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
     @property
     def commands(self):
         """Return a list of registered commands"""
@@ -14,11 +38,31 @@ class CommandRegistry(dict):
         """Add command verb / function pair to registry.
 
         Args:
-            command (str): a single-word command (a verb, eg. move, get, talk)
+            command (str): a command verb (eg. move, get, talk), or several
+                space-separated words (eg. pick up)
             function (callable): a standalone function
         """
         self[command] = function
 
+    def get_binding(self, command):
+        """Return the argument binding of the function handling a command.
+
+        Arguments:
+            command (str): a registered command
+
+        Return:
+            a CommandBinding object
+        """
+        function = self[command]
+        binding = self.bindings.get(function)
+        if binding is None:
+            # Signatures are inspected on first use rather than when commands
+            # are registered, so that importing commands does not import
+            # `inspect`
+            from adventure.commands.binding import CommandBinding
+            binding = self.bindings[function] = CommandBinding(function)
+        return binding
+
 
 # Instantiate the CommandRegistry "singleton" to use throughout the package
 registry = CommandRegistry()
@@ -33,6 +77,9 @@ def command(verb):
     def _wrapped_function(command_function):
         registry.add_command(verb, command_function)
 
+        # Stacked decorators register this wrapper; wrapping exposes the
+        # signature of the original function to `CommandBinding`
+        @wraps(command_function)
         def _run_command(*args, **kwargs):
             return command_function(*args, **kwargs)
 
@@ -0,0 +1,251 @@
+"""Recording the commands of a session, and replaying them headlessly.
+
+A `CommandJournal` records every command dispatched against a game (see
+`Dispatcher.dispatch`): its verb, the words passed to it, and the function
+that handled it. Since input has already been parsed, replaying a journal
+calls each command function directly, skipping parsing altogether.
+
+Run with `python -m adventure.commands.replay`, passing a journal and the
+name of the save file from which the session started, to replay the journal
+and report its throughput and timings.
+"""
+import argparse
+import json
+import time
+from collections import namedtuple
+
+from adventure.commands import built_ins  # noqa: F401 (registers commands)
+from adventure.commands.registry import registry
+from adventure.display.null import NullOutputter
+from adventure.exc import CommandArgumentError, ReplayError
+from adventure.loaders import GameLoader
+
+
+JournalEntry = namedtuple('JournalEntry', ('verb', 'words', 'handler'))
+
+
+def get_handler_ref(function):
+    """Return the dot-delimited path to a command function.
+
+    Arguments:
+        function (callable): a command function
+
+    Return:
+        a str
+    """
+    return '{module}.{name}'.format(
+        module=function.__module__,
+        name=function.__qualname__
+    )
+
+
+class CommandJournal(list):
+    """A list of the commands dispatched against a game, oldest first."""
+
+    def record(self, verb, words, function):
+        """Add a dispatched command to the journal.
+
+        Arguments:
+            verb (str): the verb of the command, as registered
+            words (list): the words passed to the command function
+            function (callable): the command function
+        """
+        self.append(
+            JournalEntry(verb, list(words), get_handler_ref(function))
+        )
+
+    def dump(self, journal_file):
+        """Write the journal to a file, one JSON line per command.
+
+        Arguments:
+            journal_file (file): a file opened for writing text
+        """
+        for entry in self:
+            journal_file.write(json.dumps(entry._asdict()) + '\n')
+
+    @classmethod
+    def load(cls, journal_file):
+        """Read a journal written by `dump`.
+
+        Arguments:
+            journal_file (file): a file opened for reading text
+
+        Return:
+            a CommandJournal object
+        """
+        return cls(
+            JournalEntry(**json.loads(line))
+            for line in journal_file if line.strip()
+        )
+
+
+class ReplayReport:
+    """The timings of a replayed journal."""
+
+    def __init__(self, verbs, timings, elapsed, error_count):
+        """Creates a new `ReplayReport` instance.
+
+        Arguments:
+            verbs (list): the verb of each command replayed
+            timings (list): the time taken by each command, in seconds
+            elapsed (float): the time taken by the whole replay, in seconds
+            error_count (int): the number of commands that raised
+                CommandArgumentError
+        """
+        self.verbs = verbs
+        self.timings = timings
+        self.elapsed = elapsed
+        self.error_count = error_count
+
+    @property
+    def command_count(self):
+        return len(self.timings)
+
+    @property
+    def throughput(self):
+        """The number of commands replayed per second."""
+        return self.command_count / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, fraction):
+        """Return the time under which a fraction of the commands ran.
+
+        Arguments:
+            fraction (float): a fraction between 0 and 1 (eg. 0.99)
+
+        Return:
+            a duration in seconds
+        """
+        if not self.timings:
+            return 0.0
+        timings = sorted(self.timings)
+        position = max(0, int(len(timings) * fraction + 0.5) - 1)
+        return timings[min(position, len(timings) - 1)]
+
+    def by_verb(self):
+        """Return the number of commands and total time spent per verb.
+
+        Return:
+            a dict of (count, seconds) tuples, keyed by verb
+        """
+        totals = {}
+        for verb, timing in zip(self.verbs, self.timings):
+            count, seconds = totals.get(verb, (0, 0.0))
+            totals[verb] = (count + 1, seconds + timing)
+        return totals
+
+
+class ReplayEngine:
+    """Replays command journals against games, with all output discarded."""
+
+    def __init__(self, command_registry=registry):
+        """Creates a new `ReplayEngine` instance.
+
+        Arguments:
+            command_registry (CommandRegistry): the registry whose commands
+                handle the replayed commands (by default, the package-wide
+                registry)
+        """
+        self.command_registry = command_registry
+
+    def replay(self, journal, game):
+        """Run every command of a journal against a game.
+
+        The game should be in the state the recorded session started from
+        (eg. loaded from the same save file, or a fork of the same game).
+
+        Arguments:
+            journal (CommandJournal): the commands to replay
+            game (Game): the game against which to replay them
+
+        Return:
+            a ReplayReport object
+
+        Raises:
+            ReplayError: if a recorded verb is no longer handled by the same
+                function
+        """
+        bindings = self._bind(journal)
+        timings = []
+        error_count = 0
+        clock = time.perf_counter
+        previous_outputter = game.outputter
+        game.outputter = NullOutputter()
+        try:
+            with game.arena.activate():
+                start = clock()
+                for binding, entry in zip(bindings, journal):
+                    command_start = clock()
+                    try:
+                        binding.call(entry.words, game)
+                    except CommandArgumentError:
+                        error_count += 1
+                    timings.append(clock() - command_start)
+                elapsed = clock() - start
+        finally:
+            game.outputter = previous_outputter
+        return ReplayReport(
+            [entry.verb for entry in journal],
+            timings,
+            elapsed,
+            error_count
+        )
+
+    def _bind(self, journal):
+        """Return the binding of each command of a journal, in order."""
+        bindings = {}
+        for entry in journal:
+            key = (entry.verb, entry.handler)
+            if key in bindings:
+                continue
+            function = self.command_registry.get(entry.verb)
+            if function is None or get_handler_ref(function) != entry.handler:
+                raise ReplayError(
+                    'Verb {!r} is no longer handled by {}'.format(
+                        entry.verb,
+                        entry.handler
+                    )
+                )
+            bindings[key] = self.command_registry.get_binding(entry.verb)
+        return [bindings[(entry.verb, entry.handler)] for entry in journal]
+
+
+def main(argv=None):
+    """Replay a journal over the game of a save file, and report timings.
+
+    Arguments:
+        argv (list): command line arguments (by default, sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description='Replay a command journal, and report its timings.'
+    )
+    parser.add_argument('journal', help='path to a command journal')
+    parser.add_argument('file_name', help='save file (without extension)')
+    parser.add_argument('--directory', help='directory of the save file')
+    parser.add_argument('--extension', default='json')
+    args = parser.parse_args(argv)
+
+    with open(args.journal) as journal_file:
+        journal = CommandJournal.load(journal_file)
+    loader = GameLoader(directory=args.directory, extension=args.extension)
+    report = ReplayEngine().replay(journal, loader.load(args.file_name))
+
+    print('{:,} commands in {:.3f}s: {:,.0f} commands/s, {} error(s)'.format(
+        report.command_count,
+        report.elapsed,
+        report.throughput,
+        report.error_count
+    ))
+    print('p50 {:.1f}us  p99 {:.1f}us  max {:.1f}us'.format(
+        report.percentile(0.5) * 1e6,
+        report.percentile(0.99) * 1e6,
+        report.percentile(1.0) * 1e6
+    ))
+    print('{:>12} {:>10} {:>12}'.format('verb', 'count', 'mean us'))
+    for verb, (count, seconds) in sorted(report.by_verb().items()):
+        print('{:>12} {:>10,} {:>12.1f}'.format(
+            verb, count, seconds / count * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,29 @@
+from contextvars import ContextVar
+
 from adventure.display.basic_text import TextOutputter
 
 
 outputter = TextOutputter()
+
+# The outputter of the session running in the current context (a thread or an
+# asyncio task), falling back to the package-wide outputter
+active_outputter = ContextVar('active_outputter', default=outputter)
+
+
+def get_outputter(game=None):
+    """Return the outputter to which text about a game should be displayed.
+
+    The outputter of the game itself takes precedence over the outputter
+    active in the current context. Neither requires any locking, so sessions
+    in separate threads or asyncio tasks can each display their own text.
+
+    Arguments:
+        game (Game | None): the game being played, if any
+
+    Return:
+        a BaseOutputter object
+    """
+    game_outputter = getattr(game, 'outputter', None)
+    if game_outputter is not None:
+        return game_outputter
+    return active_outputter.get()
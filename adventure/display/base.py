@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 
 class BaseOutputter(ABC):
@@ -18,3 +19,20 @@ class BaseOutputter(ABC):
     def display_person_reaction(self, person_name, text):
         """Display speech from the named person"""
         raise NotImplementedError()
+
+    def begin_frame(self):
+        """Mark the start of the output of a single command"""
+        pass
+
+    def end_frame(self):
+        """Mark the end of the output of a single command"""
+        pass
+
+    @contextmanager
+    def frame(self):
+        """Group all output displayed within a `with` block into a frame"""
+        self.begin_frame()
+        try:
+            yield self
+        finally:
+            self.end_frame()
@@ -0,0 +1,84 @@
+import sys
+
+from adventure.display.base import BaseOutputter
+
+
+class BufferedTextOutputter(BaseOutputter):
+    """A text renderer that collects lines and writes them out in batches
+
+    Lines displayed between `begin_frame` and `end_frame` (typically, all the
+    output of one command) form a frame. Buffered lines are written to the
+    stream in a single call once a number of frames have ended, or once the
+    buffer grows past a given size, whichever comes first. Lines displayed
+    outside of any frame count as a frame of their own.
+    """
+
+    def __init__(self, stream=None, frames_per_flush=1,
+                 max_buffer_size=65536):
+        """Creates a new `BufferedTextOutputter` instance.
+
+        Arguments:
+            stream (file): an optional writable text file object (by default,
+                stdout at the time of writing)
+            frames_per_flush (int | None): the number of frames to collect
+                before writing them, or None to only write when the buffer is
+                full or `flush` is called
+            max_buffer_size (int | None): the number of characters past which
+                the buffer is written even within a frame, or None for no
+                limit
+        """
+        self.stream = stream
+        self.frames_per_flush = frames_per_flush
+        self.max_buffer_size = max_buffer_size
+        self.buffer = []
+        self.buffer_size = 0
+        self.frame_depth = 0
+        self.pending_frames = 0
+
+    def display_location_name(self, location_name):
+        self._write(location_name)
+
+    def display_game_text(self, text):
+        self._write(text)
+
+    def display_person_reaction(self, person_name, text):
+        self._write(text)
+
+    def begin_frame(self):
+        self.frame_depth += 1
+
+    def end_frame(self):
+        self.frame_depth -= 1
+        if not self.frame_depth:
+            self._end_frame()
+
+    def flush(self):
+        """Write all buffered lines to the stream in a single call"""
+        self.pending_frames = 0
+        if not self.buffer:
+            return
+        stream = self.stream or sys.stdout
+        stream.write(''.join(self.buffer))
+        stream.flush()
+        self.buffer = []
+        self.buffer_size = 0
+
+    def _write(self, text):
+        line = '{}\n'.format(text)
+        self.buffer.append(line)
+        self.buffer_size += len(line)
+        if (
+                self.max_buffer_size is not None
+                and self.buffer_size >= self.max_buffer_size
+        ):
+            self.flush()
+        if not self.frame_depth:
+            self._end_frame()
+
+    def _end_frame(self):
+        self.pending_frames += 1
+        if (
+                self.frames_per_flush is not None
+                and self.pending_frames >= self.frames_per_flush
+        ):
+            self.flush()
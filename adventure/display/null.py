@@ -0,0 +1,14 @@
+from adventure.display.base import BaseOutputter
+
+
+class NullOutputter(BaseOutputter):
+    """An outputter that discards all text, for running games headlessly"""
+
+    def display_location_name(self, location_name):
+        pass
+
+    def display_game_text(self, text):
+        pass
+
+    def display_person_reaction(self, person_name, text):
+        pass
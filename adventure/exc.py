@@ -1,3 +1,28 @@
 class AdventureException(Exception):
     """Container for all exceptions raised by this package"""
     pass
+
+
+class UnsupportedFormatError(AdventureException):
+    """Raised when no save format is registered for a file extension"""
+    pass
+
+
+class UnknownCommandError(AdventureException):
+    """Raised when player input does not start with a registered verb"""
+    pass
+
+
+class CommandArgumentError(AdventureException):
+    """Raised when player input does not fit the arguments of a command"""
+    pass
+
+
+class ReplayError(AdventureException):
+    """Raised when a recorded command cannot be replayed as it was run"""
+    pass
+
+
+class FrozenWorldError(AdventureException):
+    """Raised when modifying a world from which live games were forked"""
+    pass
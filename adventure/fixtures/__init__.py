@@ -1,8 +1,24 @@
+"""Canonical directions and genders, shared by every game.
+
+The fixture files are only read when `genders` or `directions` is first
+accessed (or a game is loaded), so that importing this package is cheap.
+"""
 import json
 import os
 
 from adventure.models import Direction
 from adventure.models import Gender
+from adventure.models.arena import default_arena
+from adventure.models.flyweights import flyweights
+
+
+# Names of the fixtures, and the file and class from which each is loaded
+FIXTURES = {
+    'genders': ('genders.json', Gender),
+    'directions': ('directions.json', Direction),
+}
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
 
 
 def load_fixture(fixture_file, model_cls):
@@ -17,6 +33,31 @@ def load_fixture(fixture_file, model_cls):
     return [model_cls(**obj) for obj in json_objs]
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-genders = load_fixture(os.path.join(dir_path, 'genders.json'), Gender)
-directions = load_fixture(os.path.join(dir_path, 'directions.json'), Direction)
+def load_fixtures():
+    """Load every fixture not yet loaded, and register it as a flyweight.
+
+    Fixtures belong to no world in particular, and so join the default arena
+    even when first needed while a game is loaded.
+    """
+    for name, (file_name, model_cls) in FIXTURES.items():
+        if name in globals():
+            continue
+        fixture_file = os.path.join(dir_path, file_name)
+        with default_arena.activate():
+            fixtures = load_fixture(fixture_file, model_cls)
+        for fixture in fixtures:
+            flyweights.register(fixture)
+        globals()[name] = fixtures
+
+
+def __getattr__(name):
+    if name not in FIXTURES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+    load_fixtures()
+    return globals()[name]
+
+
+# Loaded games share these, rather than building copies of their own
+flyweights.add_source(load_fixtures)
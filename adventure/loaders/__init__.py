@@ -1,2 +1,30 @@
-from adventure.loaders.loader import GameLoader
-from adventure.loaders.saver import GameSaver
+"""Reading and writing saved games.
+
+`GameLoader` and `GameSaver` are imported from their submodules when first
+accessed, so that using one does not import the other.
+"""
+from importlib import import_module
+
+
+# Submodule defining each class, relative to this package
+SUBMODULES = {
+    'GameLoader': 'loader',
+    'GameSaver': 'saver',
+}
+
+# Star imports list the lazily imported names, which are then imported
+__all__ = sorted(SUBMODULES)
+
+
+def __getattr__(name):
+    if name not in SUBMODULES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+    value = getattr(import_module('.' + SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
@@ -0,0 +1,312 @@
+"""A compact binary encoding for serialized game objects.
+
+A file is a sequence of records and bare tags. Each record holds a single
+value, prefixed with its length so that a reader can fetch it whole before
+decoding it. Within a record, values are written as a one-byte tag followed
+by a payload. Integers are zigzag-encoded varints, and every string is
+written in full only once: its first occurrence appends it to a string table
+shared by the whole file, and any later occurrence refers to it by its varint
+position in that table. Since dictionary keys and the `model_ref` of each
+`SerializedReference` are strings, field names and model types are interned
+this way too, while references are further reduced to a dedicated tag, an
+interned model type and a varint identifier.
+
+The string table is built implicitly as records are written and read, so a
+file can be encoded and decoded in a single streaming pass.
+"""
+import struct
+
+from adventure.models.base import SerializedReference
+
+
+MAGIC = b'ADVB\x02'
+
+# Value tags
+NULL = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+FLOAT = 4
+STRING = 5
+NEW_STRING = 6
+LIST = 7
+DICT = 8
+REFERENCE = 9
+
+# Structural tags, found between records
+ITERATION = 10
+END = 11
+RECORD = 12
+
+FLOAT_STRUCT = struct.Struct('<d')
+
+
+class BinaryEncoder:
+    """Encodes JSON-like values as records, writing them to a file object."""
+
+    def __init__(self, stream_file, buffer_size=65536):
+        """Creates a new `BinaryEncoder` instance.
+
+        Arguments:
+            stream_file (file): a writable binary file object
+            buffer_size (int): the number of bytes to accumulate before
+                writing them to stream_file
+        """
+        self.stream_file = stream_file
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        # Maps each string already written to its encoded STRING reference
+        self.strings = {}
+
+    def write_magic(self):
+        """Write the header identifying the encoding and its version."""
+        self.buffer += MAGIC
+
+    def write_tag(self, tag):
+        """Write a bare structural tag (ITERATION or END)."""
+        self.buffer.append(tag)
+
+    def write_value(self, value):
+        """Encode a JSON-like value as a single record.
+
+        Arguments:
+            value: None, a bool, int, float, str, list, tuple or dict
+        """
+        record = bytearray()
+        self._encode(value, record)
+        self.buffer.append(RECORD)
+        _append_varint(self.buffer, len(record))
+        self.buffer += record
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered bytes to the underlying file object."""
+        self.stream_file.write(self.buffer)
+        self.buffer = bytearray()
+
+    def _encode(self, value, out):
+        if value.__class__ is str:
+            self._encode_string(value, out)
+        elif value is None:
+            out.append(NULL)
+        elif value is True:
+            out.append(TRUE)
+        elif value is False:
+            out.append(FALSE)
+        elif isinstance(value, int):
+            out.append(INT)
+            _append_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, dict):
+            if _is_reference(value):
+                out.append(REFERENCE)
+                self._encode_string(value['model_ref'], out)
+                _append_varint(out, value['identifier'])
+            else:
+                out.append(DICT)
+                _append_varint(out, len(value))
+                for key, item in value.items():
+                    self._encode_string(key, out)
+                    self._encode(item, out)
+        elif isinstance(value, (list, tuple)):
+            out.append(LIST)
+            _append_varint(out, len(value))
+            for item in value:
+                self._encode(item, out)
+        elif isinstance(value, str):
+            self._encode_string(str(value), out)
+        elif isinstance(value, float):
+            out.append(FLOAT)
+            out += FLOAT_STRUCT.pack(value)
+        else:
+            raise TypeError(
+                'Object of type {} is not serializable'.format(
+                    type(value).__name__
+                )
+            )
+
+    def _encode_string(self, string, out):
+        encoded_reference = self.strings.get(string)
+        if encoded_reference is not None:
+            out += encoded_reference
+            return
+
+        encoded_reference = bytearray([STRING])
+        _append_varint(encoded_reference, len(self.strings))
+        self.strings[string] = bytes(encoded_reference)
+        encoded = string.encode('utf-8')
+        out.append(NEW_STRING)
+        _append_varint(out, len(encoded))
+        out += encoded
+
+
+class BinaryDecoder:
+    """Decodes records written by a `BinaryEncoder` from a file object."""
+
+    def __init__(self, stream_file, chunk_size=65536):
+        """Creates a new `BinaryDecoder` instance.
+
+        Arguments:
+            stream_file (file): a readable binary file object
+            chunk_size (int): the number of bytes to read at a time, or None
+                to read the whole file at once
+        """
+        self.stream_file = stream_file
+        self.chunk_size = chunk_size
+        self.buffer = b''
+        self.position = 0
+        self.strings = []
+
+    def read_magic(self):
+        """Consume the header, checking the encoding and its version.
+
+        Raises:
+            ValueError: if the header does not match
+        """
+        self._fill(len(MAGIC))
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError('Not a binary save file, or unsupported version')
+        self.position = len(MAGIC)
+
+    def peek_tag(self):
+        """Return the next structural tag without consuming it.
+
+        Return:
+            RECORD, ITERATION or END
+        """
+        self._fill(1)
+        return self.buffer[self.position]
+
+    def read_tag(self):
+        """Consume and return the next structural tag."""
+        tag = self.peek_tag()
+        self.position += 1
+        return tag
+
+    def read_value(self):
+        """Decode and return the value held by the next record.
+
+        Raises:
+            ValueError: if the next tag does not start a record, or the record
+                is malformed
+        """
+        if self.read_tag() != RECORD:
+            raise ValueError('Expected a record in binary save file')
+        try:
+            self._fill(10)
+            length, self.position = _read_varint(self.buffer, self.position)
+            self._fill(length)
+            start = self.position
+            value, end = self._decode(self.buffer, start)
+        except IndexError:
+            raise ValueError('Truncated record in binary save file')
+        if end != start + length:
+            raise ValueError('Malformed record in binary save file')
+        self.position = end
+        return value
+
+    def _decode(self, data, position):
+        tag = data[position]
+        position += 1
+        if tag == STRING:
+            # Inlined single-byte varint, by far the most common case
+            index = data[position]
+            if index < 0x80:
+                return self.strings[index], position + 1
+            index, position = _read_varint(data, position)
+            return self.strings[index], position
+        elif tag == DICT:
+            count, position = _read_varint(data, position)
+            strings = self.strings
+            value = {}
+            for _ in range(count):
+                if data[position] == STRING and data[position + 1] < 0x80:
+                    key = strings[data[position + 1]]
+                    position += 2
+                else:
+                    key, position = self._decode(data, position)
+                value[key], position = self._decode(data, position)
+            return value, position
+        elif tag == INT:
+            number, position = _read_varint(data, position)
+            if number & 1:
+                return -(number >> 1) - 1, position
+            return number >> 1, position
+        elif tag == REFERENCE:
+            model_ref, position = self._decode(data, position)
+            identifier, position = _read_varint(data, position)
+            return SerializedReference(model_ref, identifier), position
+        elif tag == NEW_STRING:
+            length, position = _read_varint(data, position)
+            end = position + length
+            if end > len(data):
+                raise IndexError()
+            string = data[position:end].decode('utf-8')
+            self.strings.append(string)
+            return string, end
+        elif tag == LIST:
+            count, position = _read_varint(data, position)
+            value = []
+            for _ in range(count):
+                item, position = self._decode(data, position)
+                value.append(item)
+            return value, position
+        elif tag == NULL:
+            return None, position
+        elif tag == TRUE:
+            return True, position
+        elif tag == FALSE:
+            return False, position
+        elif tag == FLOAT:
+            end = position + 8
+            return FLOAT_STRUCT.unpack(data[position:end])[0], end
+        raise ValueError('Unknown tag {} in binary save file'.format(tag))
+
+    def _fill(self, count):
+        """Ensure at least count unread bytes are buffered, where possible.
+
+        Raises:
+            ValueError: if the file ends before a single byte can be read
+        """
+        available = len(self.buffer) - self.position
+        if available < count:
+            size = self.chunk_size
+            chunk = self.stream_file.read(
+                -1 if size is None else max(size, count - available)
+            )
+            self.buffer = self.buffer[self.position:] + chunk
+            self.position = 0
+        if self.position >= len(self.buffer):
+            raise ValueError('Unexpected end of binary save file')
+
+
+def _append_varint(out, number):
+    while number > 0x7f:
+        out.append((number & 0x7f) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _read_varint(data, position):
+    byte = data[position]
+    if byte < 0x80:
+        return byte, position + 1
+
+    number = byte & 0x7f
+    shift = 7
+    while True:
+        position += 1
+        byte = data[position]
+        number |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return number, position + 1
+        shift += 7
+
+
+def _is_reference(value):
+    return (
+        len(value) == 2
+        and 'model_ref' in value
+        and type(value.get('identifier')) is int
+        and value['identifier'] >= 0
+    )
@@ -0,0 +1,593 @@
+import io
+import json
+import mmap
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders.binary import (
+    BinaryDecoder, BinaryEncoder, END, ITERATION
+)
+from adventure.loaders.sqlite import (
+    SINGLE_SECTIONS, SECTIONS, SaveDatabase, TableIndex,
+    get_transaction_paths
+)
+from adventure.loaders.streaming import iterate_sections
+
+
+class SaveFormat(ABC):
+    """An abstract base class to establish how save files are encoded.
+
+    Serialized game data is exchanged with a format as a mapping of section
+    names (game, player, items, etc.) to either a single serialized object or
+    a list of serialized objects.
+    """
+
+    # File extension (without the leading dot) identifying this format
+    extension = None
+
+    # Whether files in this format must be opened in binary mode
+    is_binary = False
+
+    # Whether files in this format hold an index of the position of each
+    # serialized object, allowing them to be read individually
+    supports_random_access = False
+
+    # Whether saved files in this format can be updated in place with the
+    # objects changed since, rather than through a journal
+    supports_updates = False
+
+    def open(self, file_path, mode):
+        """Open a file suitably for reading or writing this format.
+
+        Arguments:
+            file_path (str): path to the file
+            mode (str): either 'r' or 'w', or 'a' to update the file (for
+                formats supporting updates)
+
+        Return:
+            a file object
+        """
+        return open(file_path, mode + ('b' if self.is_binary else ''))
+
+    def open_indexed(self, file_path):
+        """Open a file to read individual objects out of it.
+
+        By default, the file is mapped into memory.
+
+        Arguments:
+            file_path (str): path to the file
+
+        Return:
+            a readable, seekable file object, to pass to `read_index` and
+            `read_object`, and to close once done with
+        """
+        with open(file_path, 'rb') as load_file:
+            return mmap.mmap(load_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def replace(self, saving_path, file_path):
+        """Replace a saved file with a newly written one.
+
+        Arguments:
+            saving_path (str): path to the new file
+            file_path (str): path to the file to replace
+        """
+        os.replace(saving_path, file_path)
+
+    @abstractmethod
+    def dump(self, serialized_objects, save_file):
+        """Write all serialized game data to a file.
+
+        Arguments:
+            serialized_objects (dict): serialized objects, keyed by section
+            save_file (file): a writable file object
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def dump_sections(self, sections, save_file):
+        """Incrementally write serialized game data to a file.
+
+        Arguments:
+            sections (iterable): (section name, content) pairs, where content
+                is either a single serialized object (a dict) or an iterable
+                of serialized objects, consumed one at a time
+            save_file (file): a writable file object
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def load(self, load_file):
+        """Read all serialized game data from a file.
+
+        Arguments:
+            load_file (file): a readable file object
+
+        Return:
+            a dict of serialized objects, keyed by section
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iterate_sections(self, load_file):
+        """Incrementally read serialized game data from a file.
+
+        Arguments:
+            load_file (file): a readable file object
+
+        Return:
+            a generator of (section name, serialized object) pairs, where
+            list sections are flattened into one pair per element
+        """
+        raise NotImplementedError()
+
+    def update(self, serialized_objects, save_file):
+        """Write changed objects over a saved file, in place.
+
+        Objects replace the saved objects of the same section and
+        identifier, or are added to their section.
+
+        Arguments:
+            serialized_objects (dict): serialized objects, keyed by section,
+                as in a journal entry
+            save_file (file): a file object, opened in 'a' mode
+        """
+        raise NotImplementedError()
+
+    def read_index(self, load_file):
+        """Read the index of the positions of objects in a file.
+
+        Arguments:
+            load_file (file): a readable, seekable file object
+
+        Return:
+            a dict keyed by section, holding the position of single objects,
+            or a mapping of positions keyed by identifier (as a str), in
+            order of identifier, for list sections; positions are opaque, to
+            be passed to `read_object`, and mappings may read from load_file
+            as they are used
+        """
+        raise NotImplementedError()
+
+    def read_object(self, load_file, position):
+        """Read a single serialized object from a file.
+
+        Arguments:
+            load_file (file): a readable, seekable file object
+            position: the position of the object, as found in the index
+
+        Return:
+            a serialized object
+        """
+        raise NotImplementedError()
+
+
+class JSONFormat(SaveFormat):
+    """Human-readable save files containing a single JSON document."""
+
+    extension = 'json'
+
+    def dump(self, serialized_objects, save_file):
+        save_file.write(json.dumps(serialized_objects))
+
+    def dump_sections(self, sections, save_file):
+        save_file.write('{')
+        for position, (section, content) in enumerate(sections):
+            if position:
+                save_file.write(', ')
+            save_file.write('{}: '.format(json.dumps(section)))
+            if isinstance(content, dict):
+                save_file.write(json.dumps(content))
+                continue
+
+            save_file.write('[')
+            for obj_position, serialized_obj in enumerate(content):
+                if obj_position:
+                    save_file.write(', ')
+                save_file.write(json.dumps(serialized_obj))
+            save_file.write(']')
+        save_file.write('}')
+
+    def load(self, load_file):
+        return json.loads(load_file.read())
+
+    def iterate_sections(self, load_file):
+        return iterate_sections(load_file)
+
+
+class IndexRecords(Mapping):
+    """The positions of the objects of a section of an indexed JSON file.
+
+    Positions are read from a table of fixed-width records sorted by
+    identifier, each holding the identifier, offset and length of an object
+    as zero-padded decimal digits. An object is found by binary search within
+    the file itself, so that the table is never read whole.
+    """
+
+    def __init__(self, load_file, offset, count, widths):
+        """Creates a new `IndexRecords` instance.
+
+        Arguments:
+            load_file (file): a readable, seekable file object (typically a
+                memory map), which must stay open while records are read
+            offset (int): the byte offset of the table in the file
+            count (int): the number of records in the table
+            widths (list): the number of digits of the identifier, offset
+                and length of each record
+        """
+        self.load_file = load_file
+        self.offset = offset
+        self.count = count
+        self.identifier_width, self.offset_width, _ = widths
+        self.record_width = sum(widths)
+
+    def __getitem__(self, identifier):
+        try:
+            # Zero-padded identifiers compare as their digits do
+            target = b'%0*d' % (self.identifier_width, int(identifier))
+        except ValueError:
+            raise KeyError(identifier)
+        if len(target) > self.identifier_width:
+            raise KeyError(identifier)
+        load_file = self.load_file
+        width = self.record_width
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            load_file.seek(self.offset + middle * width)
+            record = load_file.read(width)
+            record_identifier = record[:self.identifier_width]
+            if record_identifier < target:
+                low = middle + 1
+            elif record_identifier > target:
+                high = middle
+            else:
+                return self._parse_record(record)[1]
+        raise KeyError(identifier)
+
+    def __iter__(self):
+        return self._iterate_identifiers(range(self.count))
+
+    def __reversed__(self):
+        return self._iterate_identifiers(range(self.count - 1, -1, -1))
+
+    def __len__(self):
+        return self.count
+
+    def _iterate_identifiers(self, numbers):
+        for number in numbers:
+            record = self._read_records(number, 1)
+            yield str(int(record[:self.identifier_width]))
+
+    def _read_records(self, number, count):
+        self.load_file.seek(self.offset + number * self.record_width)
+        return self.load_file.read(count * self.record_width)
+
+    def _parse_record(self, record):
+        offset_start = self.identifier_width
+        length_start = offset_start + self.offset_width
+        return (
+            int(record[:offset_start]),
+            [
+                int(record[offset_start:length_start]),
+                int(record[length_start:self.record_width]),
+            ]
+        )
+
+
+class IndexedJSONFormat(JSONFormat):
+    """JSON save files that also index the byte offset of every object.
+
+    The document opens with the fixed-width offset of an `index` section,
+    written last, which holds the offset and length of single objects, and
+    locates a table of `IndexRecords` per list section (all held in an
+    `index_records` string). Objects can then be read individually, without
+    parsing the rest of the file, while the file remains a valid JSON
+    document.
+
+    Files written before records were introduced index list sections with a
+    dict of positions keyed by identifier, and can still be read.
+    """
+
+    extension = 'ijson'
+    is_binary = True
+    supports_random_access = True
+
+    # Sections holding the index itself, rather than serialized objects
+    INDEX_SECTIONS = ('index_offset', 'index_records', 'index')
+    HEADER_PREFIX = '{"index_offset": "'
+
+    def dump(self, serialized_objects, save_file):
+        self.dump_sections(serialized_objects.items(), save_file)
+
+    def dump_sections(self, sections, save_file):
+        # JSON is ASCII-encoded by default, so that characters and bytes are
+        # interchangeable when computing offsets.
+        offset = save_file.tell()
+        written = [offset]
+
+        def write(text):
+            save_file.write(text.encode('ascii'))
+            written[0] += len(text)
+
+        def write_object(serialized_obj):
+            text = json.dumps(serialized_obj)
+            position = [written[0], len(text)]
+            write(text)
+            return position
+
+        write(self._format_header(0))
+        index = {}
+        # (identifier, offset, length) triples, keyed by list section
+        section_positions = {}
+        position = None
+        for position, (section, content) in enumerate(sections):
+            if position:
+                write(', ')
+            write('{}: '.format(json.dumps(section)))
+            if isinstance(content, dict):
+                index[section] = write_object(content)
+                continue
+
+            positions = section_positions[section] = []
+            write('[')
+            for obj_position, serialized_obj in enumerate(content):
+                if obj_position:
+                    write(', ')
+                positions.append(
+                    [serialized_obj['_identifier']]
+                    + write_object(serialized_obj)
+                )
+            write(']')
+
+        if position is not None:
+            write(', ')
+        write('"index_records": "')
+        for section, positions in section_positions.items():
+            positions.sort()
+            widths = [
+                max((len(str(record[field])) for record in positions),
+                    default=1)
+                for field in range(3)
+            ]
+            index[section] = {
+                'records': [written[0], len(positions)],
+                'widths': widths,
+            }
+            record_format = ''.join(
+                '{{:0{}d}}'.format(width) for width in widths
+            )
+            for start in range(0, len(positions), 4096):
+                write(''.join(
+                    record_format.format(*record)
+                    for record in positions[start:start + 4096]
+                ))
+        write('", "index": ')
+        index_position = write_object(index)
+        write('}')
+
+        end = save_file.tell()
+        save_file.seek(offset)
+        save_file.write(
+            self._format_header(index_position[0]).encode('ascii')
+        )
+        save_file.seek(end)
+
+    def load(self, load_file):
+        serialized_objects = json.loads(load_file.read())
+        for section in self.INDEX_SECTIONS:
+            serialized_objects.pop(section, None)
+        return serialized_objects
+
+    def iterate_sections(self, load_file):
+        text_file = io.TextIOWrapper(load_file, encoding='ascii')
+        for section, serialized_obj in iterate_sections(text_file):
+            if section not in self.INDEX_SECTIONS:
+                yield section, serialized_obj
+
+    def read_index(self, load_file):
+        header = load_file.read(len(self._format_header(0)))
+        header = header.decode('ascii')
+        if not header.startswith(self.HEADER_PREFIX):
+            raise ValueError('Not an indexed JSON save file')
+        load_file.seek(int(header[len(self.HEADER_PREFIX):].split('"')[0]))
+        index = json.JSONDecoder().raw_decode(
+            load_file.read().decode('ascii')
+        )[0]
+        for section, positions in index.items():
+            if not isinstance(positions, dict):
+                continue
+            if 'records' in positions:
+                index[section] = IndexRecords(
+                    load_file, *positions['records'], positions['widths']
+                )
+            else:
+                index[section] = dict(
+                    sorted(positions.items(), key=lambda item: int(item[0]))
+                )
+        return index
+
+    def read_object(self, load_file, position):
+        offset, length = position
+        load_file.seek(offset)
+        return json.loads(load_file.read(length))
+
+    def _format_header(self, index_offset):
+        # The offset is zero-padded, so that the header can be rewritten in
+        # place once the actual offset is known
+        return '{}{:016d}", '.format(self.HEADER_PREFIX, index_offset)
+
+
+class BinaryFormat(SaveFormat):
+    """Compact save files, in the encoding of `adventure.loaders.binary`.
+
+    Every section is written as its name followed by either a single record
+    or, for list sections, an iteration of one record per element, so that
+    any file can be read back incrementally.
+    """
+
+    extension = 'advb'
+    is_binary = True
+
+    def dump(self, serialized_objects, save_file):
+        self.dump_sections(serialized_objects.items(), save_file)
+
+    def dump_sections(self, sections, save_file):
+        encoder = BinaryEncoder(save_file)
+        encoder.write_magic()
+        for section, content in sections:
+            encoder.write_value(section)
+            if isinstance(content, dict):
+                encoder.write_value(content)
+                continue
+
+            encoder.write_tag(ITERATION)
+            for serialized_obj in content:
+                encoder.write_value(serialized_obj)
+            encoder.write_tag(END)
+        encoder.write_tag(END)
+        encoder.flush()
+
+    def load(self, load_file):
+        serialized_objects = {}
+        for section, is_list, serialized_obj in self._iterate_records(
+                BinaryDecoder(load_file, chunk_size=None)
+        ):
+            if not is_list:
+                serialized_objects[section] = serialized_obj
+            elif serialized_obj is None:
+                serialized_objects[section] = []
+            else:
+                serialized_objects[section].append(serialized_obj)
+        return serialized_objects
+
+    def iterate_sections(self, load_file):
+        for section, is_list, serialized_obj in self._iterate_records(
+                BinaryDecoder(load_file)
+        ):
+            if not is_list or serialized_obj is not None:
+                yield section, serialized_obj
+
+    @staticmethod
+    def _iterate_records(decoder):
+        """Generate (section, is list, value) for each record of a file.
+
+        The start of each list section is announced with a None value.
+        """
+        decoder.read_magic()
+        while decoder.peek_tag() != END:
+            section = decoder.read_value()
+            if decoder.peek_tag() != ITERATION:
+                yield section, False, decoder.read_value()
+                continue
+
+            decoder.read_tag()
+            yield section, True, None
+            while decoder.peek_tag() != END:
+                yield section, True, decoder.read_value()
+            decoder.read_tag()
+
+
+class SQLiteFormat(SaveFormat):
+    """Save files held in SQLite databases (see `adventure.loaders.sqlite`).
+
+    Delta saves update the database in a single transaction, rather than
+    being journaled, and objects can be read individually, so that games
+    can be loaded lazily (from a snapshot of the database, which later
+    updates leave untouched).
+    """
+
+    extension = 'sqlite'
+    supports_random_access = True
+    supports_updates = True
+
+    def open(self, file_path, mode):
+        return SaveDatabase(file_path, mode)
+
+    def open_indexed(self, file_path):
+        return SaveDatabase(file_path, 'r')
+
+    def replace(self, saving_path, file_path):
+        # A transaction interrupted on the replaced file must not be rolled
+        # back onto the new one, nor its write-ahead log replayed over it.
+        # Databases still open on the replaced file keep reading it, and
+        # SQLite leaves the files of a database moved while open alone.
+        for path in get_transaction_paths(file_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.replace(saving_path, file_path)
+
+    def dump(self, serialized_objects, save_file):
+        save_file.write(serialized_objects.items())
+
+    def dump_sections(self, sections, save_file):
+        save_file.write(sections)
+
+    def update(self, serialized_objects, save_file):
+        save_file.write(serialized_objects.items())
+
+    def load(self, load_file):
+        serialized_objects = {
+            section: [] for section in SECTIONS
+            if section not in SINGLE_SECTIONS
+        }
+        for section, serialized_obj in load_file.read_sections():
+            if section in SINGLE_SECTIONS:
+                serialized_objects[section] = serialized_obj
+            else:
+                serialized_objects[section].append(serialized_obj)
+        return serialized_objects
+
+    def iterate_sections(self, load_file):
+        return load_file.read_sections()
+
+    def read_index(self, load_file):
+        return {
+            section: (
+                (section, None) if section in SINGLE_SECTIONS
+                else TableIndex(load_file, section)
+            )
+            for section in SECTIONS
+        }
+
+    def read_object(self, load_file, position):
+        return load_file.read(*position)
+
+
+class FormatRegistry(dict):
+    """Registry to pair file extensions with the save formats they denote."""
+
+    def add_format(self, save_format):
+        """Add a save format to the registry, under its extension.
+
+        Arguments:
+            save_format (SaveFormat): an instance of a save format
+        """
+        self[save_format.extension] = save_format
+
+    def get_format(self, extension):
+        """Return the save format registered for the given extension.
+
+        Arguments:
+            extension (str): a file extension, without the leading dot
+
+        Raises:
+            UnsupportedFormatError: if no format uses the extension
+        """
+        try:
+            return self[extension]
+        except KeyError:
+            raise UnsupportedFormatError(
+                'No save format registered for extension {!r}'.format(
+                    extension
+                )
+            )
+
+
+# Instantiate the FormatRegistry "singleton" to use throughout the package
+formats = FormatRegistry()
+formats.add_format(JSONFormat())
+formats.add_format(IndexedJSONFormat())
+formats.add_format(BinaryFormat())
+formats.add_format(SQLiteFormat())
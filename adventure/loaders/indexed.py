@@ -0,0 +1,147 @@
+"""Reading individual objects out of save files, without loading the rest.
+
+Save formats supporting random access (see `SaveFormat.read_index`) hold an
+index of the position of every serialized object. An `IndexedSaveFile` maps
+such a file into memory (or opens it as its format sees fit), reads its
+index, and then decodes only the objects asked for, by the same (model ref,
+identifier) pair a `SerializedReference` holds. Reading an object costs
+about the same however large the file is: only the pages holding the index,
+the records searched through and the object itself are ever read from disk.
+
+Since a full save replaces the previous file rather than overwriting it, an
+open `IndexedSaveFile` keeps reading the snapshot it was opened on (as it
+does when formats supporting updates are updated in place by delta saves,
+see `adventure.loaders.sqlite`).
+"""
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders.journal import merge_entries
+from adventure.loaders.sections import MODEL_SECTIONS, SINGLE_SECTIONS
+
+
+class IndexedSaveFile:
+    """A save file opened for random access, read one object at a time."""
+
+    def __init__(self, save_format, file_path, journal_entries=()):
+        """Creates a new `IndexedSaveFile` instance, opening the file.
+
+        Arguments:
+            save_format (SaveFormat): a save format supporting random access
+            file_path (str): path to the save file
+            journal_entries (iterable): journal entries to replay over the
+                save file, oldest first
+
+        Raises:
+            UnsupportedFormatError: if the format does not support random
+                access
+        """
+        if not save_format.supports_random_access:
+            raise UnsupportedFormatError(
+                'Save format {!r} cannot be read by object'.format(
+                    save_format.extension
+                )
+            )
+        self.save_format = save_format
+        self.file_path = file_path
+        self.load_file = save_format.open_indexed(file_path)
+        self.index = save_format.read_index(self.load_file)
+        self.single_objects, self.listed_objects = merge_entries(
+            journal_entries
+        )
+
+    def read(self, model_ref, identifier):
+        """Read the serialized object with the given type and identifier.
+
+        Arguments:
+            model_ref (str): a dot-delimited path to the class of the object
+            identifier (int): the identifier of the object
+
+        Return:
+            a serialized object, as updated by the journal
+
+        Raises:
+            KeyError: if no such object was saved
+        """
+        section = MODEL_SECTIONS[model_ref]
+        if section not in SINGLE_SECTIONS:
+            return self.read_section(section, identifier)
+        serialized = self.read_section(section)
+        if serialized.get('_identifier') != identifier:
+            raise KeyError((model_ref, identifier))
+        return serialized
+
+    def read_reference(self, reference):
+        """Read the serialized object a reference refers to.
+
+        Arguments:
+            reference (SerializedReference): a reference, as found in
+                serialized objects
+
+        Return:
+            a serialized object, as updated by the journal
+        """
+        return self.read(reference['model_ref'], reference['identifier'])
+
+    def read_section(self, section, identifier=None):
+        """Read a serialized object by section.
+
+        Arguments:
+            section (str): the name of the section holding the object
+            identifier (int): the identifier of the object, in list sections
+
+        Return:
+            a serialized object, as updated by the journal
+
+        Raises:
+            KeyError: if no such object was saved
+        """
+        if identifier is None:
+            if section in self.single_objects:
+                return dict(self.single_objects[section])
+            position = self.index[section]
+        else:
+            section_objects = self.listed_objects.get(section, {})
+            if identifier in section_objects:
+                return dict(section_objects[identifier])
+            position = self.index[section][str(identifier)]
+        return self.save_format.read_object(self.load_file, position)
+
+    def get_identifiers(self, section):
+        """Return the identifiers of the objects saved in a list section.
+
+        Arguments:
+            section (str): the name of a list section
+
+        Return:
+            a set of int identifiers, including those of journaled objects
+        """
+        identifiers = {
+            int(identifier) for identifier in self.index.get(section, {})
+        }
+        identifiers.update(self.listed_objects.get(section, {}))
+        return identifiers
+
+    def get_max_identifier(self, section):
+        """Return the greatest identifier of the objects in a list section.
+
+        Arguments:
+            section (str): the name of a list section
+
+        Return:
+            an int, or None if the section holds no objects
+        """
+        identifiers = list(self.listed_objects.get(section, {}))
+        # Indexes are ordered by identifier
+        for identifier in reversed(self.index.get(section, {})):
+            identifiers.append(int(identifier))
+            break
+        return max(identifiers, default=None)
+
+    def close(self):
+        """Close (or unmap) the file."""
+        self.load_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
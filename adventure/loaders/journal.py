@@ -0,0 +1,173 @@
+"""Journals of incremental changes made to a saved game.
+
+A journal sits alongside a save file (the snapshot) and holds one JSON line
+per delta save. Each line is a journal entry: a partial set of sections,
+holding only the objects that changed since the previous save. Replaying the
+entries in order over the snapshot, replacing objects by identifier and
+appending new ones, yields the latest state of the game.
+"""
+import json
+import os
+
+
+JOURNAL_EXTENSION = 'journal'
+
+
+def get_journal_path(file_path):
+    """Return the path to the journal of the given save file.
+
+    Arguments:
+        file_path (str): path to a save file
+
+    Return:
+        a str representing the path to the journal
+    """
+    return '{}.{}'.format(file_path, JOURNAL_EXTENSION)
+
+
+def append_entry(journal_path, entry):
+    """Durably append an entry to a journal.
+
+    Arguments:
+        journal_path (str): path to the journal
+        entry (dict): serialized objects, keyed by section; list sections
+            hold a list of objects, other sections a single object
+    """
+    with open(journal_path, 'a') as journal_file:
+        journal_file.write(json.dumps(entry) + '\n')
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+
+def read_entries(journal_path):
+    """Read the entries of a journal, in the order they were written.
+
+    A missing journal has no entries. Reading stops at the first incomplete
+    line, as left by a crash while appending.
+
+    Arguments:
+        journal_path (str): path to the journal
+
+    Return:
+        a generator of entries
+    """
+    if not os.path.exists(journal_path):
+        return
+    with open(journal_path) as journal_file:
+        for line in journal_file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def get_identifier(serialized_obj):
+    """Return the identifier of a serialized object, or None if it is not
+    an object with an integer identifier.
+    """
+    if not isinstance(serialized_obj, dict):
+        return None
+    identifier = serialized_obj.get('_identifier')
+    if not isinstance(identifier, int) or isinstance(identifier, bool):
+        return None
+    return identifier
+
+
+def merge_entries(entries):
+    """Merge journal entries, keeping the latest version of each object.
+
+    Arguments:
+        entries (iterable): journal entries, oldest first
+
+    Return:
+        a 2-tuple of (dict of serialized objects keyed by single-object
+        section, dict of dicts of serialized objects keyed by list section
+        then by identifier)
+
+    Raises:
+        ValueError: if an entry is not made of sections, or holds a listed
+            object without an integer identifier
+    """
+    single_objects = {}
+    listed_objects = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError('Journal entry holds a {} instead of '
+                             'sections'.format(type(entry).__name__))
+        for section, content in entry.items():
+            if isinstance(content, list):
+                section_objects = listed_objects.setdefault(section, {})
+                for serialized_obj in content:
+                    identifier = get_identifier(serialized_obj)
+                    if identifier is None:
+                        raise ValueError(
+                            'Journal entry holds {} object without an '
+                            'integer identifier'.format(section)
+                        )
+                    section_objects[identifier] = serialized_obj
+            else:
+                single_objects[section] = content
+    return single_objects, listed_objects
+
+
+def apply_entries(serialized_objects, entries):
+    """Replay journal entries over a full set of serialized objects.
+
+    Arguments:
+        serialized_objects (dict): serialized objects keyed by section, as
+            read from a snapshot, which are updated in place
+        entries (iterable): journal entries, oldest first
+
+    Raises:
+        ValueError: if an entry is malformed (see `merge_entries`), or lists
+            objects of a section the snapshot does not hold as a list
+    """
+    single_objects, listed_objects = merge_entries(entries)
+    serialized_objects.update(single_objects)
+    for section, section_objects in listed_objects.items():
+        existing = serialized_objects.setdefault(section, [])
+        if not isinstance(existing, list):
+            raise ValueError('Snapshot section {!r} is not a list'.format(
+                section
+            ))
+        positions = {
+            get_identifier(serialized_obj): position
+            for position, serialized_obj in enumerate(existing)
+        }
+        for identifier, serialized_obj in section_objects.items():
+            if identifier in positions:
+                existing[positions[identifier]] = serialized_obj
+            else:
+                existing.append(serialized_obj)
+
+
+def apply_entries_to_sections(sections, entries):
+    """Replay journal entries over an incrementally read snapshot.
+
+    Arguments:
+        sections (iterable): (section name, serialized object) pairs, as
+            generated by `SaveFormat.iterate_sections`
+        entries (iterable): journal entries, oldest first
+
+    Return:
+        a generator of (section name, serialized object) pairs, where
+        replaced objects are substituted in place and new objects follow the
+        rest of the snapshot
+    """
+    single_objects, listed_objects = merge_entries(entries)
+    for section, serialized_obj in sections:
+        if section in single_objects:
+            yield section, single_objects.pop(section)
+        elif section in listed_objects:
+            identifier = get_identifier(serialized_obj)
+            yield section, listed_objects[section].pop(
+                identifier,
+                serialized_obj
+            )
+        else:
+            yield section, serialized_obj
+
+    yield from single_objects.items()
+    for section, section_objects in listed_objects.items():
+        for serialized_obj in section_objects.values():
+            yield section, serialized_obj
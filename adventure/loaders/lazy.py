@@ -0,0 +1,177 @@
+"""Lazy loading of games from save files that support random access.
+
+Rather than instantiating every object in a save file up front, a
+`LazyGameResolver` builds the game, the player and the player's location, and
+leaves every other location as a `LazyReference` placeholder. A placeholder
+is resolved the first time it is accessed (typically by following an exit),
+at which point the location is built along with its exits, items and people,
+each read individually from the file through its index (see
+`adventure.loaders.indexed`).
+"""
+# Canonical directions and genders are registered as flyweights on import
+import adventure.fixtures  # noqa: F401
+from adventure.loaders.indexed import IndexedSaveFile
+from adventure.models import (
+    Direction, Exit, Game, Gender, Item, Location, Person, Player
+)
+from adventure.models.arena import get_arena
+from adventure.models.base import LazyReference
+from adventure.models.flyweights import flyweights
+
+
+# Models shared with other worlds when they match a canonical instance
+FLYWEIGHT_CLASSES = (Direction, Gender)
+
+# Sections of a save file holding each type of model
+MODEL_SECTIONS = {
+    Direction: 'directions',
+    Exit: 'exits',
+    Gender: 'genders',
+    Item: 'items',
+    Location: 'locations',
+    Person: 'people',
+}
+
+
+class LazyGameResolver:
+    """Instantiates the objects of a saved game as they are needed."""
+
+    def __init__(self, save_format, file_path, journal_entries=()):
+        """Creates a new `LazyGameResolver` instance.
+
+        Arguments:
+            save_format (SaveFormat): a save format supporting random access
+            file_path (str): path to the save file
+            journal_entries (iterable): journal entries to replay over the
+                save file, oldest first
+        """
+        # The file stays mapped for as long as objects may be resolved
+        self.save_file = IndexedSaveFile(
+            save_format, file_path, journal_entries
+        )
+        # Objects join the arena active when the resolver is created, whose
+        # identity map tells which objects were already built
+        self.arena = get_arena()
+        # The identity map holds objects weakly; the resolver holds those it
+        # built strongly, so that an object reached and modified once is not
+        # dropped and read afresh from the file when reached again
+        self.built = []
+
+    def load_game(self):
+        """Instantiate the game, leaving unvisited locations unresolved.
+
+        Return:
+            a Game object
+        """
+        self._reserve_identifiers()
+        serialized_player = self.save_file.read_section('player')
+        serialized_game = self.save_file.read_section('game')
+        location_ref = serialized_player.pop('location')
+        inventory_refs = serialized_player.pop('inventory')
+        player = Player(
+            location=self._get(Location, location_ref['identifier']),
+            inventory=[
+                self._get(Item, ref['identifier'])
+                for ref in inventory_refs
+            ],
+            **serialized_player
+        )
+
+        serialized_game.pop('player')
+        location_refs = serialized_game.pop('locations')
+        game = Game(
+            player=player,
+            locations=[
+                self._get_lazily(Location, ref['identifier'])
+                for ref in location_refs
+            ],
+            **serialized_game
+        )
+        player.mark_clean()
+        game.mark_clean()
+        return game
+
+    def resolve(self, model_cls, identifier):
+        """Return the object with the given class and identifier.
+
+        Arguments:
+            model_cls (type): a model class
+            identifier (int): the identifier of an object of that class
+
+        Return:
+            an instance of model_cls, instantiated if need be
+        """
+        # Building objects as they are reached is no modification of the
+        # world, even once games are forked from it
+        with self.arena.activate(), self.arena.loading():
+            return self._get(model_cls, identifier)
+
+    def _get(self, model_cls, identifier):
+        obj = self.arena.get(model_cls, identifier)
+        if obj is None:
+            serialized = self.save_file.read_section(
+                MODEL_SECTIONS[model_cls],
+                identifier
+            )
+            if model_cls in FLYWEIGHT_CLASSES:
+                obj = flyweights.intern(model_cls, serialized)
+            else:
+                obj = self._build(model_cls, serialized)
+                self.built.append(obj)
+            obj.mark_clean()
+        return obj
+
+    def _get_lazily(self, model_cls, identifier):
+        obj = self.arena.get(model_cls, identifier)
+        if obj is None:
+            return LazyReference(model_cls, identifier, self.resolve)
+        return obj
+
+    def _build(self, model_cls, serialized):
+        if model_cls is Person:
+            gender_ref = serialized.pop('gender')
+            serialized['gender'] = self._get(
+                Gender,
+                gender_ref['identifier']
+            )
+        elif model_cls is Exit:
+            direction_ref = serialized.pop('direction')
+            destination_ref = serialized.pop('destination')
+            serialized['direction'] = self._get(
+                Direction,
+                direction_ref['identifier']
+            )
+            serialized['destination'] = self._get_lazily(
+                Location,
+                destination_ref['identifier']
+            )
+        elif model_cls is Location:
+            # Instantiate (and so register) the location before building its
+            # exits, so that exits leading back to it need no placeholder.
+            location = Location(
+                name=serialized['name'],
+                description=serialized['description'],
+                _identifier=serialized['_identifier']
+            )
+            for attribute, attribute_cls in (
+                    ('exits', Exit),
+                    ('items', Item),
+                    ('people', Person),
+            ):
+                setattr(location, attribute, [
+                    self._get(attribute_cls, ref['identifier'])
+                    for ref in serialized[attribute]
+                ])
+            return location
+
+        return model_cls(**serialized)
+
+    def _reserve_identifiers(self):
+        """Keep new objects from reusing the identifier of an unbuilt one.
+
+        Identifiers are otherwise only reserved as objects are instantiated.
+        """
+        for model_cls, section in MODEL_SECTIONS.items():
+            identifier = self.save_file.get_max_identifier(section)
+            if identifier is not None:
+                self.arena.reserve(model_cls, identifier)
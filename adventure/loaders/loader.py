@@ -1,40 +1,174 @@
-import json
+"""Reading saved games.
+
+Save formats, journals and the machinery of lazy and cached loading are
+imported where they are first needed, so that importing `GameLoader` stays
+cheap (eg. for commands that only save games, or only validate them).
+"""
 import os
 
+from adventure.exc import UnsupportedFormatError
 from adventure.models import (
-    Direction, Exit, Item, Game, Gender, Location, Person, Player
+    Arena, Direction, Exit, Item, Game, Gender, Location, Person, Player
 )
 
 
 class GameLoader:
     """Manages read game data from a file."""
 
-    def __init__(self, directory=None):
+    def __init__(self, directory=None, extension='json'):
         """Creates a new `GameLoader` instance.
 
         Arguments:
             directory (str): an optional path to the directory from which to
                 read files (by default, the current worker directory)
+            extension (str): the extension of files to read, which selects
+                the format in which to read them (by default, JSON)
         """
         directory = directory or '.'
         self.directory = os.path.abspath(directory)
+        self.extension = extension
+        from adventure.loaders.formats import formats
+        self.save_format = formats.get_format(extension)
 
-    def load(self, file_name):
+    def load(self, file_name, stream=False, lazy=False, cached=False):
         """Read & interpret serialized game data from a file.
 
         Arguments:
             file_name (str): name of the file to read (excluding extension)
+            stream (bool): if True, parse the file incrementally, building
+                each object as soon as it is read rather than parsing the
+                whole file first
+            lazy (bool): if True, only build the player's location up front,
+                and every other location (with its exits, items and people)
+                when it is first accessed; the format must support random
+                access, and the file stays mapped into memory while the game
+                is in use
+            cached (bool): if True, return a fork of a template of the game
+                kept from a previous load, as long as the file (and journal)
+                did not change since; the fork is made in constant time, and
+                copies objects of the template as they are accessed (see
+                `adventure.loaders.templates`)
 
         Return:
             a Game object
+
+        Raises:
+            UnsupportedFormatError: if lazy is True but the format does not
+                support random access
         """
+        from adventure.loaders.journal import (
+            apply_entries, apply_entries_to_sections, get_journal_path,
+            read_entries
+        )
+
+        if cached:
+            from adventure.loaders.templates import templates
+            return templates.get_game(self, file_name, stream, lazy)
+
         finalized_path = self.get_file_path(file_name)
-        with open(finalized_path) as load_file:
-            serialized_objs = json.loads(load_file.read())
+        journal_entries = read_entries(get_journal_path(finalized_path))
+        if lazy and not self.save_format.supports_random_access:
+            raise UnsupportedFormatError(
+                'Save format {!r} cannot be loaded lazily'.format(
+                    self.extension
+                )
+            )
+
+        # Each loaded game is a world of its own
+        with Arena().activate() as arena:
+            if lazy:
+                from adventure.loaders.lazy import LazyGameResolver
+                game = LazyGameResolver(
+                    self.save_format,
+                    finalized_path,
+                    journal_entries
+                ).load_game()
+            elif stream:
+                with self.save_format.open(finalized_path, 'r') as load_file:
+                    game = self._stream_all_game_objects(
+                        apply_entries_to_sections(
+                            self.save_format.iterate_sections(load_file),
+                            journal_entries
+                        )
+                    )
+            else:
+                with self.save_format.open(finalized_path, 'r') as load_file:
+                    serialized_objs = self.save_format.load(load_file)
+                apply_entries(serialized_objs, journal_entries)
+                game = self._reconstitute_all_game_objects(serialized_objs)
 
-        game = self._reconstitute_all_game_objects(serialized_objs)
+        # Freshly loaded objects match what was saved
+        arena.dirty.clear()
         return game
 
+    def open_indexed(self, file_name):
+        """Open a save file to read individual objects out of it.
+
+        Objects are decoded as they are read, by model ref and identifier,
+        without reading the rest of the file (see `IndexedSaveFile`).
+
+        Arguments:
+            file_name (str): name of the file to open (excluding extension)
+
+        Return:
+            an IndexedSaveFile object, to close once done with it
+
+        Raises:
+            UnsupportedFormatError: if the format does not support random
+                access
+        """
+        from adventure.loaders.indexed import IndexedSaveFile
+        from adventure.loaders.journal import get_journal_path, read_entries
+
+        finalized_path = self.get_file_path(file_name)
+        return IndexedSaveFile(
+            self.save_format,
+            finalized_path,
+            read_entries(get_journal_path(finalized_path))
+        )
+
+    def validate(self, file_name):
+        """Check the integrity of a save file, without loading it.
+
+        Arguments:
+            file_name (str): name of the file to check (excluding extension)
+
+        Return:
+            a ValidationReport object, listing every problem found
+        """
+        # Imported here, as validation is not needed to load games
+        from adventure.loaders.validator import validate_file
+        return validate_file(self.get_file_path(file_name))
+
+    def compact(self, file_name):
+        """Fold the journal of a save file into a new snapshot.
+
+        The new snapshot is written alongside the old one before replacing
+        it, and the journal only removed afterwards, so that a crash at any
+        point leaves a loadable save.
+
+        Arguments:
+            file_name (str): name of the file to compact (excluding extension)
+        """
+        from adventure.loaders.journal import (
+            apply_entries, get_journal_path, read_entries
+        )
+
+        finalized_path = self.get_file_path(file_name)
+        journal_path = get_journal_path(finalized_path)
+        if not os.path.exists(journal_path):
+            return
+
+        with self.save_format.open(finalized_path, 'r') as load_file:
+            serialized_objs = self.save_format.load(load_file)
+        apply_entries(serialized_objs, read_entries(journal_path))
+
+        compacted_path = '{}.compacting'.format(finalized_path)
+        with self.save_format.open(compacted_path, 'w') as save_file:
+            self.save_format.dump(serialized_objs, save_file)
+        self.save_format.replace(compacted_path, finalized_path)
+        os.remove(journal_path)
+
     def get_file_path(self, file_name):
         """Return the full file path to a file with the given name.
 
@@ -44,7 +178,7 @@ class GameLoader:
         Return:
             a str representing the path to the named file
         """
-        finalized_file_name = '{}.json'.format(file_name)
+        finalized_file_name = '{}.{}'.format(file_name, self.extension)
         finalized_path = os.path.join(self.directory, finalized_file_name)
         return finalized_path
 
@@ -77,10 +211,120 @@ class GameLoader:
         )
         return game
 
+    @classmethod
+    def _stream_all_game_objects(cls, sections):
+        """Instantiate game objects while incrementally reading a file.
+
+        Each object is built as soon as its serialized form has been read,
+        which is then discarded. Since sections may refer to objects in
+        sections not yet read, references are first left in place as
+        serialized references, and resolved once the whole file is read.
+
+        Arguments:
+            sections (iterable): (section name, serialized object) pairs, as
+                generated by `SaveFormat.iterate_sections`
+
+        Return:
+            a Game object
+        """
+        # Canonical directions and genders are registered as flyweights on
+        # import
+        import adventure.fixtures  # noqa: F401
+        from adventure.models.flyweights import flyweights
+
+        model_classes = {
+            'directions': Direction,
+            'genders': Gender,
+            'items': Item,
+            'people': Person,
+            'exits': Exit,
+            'locations': Location,
+        }
+        objects = {section: {} for section in model_classes}
+        serialized_game = None
+        serialized_player = None
+        for section, serialized in sections:
+            if section == 'game':
+                serialized_game = serialized
+            elif section == 'player':
+                serialized_player = serialized
+            elif section in ('directions', 'genders'):
+                obj = flyweights.intern(model_classes[section], serialized)
+                objects[section][obj._identifier] = obj
+            elif section in model_classes:
+                obj = model_classes[section](**serialized)
+                objects[section][obj._identifier] = obj
+        return cls._resolve_streamed_objects(
+            serialized_game,
+            serialized_player,
+            **objects
+        )
+
+    @staticmethod
+    def _resolve_streamed_objects(
+            serialized_game, serialized_player, directions, genders, items,
+            people, exits, locations
+    ):
+        """Replace serialized references in streamed objects with objects.
+
+        Arguments:
+            serialized_game (dict): a serialized game
+            serialized_player (dict): a serialized player
+            directions (dict): Direction objects, keyed by identifier
+            genders (dict): Gender objects, keyed by identifier
+            items (dict): Item objects, keyed by identifier
+            people (dict): Person objects holding a serialized gender
+                reference, keyed by identifier
+            exits (dict): Exit objects holding serialized direction and
+                destination references, keyed by identifier
+            locations (dict): Location objects holding lists of serialized
+                item, person and exit references, keyed by identifier
+
+        Return:
+            a Game object
+        """
+        for person in people.values():
+            person.gender = genders.get(person.gender['identifier'])
+
+        for exit in exits.values():
+            exit.direction = directions.get(exit.direction['identifier'])
+            exit.destination = locations[exit.destination['identifier']]
+
+        for location in locations.values():
+            location.exits = [
+                exits[ref['identifier']] for ref in location.exits
+            ]
+            location.items = [
+                items[ref['identifier']] for ref in location.items
+            ]
+            location.people = [
+                people[ref['identifier']] for ref in location.people
+            ]
+
+        location_reference = serialized_player.pop('location')
+        inventory_refs = serialized_player.pop('inventory')
+        player = Player(
+            location=locations[location_reference['identifier']],
+            inventory=[items[ref['identifier']] for ref in inventory_refs],
+            **serialized_player
+        )
+
+        serialized_game.pop('player')
+        serialized_game.pop('locations')
+        game = Game(
+            player=player,
+            locations=list(locations.values()),
+            **serialized_game
+        )
+        return game
+
     @staticmethod
     def _reconstitute_simple_objects(directions, genders, items):
         """Instantiate game objects that contain no serialized references.
 
+        Directions and genders matching canonical ones (see
+        `adventure.fixtures`) are shared rather than copied.
+
         Arguments:
             directions (list): a list of serialized Direction objects
             genders (list): a list of serialized Gender objects
@@ -89,8 +333,16 @@ class GameLoader:
         Return:
             a 3-tuple of (list of Directions, list of Genders, list of Items)
         """
-        directions = [Direction(**direction) for direction in directions]
-        genders = [Gender(**gender) for gender in genders]
+        # Canonical directions and genders are registered as flyweights on
+        # import
+        import adventure.fixtures  # noqa: F401
+        from adventure.models.flyweights import flyweights
+
+        directions = [
+            flyweights.intern(Direction, direction)
+            for direction in directions
+        ]
+        genders = [flyweights.intern(Gender, gender) for gender in genders]
         items = [Item(**item) for item in items]
         return directions, genders, items
 
@@ -1,35 +1,114 @@
-import json
 import os
 from copy import copy
+from itertools import chain
+
+from adventure.loaders.formats import formats
+from adventure.loaders.journal import append_entry, get_journal_path
+from adventure.models import Direction, Exit, Gender, Item, Location, Person
+from adventure.models.base import BaseModel
+
+
+# Sections of a save file holding each type of model that may be journaled
+# independently of the game and player
+SECTIONS = (
+    (Person, 'people'),
+    (Gender, 'genders'),
+    (Item, 'items'),
+    (Location, 'locations'),
+    (Exit, 'exits'),
+    (Direction, 'directions'),
+)
 
 
 class GameSaver:
     """Manages writing game data to a file."""
 
-    def __init__(self, game, directory=None):
+    def __init__(self, game, directory=None, extension='json'):
         """Creates a new `GameSaver` instance.
 
         Arguments:
             game (`Game`): the game object to be saved
             directory (str): an optional path to the directory in which to
                 write files (by default, the current working directory)
+            extension (str): the extension of files to write, which selects
+                the format in which to write them (by default, JSON)
         """
         self.game = game
         directory = directory or '.'
         self.directory = os.path.abspath(directory)
+        self.extension = extension
+        self.save_format = formats.get_format(extension)
 
-    def save(self, file_name):
+    def save(self, file_name, stream=False):
         """Write the game state to the given file_path.
 
         Arguments:
             file_name (str): the name of file to write (extension excluded)
+            stream (bool): if True, serialize and write objects one at a time
+                rather than building the whole document in memory first
         """
-        game_objs = self._extract_all_game_objects()
-        serialized_objs = self._serialize_game_objects(self.game, *game_objs)
+        finalized_path = self.get_file_path(file_name)
+        # Write alongside the previous save before replacing it, so that a
+        # game lazily loaded from it can still be read while being saved.
+        saving_path = '{}.saving'.format(finalized_path)
+        if stream:
+            with self.save_format.open(saving_path, 'w') as save_file:
+                self.save_format.dump_sections(
+                    self._iterate_serialized_game_objects(),
+                    save_file
+                )
+        else:
+            game_objs = self._extract_all_game_objects()
+            serialized_objs = self._serialize_game_objects(
+                self.game,
+                **game_objs
+            )
+            with self.save_format.open(saving_path, 'w') as save_file:
+                self.save_format.dump(serialized_objs, save_file)
+        self.save_format.replace(saving_path, finalized_path)
+
+        # The new snapshot supersedes any journaled changes
+        journal_path = get_journal_path(finalized_path)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        for obj in self.game.iterate_objects():
+            obj.mark_clean()
+
+    def save_delta(self, file_name):
+        """Append the objects changed since the last save to a journal.
+
+        The journal is replayed over the last full save (the snapshot) when
+        the game is loaded. Formats supporting updates are instead updated
+        in place with the changed objects. If there is no snapshot yet, a
+        full save is made.
 
+        Arguments:
+            file_name (str): the name of the snapshot (extension excluded)
+        """
         finalized_path = self.get_file_path(file_name)
-        with open(finalized_path, 'w') as save_file:
-            save_file.write(json.dumps(serialized_objs))
+        if not os.path.exists(finalized_path):
+            self.save(file_name)
+            return
+
+        entry = {}
+        journaled_objs = []
+        for obj in list(self.game.arena.dirty):
+            section = self._get_section(obj)
+            if section is None:
+                continue
+            if section in ('game', 'player'):
+                entry[section] = obj.serialize()
+            else:
+                entry.setdefault(section, []).append(obj.serialize())
+            journaled_objs.append(obj)
+
+        if entry and self.save_format.supports_updates:
+            with self.save_format.open(finalized_path, 'a') as save_file:
+                self.save_format.update(entry, save_file)
+        elif entry:
+            append_entry(get_journal_path(finalized_path), entry)
+        for obj in journaled_objs:
+            obj.mark_clean()
 
     def get_file_path(self, file_name):
         """Return the full file path to a file with the given name.
@@ -40,10 +119,29 @@ class GameSaver:
         Return:
             a str representing the path to the named file
         """
-        finalized_file_name = '{}.json'.format(file_name)
+        finalized_file_name = '{}.{}'.format(file_name, self.extension)
         finalized_path = os.path.join(self.directory, finalized_file_name)
         return finalized_path
 
+    def _get_section(self, obj):
+        """Return the name of the section of a save file holding obj.
+
+        Arguments:
+            obj (BaseModel): any model object
+
+        Return:
+            a section name, or None if obj does not belong in this game's
+            save file
+        """
+        if obj is self.game:
+            return 'game'
+        elif obj is self.game.player:
+            return 'player'
+        for model_cls, section in SECTIONS:
+            if isinstance(obj, model_cls):
+                return section
+        return None
+
     def _extract_all_game_objects(self):
         """Recurse through the game object, extracting all related objects.
 
@@ -53,28 +151,76 @@ class GameSaver:
         items = copy(self.game.player.inventory)
         people = []
         exits = []
-        genders = []
-        directions = []
+        # Shared objects are collected as the keys of insertion-ordered dicts,
+        # to deduplicate them in constant time while preserving their order.
+        genders = {}
+        directions = {}
         for location in self.game.locations:
             items += location.items
             exits += location.exits
             for exit in location.exits:
-                if exit.direction not in directions:
-                    directions.append(exit.direction)
+                directions[exit.direction] = None
             people += location.people
             for person in location.people:
-                if person.gender not in genders:
-                    genders.append(person.gender)
+                genders[person.gender] = None
         return {
             'player': self.game.player,
             'people': people,
-            'genders': genders,
+            'genders': list(genders),
             'items': items,
             'locations': self.game.locations,
             'exits': exits,
-            'directions': directions,
+            'directions': list(directions),
         }
 
+    def _iterate_all_game_objects(self):
+        """Lazily walk the game object, yielding each section of the save.
+
+        Unlike `_extract_all_game_objects`, no intermediate lists are built:
+        each section is a generator that walks the game's locations anew.
+
+        Return:
+            a generator of (section name, model or iterable of models) pairs,
+            in the same order as `_serialize_game_objects`
+        """
+        locations = self.game.locations
+        yield 'game', self.game
+        yield 'player', self.game.player
+        yield 'people', chain.from_iterable(
+            location.people for location in locations
+        )
+        yield 'genders', _unique(
+            person.gender
+            for location in locations for person in location.people
+        )
+        yield 'items', chain(
+            self.game.player.inventory,
+            chain.from_iterable(location.items for location in locations),
+        )
+        yield 'locations', iter(locations)
+        yield 'exits', chain.from_iterable(
+            location.exits for location in locations
+        )
+        yield 'directions', _unique(
+            exit.direction
+            for location in locations for exit in location.exits
+        )
+
+    def _iterate_serialized_game_objects(self):
+        """Lazily serialize all game objects, one section at a time.
+
+        Return:
+            a generator of (section name, content) pairs, where content is
+            either a serialized object or a generator of serialized objects,
+            such that at most one serialized object is held in memory at any
+            time
+        """
+        for section, content in self._iterate_all_game_objects():
+            if isinstance(content, BaseModel):
+                yield section, content.serialize()
+            else:
+                yield section, (obj.serialize() for obj in content)
+
     @staticmethod
     def _serialize_game_objects(
             game, player, people, genders, items, locations, exits, directions
@@ -104,3 +250,12 @@ class GameSaver:
             'directions': [direction.serialize() for direction in directions],
         }
         return content
+
+
+def _unique(objs):
+    """Yield each distinct object from the given iterable once, in order."""
+    seen = set()
+    for obj in objs:
+        if obj not in seen:
+            seen.add(obj)
+            yield obj
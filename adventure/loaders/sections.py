@@ -0,0 +1,28 @@
+"""The sections making up a save file.
+
+Kept apart from the modules reading save files (eg. the validator), so that
+any of them can refer to sections without importing the others.
+"""
+from adventure.models import (
+    Direction, Exit, Game, Gender, Item, Location, Person, Player
+)
+from adventure.models.base import get_model_ref
+
+
+# Sections holding a single object, rather than a list of objects
+SINGLE_SECTIONS = ('game', 'player')
+
+# Sections of a save file holding each type of model, keyed by model ref
+MODEL_SECTIONS = {
+    get_model_ref(model_cls): section
+    for model_cls, section in (
+        (Game, 'game'),
+        (Player, 'player'),
+        (Direction, 'directions'),
+        (Exit, 'exits'),
+        (Gender, 'genders'),
+        (Item, 'items'),
+        (Location, 'locations'),
+        (Person, 'people'),
+    )
+}
@@ -0,0 +1,371 @@
+"""Saved games held in SQLite databases.
+
+Each section of a save is a table named after it, with a row per object
+keyed by its `_identifier`. The single references an object holds (eg. the
+destination of an exit) are columns of their own, holding the identifier of
+the object referred to, and indexed so that the objects referring to any
+other can be queried; every other field is held as JSON in a `data` column.
+
+Rows are kept in the order they were first written, so that sections read
+back in the order they were saved.
+
+Databases are kept in write-ahead log mode, and a database opened for reading
+reads within a single transaction for as long as it stays open: a game
+lazily loaded from it keeps reading the snapshot it was loaded from, however
+the database is updated by delta saves since, and without blocking them.
+
+`sqlite3` is only imported once a database is opened, as it is slow to
+import and only needed for this format.
+"""
+import errno
+import json
+import os
+from collections.abc import Mapping
+from urllib.parse import quote
+
+from adventure.loaders.sections import SINGLE_SECTIONS
+from adventure.models import Direction, Gender, Location, Player
+from adventure.models.base import SerializedReference, get_model_ref
+
+
+# Tables, one per section of a save, in the order they are written
+SECTIONS = (
+    'game', 'player', 'people', 'genders', 'items', 'locations', 'exits',
+    'directions'
+)
+
+# Columns holding single references, as (field, model ref of the class
+# referred to) pairs, keyed by section
+REFERENCE_COLUMNS = {
+    section: tuple(
+        (field, get_model_ref(model_cls)) for field, model_cls in columns
+    )
+    for section, columns in (
+        ('game', (('player', Player),)),
+        ('player', (('location', Location),)),
+        ('people', (('gender', Gender),)),
+        ('exits', (('direction', Direction), ('destination', Location))),
+    )
+}
+
+
+def get_transaction_paths(file_path):
+    """Return the paths to the files SQLite keeps alongside a database.
+
+    These hold the rollback journal, the write-ahead log and its index, and
+    so belong to the database they were written for only.
+
+    Arguments:
+        file_path (str): path to a database
+
+    Return:
+        a tuple of paths, whether or not the files exist
+    """
+    return tuple(
+        '{}-{}'.format(file_path, suffix)
+        for suffix in ('journal', 'wal', 'shm')
+    )
+
+
+class SaveDatabase:
+    """A connection to the SQLite database of a saved game."""
+
+    def __init__(self, file_path, mode):
+        """Creates a new `SaveDatabase` instance, opening the database.
+
+        Arguments:
+            file_path (str): path to the database
+            mode (str): 'w' to create a new, empty database (replacing any
+                file at file_path), or 'r' or 'a' to open an existing one,
+                to read from (a snapshot, until closed) or update
+
+        Raises:
+            FileNotFoundError: if there is no database to read or update
+            ValueError: if the file is not the database of a saved game
+        """
+        import sqlite3
+
+        if mode != 'w' and not os.path.exists(file_path):
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), file_path
+            )
+        if mode == 'w':
+            for path in (file_path,) + get_transaction_paths(file_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            uri_mode = 'rwc'
+        else:
+            # Even when only reading, a database is opened for writing, so
+            # that SQLite can roll back a transaction interrupted by a crash
+            # and keep the index of its write-ahead log
+            uri_mode = 'rw'
+        # Transactions are begun and committed explicitly
+        self.connection = sqlite3.connect(
+            'file:{}?mode={}'.format(quote(file_path), uri_mode),
+            uri=True,
+            isolation_level=None
+        )
+        if mode == 'w':
+            self._set_journal_mode()
+            self._create_tables()
+            return
+
+        try:
+            self._set_journal_mode()
+            if mode == 'r':
+                # The transaction only begins with the first read, below
+                self.connection.execute('BEGIN')
+            tables = {
+                name for (name,) in self.connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+        except sqlite3.DatabaseError as error:
+            self.close()
+            raise ValueError('Not a SQLite save file ({})'.format(error))
+        if not tables.issuperset(SECTIONS):
+            self.close()
+            raise ValueError('Not a SQLite save file (missing tables)')
+
+    def write(self, sections):
+        """Write serialized objects in a single transaction.
+
+        Objects replace any object of the same section and identifier, and
+        are otherwise added after the rest.
+
+        Arguments:
+            sections (iterable): (section name, content) pairs, where content
+                is either a single serialized object (a dict) or an iterable
+                of serialized objects, consumed one at a time
+        """
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN')
+        try:
+            for section, content in sections:
+                if section not in SECTIONS:
+                    continue
+                columns = ['_identifier'] + [
+                    field for field, _ in REFERENCE_COLUMNS.get(section, ())
+                ] + ['data']
+                if section in SINGLE_SECTIONS:
+                    cursor.execute('DELETE FROM {}'.format(section))
+                if isinstance(content, dict):
+                    content = (content,)
+                cursor.executemany(
+                    'INSERT INTO {} ({}) VALUES ({}) ON CONFLICT (_identifier)'
+                    ' DO UPDATE SET {}'.format(
+                        section,
+                        ', '.join(columns),
+                        ', '.join('?' * len(columns)),
+                        ', '.join(
+                            '{0} = excluded.{0}'.format(column)
+                            for column in columns[1:]
+                        )
+                    ),
+                    (self._to_row(section, obj) for obj in content)
+                )
+            cursor.execute('COMMIT')
+        except BaseException:
+            cursor.execute('ROLLBACK')
+            raise
+
+    def read_sections(self):
+        """Read every serialized object, section by section.
+
+        Return:
+            a generator of (section name, serialized object) pairs
+        """
+        for section in SECTIONS:
+            for serialized in self._select(section, 'ORDER BY rowid'):
+                yield section, serialized
+
+    def read(self, section, identifier=None):
+        """Read a single serialized object.
+
+        Arguments:
+            section (str): the name of the section holding the object
+            identifier (int): the identifier of the object, in list sections
+
+        Return:
+            a serialized object
+
+        Raises:
+            KeyError: if no such object was saved
+        """
+        if identifier is None:
+            rows = self._select(section, 'LIMIT 1')
+        else:
+            rows = self._select(section, 'WHERE _identifier = ?', identifier)
+        for serialized in rows:
+            return serialized
+        raise KeyError((section, identifier))
+
+    def select(self, section, **references):
+        """Read the serialized objects of a section by what they refer to.
+
+        Queries are answered through the index of each reference column,
+        eg. `select('exits', destination=12)` reads the exits leading to
+        location 12.
+
+        Arguments:
+            section (str): the name of a section
+            references: identifiers of the objects referred to, keyed by
+                reference field
+
+        Return:
+            a list of serialized objects, in the order they were saved
+
+        Raises:
+            ValueError: if a field is not a reference column of the section
+        """
+        fields = [field for field, _ in REFERENCE_COLUMNS.get(section, ())]
+        for field in references:
+            if field not in fields:
+                raise ValueError(
+                    '{} holds no reference column {!r}'.format(section, field)
+                )
+        condition = ' AND '.join(
+            '{} = ?'.format(field) for field in references
+        )
+        return list(self._select(
+            section,
+            '{}ORDER BY rowid'.format(
+                'WHERE {} '.format(condition) if condition else ''
+            ),
+            *references.values()
+        ))
+
+    def has_object(self, section, identifier):
+        """Return whether an object of a list section was saved."""
+        return self.connection.execute(
+            'SELECT 1 FROM {} WHERE _identifier = ?'.format(section),
+            (identifier,)
+        ).fetchone() is not None
+
+    def get_identifiers(self, section, reverse=False):
+        """Generate the identifiers of the objects of a list section, in order
+        of identifier.
+        """
+        for (identifier,) in self.connection.execute(
+                'SELECT _identifier FROM {} ORDER BY _identifier {}'.format(
+                    section, 'DESC' if reverse else 'ASC'
+                )
+        ):
+            yield identifier
+
+    def count(self, section):
+        """Return the number of objects saved in a section."""
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM {}'.format(section)
+        ).fetchone()[0]
+
+    def close(self):
+        """Close the connection to the database."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _set_journal_mode(self):
+        # Readers then keep reading the database as it was when they began,
+        # rather than keeping it from being updated meanwhile
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+    def _create_tables(self):
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN')
+        for section in SECTIONS:
+            fields = [field for field, _ in REFERENCE_COLUMNS.get(section, ())]
+            cursor.execute(
+                'CREATE TABLE {} (_identifier INTEGER NOT NULL UNIQUE, {}'
+                'data TEXT NOT NULL)'.format(
+                    section,
+                    ''.join('{} INTEGER, '.format(field) for field in fields)
+                )
+            )
+            for field in fields:
+                cursor.execute('CREATE INDEX {0}_{1} ON {0} ({1})'.format(
+                    section, field
+                ))
+        cursor.execute('COMMIT')
+
+    def _select(self, section, clause, *parameters):
+        columns = REFERENCE_COLUMNS.get(section, ())
+        query = 'SELECT _identifier, {}data FROM {} {}'.format(
+            ''.join('{}, '.format(field) for field, _ in columns),
+            section,
+            clause
+        )
+        cursor = self.connection.execute(query, parameters)
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            # Decoding many objects at once is much faster than one by one
+            all_data = json.loads(
+                '[{}]'.format(', '.join(row[-1] for row in rows))
+            )
+            for row, data in zip(rows, all_data):
+                yield self._from_row(section, row, data)
+
+    @staticmethod
+    def _to_row(section, serialized):
+        data = dict(serialized)
+        row = [data.pop('_identifier', None)]
+        for field, _ in REFERENCE_COLUMNS.get(section, ()):
+            reference = data.pop(field, None)
+            row.append(None if reference is None else reference['identifier'])
+        row.append(json.dumps(data))
+        return row
+
+    @staticmethod
+    def _from_row(section, row, serialized):
+        serialized['_identifier'] = row[0]
+        for (field, model_ref), identifier in zip(
+                REFERENCE_COLUMNS.get(section, ()), row[1:-1]):
+            serialized[field] = (
+                None if identifier is None
+                else SerializedReference(model_ref, identifier)
+            )
+        return serialized
+
+
+class TableIndex(Mapping):
+    """The positions of the objects of a list section of a database, keyed by
+    identifier (as a str) in order of identifier, as `SaveFormat.read_index`
+    returns them.
+    """
+
+    def __init__(self, database, section):
+        """Creates a new `TableIndex` instance.
+
+        Arguments:
+            database (SaveDatabase): an open database
+            section (str): the name of a list section
+        """
+        self.database = database
+        self.section = section
+
+    def __getitem__(self, identifier):
+        try:
+            identifier = int(identifier)
+        except ValueError:
+            raise KeyError(identifier)
+        if not self.database.has_object(self.section, identifier):
+            raise KeyError(identifier)
+        return self.section, identifier
+
+    def __iter__(self):
+        for identifier in self.database.get_identifiers(self.section):
+            yield str(identifier)
+
+    def __reversed__(self):
+        for identifier in self.database.get_identifiers(
+                self.section, reverse=True):
+            yield str(identifier)
+
+    def __len__(self):
+        return self.database.count(self.section)
@@ -0,0 +1,140 @@
+import json
+import re
+
+
+WHITESPACE = re.compile(r'\s*')
+
+
+class JSONStreamReader:
+    """Incrementally decodes JSON values from a text file object.
+
+    Only as much of the file is held in memory as is needed to decode the
+    value currently being read, so that large documents can be consumed piece
+    by piece.
+    """
+
+    def __init__(self, stream_file, chunk_size=65536):
+        """Creates a new `JSONStreamReader` instance.
+
+        Arguments:
+            stream_file (file): a readable text file object
+            chunk_size (int): the number of characters to read at a time
+        """
+        self.stream_file = stream_file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.is_exhausted = False
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it.
+
+        Return:
+            a single character, or an empty string at the end of the file
+        """
+        self._skip_whitespace()
+        if self.position < len(self.buffer):
+            return self.buffer[self.position]
+        return ''
+
+    def expect(self, character):
+        """Consume the next non-whitespace character, which must match.
+
+        Arguments:
+            character (str): the expected character
+
+        Raises:
+            json.JSONDecodeError: if any other character is found
+        """
+        if self.peek() != character:
+            raise json.JSONDecodeError(
+                'Expecting {!r}'.format(character),
+                self.buffer,
+                self.position
+            )
+        self.position += 1
+
+    def decode_value(self):
+        """Decode and consume the next complete JSON value.
+
+        Return:
+            the decoded value
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(
+                    self.buffer,
+                    self.position
+                )
+            except json.JSONDecodeError:
+                if self._read_chunk():
+                    continue
+                raise
+            # A value reaching the end of the buffer (eg. a number) may
+            # continue in the next chunk.
+            if end == len(self.buffer) and self._read_chunk():
+                continue
+            self.position = end
+            return value
+
+    def _skip_whitespace(self):
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or not self._read_chunk():
+                return
+
+    def _read_chunk(self):
+        if self.is_exhausted:
+            return False
+        chunk = self.stream_file.read(self.chunk_size)
+        if not chunk:
+            self.is_exhausted = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+
+def iterate_sections(stream_file, chunk_size=65536):
+    """Incrementally read the top-level sections of a JSON object.
+
+    Each array-valued section is flattened, so that its elements are decoded
+    and yielded one at a time; any other value is yielded whole.
+
+    Arguments:
+        stream_file (file): a readable text file object containing a single
+            JSON object
+        chunk_size (int): the number of characters to read at a time
+
+    Return:
+        a generator of (section name, value) tuples
+    """
+    reader = JSONStreamReader(stream_file, chunk_size=chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.expect('}')
+        return
+
+    while True:
+        section = reader.decode_value()
+        reader.expect(':')
+        if reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield section, reader.decode_value()
+                    if reader.peek() != ',':
+                        break
+                    reader.expect(',')
+                reader.expect(']')
+        else:
+            yield section, reader.decode_value()
+
+        if reader.peek() != ',':
+            break
+        reader.expect(',')
+    reader.expect('}')
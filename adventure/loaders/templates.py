@@ -0,0 +1,125 @@
+"""Cached templates of saved worlds, from which new games are forked.
+
+Starting many games from the same save file (eg. a new game per session of
+a server) would otherwise read, parse and build the whole world every time.
+Instead, the world is loaded once as a template, kept for as long as the
+file stays the same, and every new game is a fork of it (see `Game.fork`):
+a copy-on-access clone, made in constant time whatever the size of the
+world.
+
+Templates are never handed out, and so never modified. A file is considered
+the same as long as its modification time and size (and those of its
+journal, or write-ahead log for SQLite databases) are unchanged; when they
+do change, the contents are hashed, so that a file merely touched or
+rewritten identically is not loaded again.
+"""
+import hashlib
+import os
+from collections import namedtuple
+
+from adventure.loaders.journal import get_journal_path
+
+
+# The stamp and digest of the file (and journal) a template was loaded from
+WorldTemplate = namedtuple('WorldTemplate', ('stamp', 'digest', 'game'))
+
+
+def get_paths(file_path):
+    """Return the paths to a save file and the files holding its changes.
+
+    Besides a journal, SQLite databases hold the changes committed since
+    they were last checkpointed in their write-ahead log.
+
+    Arguments:
+        file_path (str): path to a save file
+
+    Return:
+        a tuple of paths, whether or not the files exist
+    """
+    return file_path, get_journal_path(file_path), '{}-wal'.format(file_path)
+
+
+def get_stamp(file_path):
+    """Return the modification time and size of a save file and journal.
+
+    Arguments:
+        file_path (str): path to a save file
+
+    Return:
+        a hashable tuple, which changes whenever any of the files does
+
+    Raises:
+        OSError: if the save file cannot be found
+    """
+    stat = os.stat(file_path)
+    stamps = [(stat.st_mtime_ns, stat.st_size)]
+    for path in get_paths(file_path)[1:]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+def get_digest(file_path):
+    """Return a hash of the contents of a save file and journal.
+
+    Arguments:
+        file_path (str): path to a save file
+
+    Return:
+        a str of hexadecimal digits
+    """
+    digest = hashlib.sha256()
+    for path in get_paths(file_path):
+        # An empty write-ahead log is left whenever a database is opened
+        if not os.path.exists(path) or not os.path.getsize(path):
+            continue
+        with open(path, 'rb') as hashed_file:
+            for chunk in iter(lambda: hashed_file.read(1 << 20), b''):
+                digest.update(chunk)
+        # Keep the contents of the file and journal apart
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class TemplateCache(dict):
+    """Registry of the templates of saved worlds, keyed by file path and
+    loading mode.
+    """
+
+    def get_game(self, loader, file_name, stream=False, lazy=False):
+        """Return a new game forked from the template of a save file.
+
+        The template is loaded first if need be, or if the file changed
+        since it was loaded.
+
+        Arguments:
+            loader (GameLoader): the loader with which to load the template
+            file_name (str): name of the file to load (excluding extension)
+            stream (bool): whether to stream the file, when loading it
+            lazy (bool): whether to load the template lazily (see
+                `GameLoader.load`)
+
+        Return:
+            a Game object
+        """
+        file_path = loader.get_file_path(file_name)
+        key = (file_path, lazy)
+        stamp = get_stamp(file_path)
+        template = self.get(key)
+        if template is None or template.stamp != stamp:
+            digest = get_digest(file_path)
+            if template is None or template.digest != digest:
+                game = loader.load(file_name, stream=stream, lazy=lazy)
+                template = WorldTemplate(stamp, digest, game)
+            else:
+                template = template._replace(stamp=stamp)
+            self[key] = template
+        return template.game.fork()
+
+
+# Instantiate the TemplateCache "singleton" to use throughout the package
+templates = TemplateCache()
@@ -0,0 +1,442 @@
+"""Checking the integrity of saved games, without loading them.
+
+A `WorldValidator` reads the serialized objects of a save file in a single
+pass, as `SaveFormat.iterate_sections` generates them, indexing every
+identifier and reference along the way. Only then does it look for problems,
+so that every problem of a file is reported at once:
+
+- objects without an identifier, or sharing one with another object;
+- references to objects that do not exist, or of the wrong type;
+- locations the player cannot reach from where they stand;
+- items found in several places (eg. both in a location and the player's
+  inventory), and people found in several locations.
+
+Run with `python -m adventure.loaders.validator`, passing any number of save
+files, to validate them across a pool of processes.
+"""
+import argparse
+import os
+import sys
+from collections import namedtuple
+
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders.formats import formats
+from adventure.loaders.journal import (
+    apply_entries, get_journal_path, read_entries
+)
+from adventure.loaders.sections import MODEL_SECTIONS, SINGLE_SECTIONS
+
+
+# The references held by the objects of each section, as (field, section
+# referred to, whether the field holds a list of references) triples
+REFERENCE_FIELDS = {
+    'game': (('player', 'player', False), ('locations', 'locations', True)),
+    'player': (('location', 'locations', False), ('inventory', 'items', True)),
+    'people': (('gender', 'genders', False),),
+    'exits': (
+        ('direction', 'directions', False),
+        ('destination', 'locations', False),
+    ),
+    'locations': (
+        ('items', 'items', True),
+        ('people', 'people', True),
+        ('exits', 'exits', True),
+    ),
+}
+
+
+def is_identifier(value):
+    """Return whether a value read from a save file is an identifier."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def get_referred_section(reference):
+    """Return the section a reference read from a save file refers to, or
+    None if it names no model (eg. its model reference is not a string).
+    """
+    model_ref = reference.get('model_ref')
+    if not isinstance(model_ref, str):
+        return None
+    return MODEL_SECTIONS.get(model_ref)
+
+
+class Problem(namedtuple('Problem', ('section', 'identifier', 'message'))):
+    """A problem with a serialized object (or with a whole section, if its
+    identifier is None).
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        if self.identifier is None:
+            return '{}: {}'.format(self.section, self.message)
+        return '{} {}: {}'.format(self.section, self.identifier, self.message)
+
+
+class ValidationReport:
+    """The problems found in a save file."""
+
+    def __init__(self, file_path, problems):
+        """Creates a new `ValidationReport` instance.
+
+        Arguments:
+            file_path (str): path to the save file
+            problems (list): Problem objects, in the order they were found
+        """
+        self.file_path = file_path
+        self.problems = problems
+
+    @property
+    def is_valid(self):
+        return not self.problems
+
+
+class WorldValidator:
+    """Indexes the serialized objects of a saved game, then checks them."""
+
+    def __init__(self):
+        """Creates a new, empty `WorldValidator` instance."""
+        self.problems = []
+        # Sections holding a single object, as read
+        self.singles = {}
+        # Identifiers of the objects read, keyed by section
+        self.identifiers = {}
+        # (section, identifier, field, section referred to, identifier
+        # referred to) tuples, for every reference read
+        self.references = []
+        # Names of locations, and identifiers of the locations their exits
+        # lead to, keyed by identifier
+        self.location_names = {}
+        self.destinations = {}
+        self.location_exits = {}
+        # Descriptions of the places holding each item and person, keyed by
+        # identifier
+        self.item_holders = {}
+        self.person_holders = {}
+
+    def add(self, section, serialized):
+        """Index a serialized object.
+
+        Arguments:
+            section (str): the name of the section holding the object
+            serialized (dict): the serialized object
+        """
+        if not isinstance(serialized, dict):
+            self.problems.append(Problem(
+                section, None, 'holds a {} instead of an object'.format(
+                    type(serialized).__name__
+                )
+            ))
+            return
+
+        identifier = serialized.get('_identifier')
+        if identifier is not None and not is_identifier(identifier):
+            self.problems.append(Problem(section, None, (
+                'holds an object whose identifier {!r} is not an '
+                'integer'.format(identifier)
+            )))
+            return
+        if section in SINGLE_SECTIONS:
+            if section in self.singles:
+                self.problems.append(
+                    Problem(section, None, 'appears more than once')
+                )
+            self.singles[section] = serialized
+        elif identifier is None:
+            self.problems.append(Problem(section, None, (
+                'holds an object without an identifier'
+            )))
+            return
+        else:
+            identifiers = self.identifiers.setdefault(section, set())
+            if identifier in identifiers:
+                self.problems.append(Problem(
+                    section, identifier, 'shares its identifier with another'
+                ))
+            identifiers.add(identifier)
+
+        for field, target_section, is_list in REFERENCE_FIELDS.get(
+                section, ()):
+            references = serialized.get(field)
+            if not is_list:
+                references = [references]
+            elif not isinstance(references, list):
+                self.problems.append(Problem(
+                    section, identifier, '{} is not a list'.format(field)
+                ))
+                continue
+            for reference in references:
+                self._add_reference(
+                    section, identifier, field, target_section, reference
+                )
+
+        if section == 'locations':
+            self.location_names[identifier] = serialized.get('name')
+            self.location_exits[identifier] = list(
+                self._get_identifiers(serialized.get('exits'), 'exits')
+            )
+            holder = 'location {}'.format(identifier)
+            for holders, field in (
+                    (self.item_holders, 'items'),
+                    (self.person_holders, 'people'),
+            ):
+                for reference in self._get_identifiers(
+                        serialized.get(field), field):
+                    holders.setdefault(reference, []).append(holder)
+        elif section == 'exits':
+            destination = serialized.get('destination')
+            if isinstance(destination, dict) and is_identifier(
+                    destination.get('identifier')):
+                self.destinations[identifier] = destination['identifier']
+        elif section == 'player':
+            for reference in self._get_identifiers(
+                    serialized.get('inventory'), 'items'):
+                self.item_holders.setdefault(reference, []).append(
+                    "the player's inventory"
+                )
+
+    def _add_reference(self, section, identifier, field, target_section,
+                       reference):
+        if not isinstance(reference, dict) or not is_identifier(
+                reference.get('identifier')):
+            self.problems.append(Problem(
+                section, identifier, '{} holds {!r} instead of a '
+                'reference'.format(field, reference)
+            ))
+            return
+        referred_section = get_referred_section(reference)
+        if referred_section != target_section:
+            self.problems.append(Problem(
+                section, identifier, '{} refers to a {!r}, not to {}'.format(
+                    field, reference.get('model_ref'), target_section
+                )
+            ))
+            return
+        self.references.append((
+            section, identifier, field, target_section,
+            reference['identifier']
+        ))
+
+    @staticmethod
+    def _get_identifiers(references, target_section):
+        """Generate the identifiers referred to by a list of references to
+        a section, skipping anything else (reported as a problem on its own).
+        """
+        if not isinstance(references, list):
+            return
+        for reference in references:
+            if (
+                    isinstance(reference, dict)
+                    and is_identifier(reference.get('identifier'))
+                    and get_referred_section(reference) == target_section
+            ):
+                yield reference['identifier']
+
+    def get_problems(self):
+        """Check the objects indexed so far, and return every problem found.
+
+        Return:
+            a list of Problem objects
+        """
+        problems = list(self.problems)
+        for section in SINGLE_SECTIONS:
+            if section not in self.singles:
+                problems.append(Problem(section, None, 'is missing'))
+
+        for (section, identifier, field, target_section,
+                target_identifier) in self.references:
+            if target_section in SINGLE_SECTIONS:
+                target = self.singles.get(target_section)
+                exists = (
+                    target is not None
+                    and target.get('_identifier') == target_identifier
+                )
+            else:
+                exists = target_identifier in self.identifiers.get(
+                    target_section, ()
+                )
+            if not exists:
+                problems.append(Problem(
+                    section, identifier, '{} refers to missing {} {}'.format(
+                        field, target_section, target_identifier
+                    )
+                ))
+
+        problems.extend(self._get_unreachable_locations())
+        for section, holders_by_identifier in (
+                ('items', self.item_holders),
+                ('people', self.person_holders),
+        ):
+            for identifier, holders in holders_by_identifier.items():
+                if len(holders) > 1:
+                    problems.append(Problem(
+                        section, identifier, 'is held by {}'.format(
+                            ', '.join(holders)
+                        )
+                    ))
+        return problems
+
+    def _get_unreachable_locations(self):
+        """Generate a problem per location the player cannot reach."""
+        player = self.singles.get('player')
+        location = player.get('location') if player else None
+        if not isinstance(location, dict) or not is_identifier(
+                location.get('identifier')):
+            return
+        reached = {location['identifier']}
+        pending = list(reached)
+        while pending:
+            for exit_identifier in self.location_exits.get(pending.pop(), ()):
+                destination = self.destinations.get(exit_identifier)
+                if destination is not None and destination not in reached:
+                    reached.add(destination)
+                    pending.append(destination)
+        for identifier, name in self.location_names.items():
+            if identifier not in reached:
+                yield Problem('locations', identifier, (
+                    '{!r} cannot be reached from the player\'s '
+                    'location'.format(name)
+                ))
+
+
+def validate_sections(sections):
+    """Check the serialized objects of a saved game.
+
+    Arguments:
+        sections (iterable): (section name, serialized object) pairs, as
+            generated by `SaveFormat.iterate_sections`
+
+    Return:
+        a list of Problem objects
+    """
+    validator = WorldValidator()
+    for section, serialized in sections:
+        validator.add(section, serialized)
+    return validator.get_problems()
+
+
+def iterate_sections(serialized_objects):
+    """Generate the serialized objects of a saved game, section by section.
+
+    Arguments:
+        serialized_objects (dict): serialized objects keyed by section, as
+            returned by `SaveFormat.load`
+
+    Return:
+        a generator of (section name, serialized object) pairs, where list
+        sections are flattened into one pair per element
+    """
+    for section, content in serialized_objects.items():
+        if isinstance(content, list):
+            for serialized_obj in content:
+                yield section, serialized_obj
+        else:
+            yield section, content
+
+
+def validate_file(file_path):
+    """Check a save file, along with its journal (if any).
+
+    The format of the file is chosen by its extension. Failures to read the
+    file (or to replay its journal over it) are reported as a problem with
+    it, rather than raised, so that a single malformed file does not stop
+    others being checked. Any other exception is a bug of the validator,
+    and is raised.
+
+    Arguments:
+        file_path (str): path to the save file
+
+    Return:
+        a ValidationReport object
+    """
+    extension = os.path.splitext(file_path)[1].lstrip('.')
+    try:
+        save_format = formats.get_format(extension)
+        # Parsing a whole file at once is much faster than streaming it,
+        # and files are validated one at a time per process
+        with save_format.open(file_path, 'r') as load_file:
+            serialized_objects = save_format.load(load_file)
+        if not isinstance(serialized_objects, dict):
+            raise ValueError('holds a {} instead of sections'.format(
+                type(serialized_objects).__name__
+            ))
+        apply_entries(
+            serialized_objects,
+            read_entries(get_journal_path(file_path))
+        )
+    except (OSError, ValueError, UnsupportedFormatError) as error:
+        # Including `json.JSONDecodeError`, a `ValueError`
+        problems = [
+            Problem('file', None, 'cannot be read ({})'.format(error))
+        ]
+    except (KeyError, TypeError) as error:
+        # Data shapes that formats or journals cannot be read into
+        problems = [Problem('file', None, 'cannot be read ({}: {})'.format(
+            type(error).__name__, error
+        ))]
+    else:
+        problems = validate_sections(iterate_sections(serialized_objects))
+    return ValidationReport(file_path, problems)
+
+
+def validate_files(file_paths, processes=None):
+    """Check save files, across a pool of processes.
+
+    Arguments:
+        file_paths (list): paths to save files
+        processes (int | None): the number of worker processes (by default,
+            the number of CPUs); with a single process, files are checked in
+            this process
+
+    Return:
+        a list of ValidationReport objects, in the order of file_paths
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        return [validate_file(file_path) for file_path in file_paths]
+    # Imported here, as multiprocessing is slow to import and only needed to
+    # validate files in parallel
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Hand files out in a few chunks per worker, to keep workers busy
+    # without paying for a round trip per file
+    chunksize = max(1, len(file_paths) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(
+            executor.map(validate_file, file_paths, chunksize=chunksize)
+        )
+
+
+def main(argv=None):
+    """Check save files, and report their problems.
+
+    Arguments:
+        argv (list): command line arguments (by default, sys.argv)
+
+    Return:
+        an exit status: 0 if every file is valid, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        description='Check the integrity of saved games.'
+    )
+    parser.add_argument('files', nargs='+', help='save files')
+    parser.add_argument('--processes', type=int)
+    args = parser.parse_args(argv)
+
+    reports = validate_files(args.files, processes=args.processes)
+    invalid_count = 0
+    for report in reports:
+        if report.is_valid:
+            continue
+        invalid_count += 1
+        for problem in report.problems:
+            print('{}: {}'.format(report.file_path, problem))
+    print('{:,} file(s) checked, {:,} invalid'.format(
+        len(reports),
+        invalid_count
+    ))
+    return 1 if invalid_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
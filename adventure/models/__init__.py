@@ -1,5 +1,38 @@
-from adventure.models.game import Game
-from adventure.models.item import Item
-from adventure.models.location import Direction, Exit, Location
-from adventure.models.person import Gender, Person
-from adventure.models.player import Player
+"""Models making up a game.
+
+Models are imported from their submodules when first accessed, so that
+importing one of them (eg. `from adventure.models import Item`) does not
+import every other.
+"""
+from importlib import import_module
+
+
+# Submodule defining each model, relative to this package
+SUBMODULES = {
+    'Arena': 'arena',
+    'Game': 'game',
+    'Item': 'item',
+    'Direction': 'location',
+    'Exit': 'location',
+    'Location': 'location',
+    'Gender': 'person',
+    'Person': 'person',
+    'Player': 'player',
+}
+
+# Star imports list the lazily imported names, which are then imported
+__all__ = sorted(SUBMODULES)
+
+
+def __getattr__(name):
+    if name not in SUBMODULES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+    value = getattr(import_module('.' + SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
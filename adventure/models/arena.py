@@ -0,0 +1,207 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
+
+from adventure.exc import FrozenWorldError
+
+
+class Arena:
+    """Keeps track of the models of a single world.
+
+    Each world (typically, each loaded game) has an arena of its own, so that
+    any number of worlds can live in the same process. An arena maps the
+    identifiers of its models back to them, and tracks which of its models
+    changed since the world was last saved or loaded.
+
+    Identifiers are allocated through arenas, but are unique across the
+    process: models compare equal by class and identifier, so that models of
+    different worlds (eg. an item built outside of any world, and then put
+    in one) must never share an identifier.
+
+    Models join the arena active in the current context (a thread or an
+    asyncio task) when they are instantiated; see `activate`.
+
+    Worlds forked from this one (see `add_fork`) read the models they have
+    not copied yet from this one, which is therefore frozen for as long as
+    any of them lives: modifying its models raises `FrozenWorldError`.
+    """
+
+    def __init__(self):
+        """Creates a new, empty `Arena` instance."""
+        # Identity maps of models keyed by identifier, keyed by model class.
+        # Models are weakly held, so that discarded models need never be
+        # removed.
+        self.objects = {}
+        # Models modified since they were last saved or loaded, in order of
+        # modification
+        self.dirty = WeakKeyDictionary()
+        # Locations whose exits changed, mapped to the value of `map_version`
+        # as of their latest change; only tracked once `track_map_changes`
+        # is called, so that worlds nobody navigates do not pay for it
+        self.map_version = 0
+        self.map_changes = None
+        # Objects standing for the live worlds forked from this one (see
+        # `add_fork`), weakly held, once forked
+        self.forks = None
+        # The number of loads in progress (see `loading`)
+        self.loads = 0
+
+    def allocate(self, model_cls):
+        """Return a new identifier for a model.
+
+        Arguments:
+            model_cls (type): the class of the model
+
+        Return:
+            an int, never returned before for model_cls by any arena
+        """
+        counter = counters.get(model_cls)
+        if counter is None:
+            counter = counters.setdefault(model_cls, count(1))
+        return next(counter)
+
+    def reserve(self, model_cls, identifier):
+        """Keep an identifier from being allocated.
+
+        Reserving (as done when loading a saved world) is not meant to race
+        with allocation from other threads.
+
+        Arguments:
+            model_cls (type): the class of the model
+            identifier (int): an identifier assigned by other means
+        """
+        counter = counters.get(model_cls)
+        next_identifier = 1 if counter is None else next(counter)
+        counters[model_cls] = count(max(next_identifier, identifier + 1))
+
+    def register(self, obj):
+        """Add a model to the identity map.
+
+        Arguments:
+            obj (BaseModel): a model with an identifier from this arena
+        """
+        model_objects = self.objects.get(type(obj))
+        if model_objects is None:
+            model_objects = self.objects.setdefault(
+                type(obj),
+                WeakValueDictionary()
+            )
+        model_objects[obj._identifier] = obj
+
+    def unregister(self, obj):
+        """Remove a model from the identity map and from the dirty models.
+
+        Arguments:
+            obj (BaseModel): a model of this arena
+
+        Return:
+            whether obj was dirty
+        """
+        model_objects = self.objects.get(type(obj))
+        if model_objects is not None:
+            model_objects.pop(obj._identifier, None)
+        return self.dirty.pop(obj, False) is None
+
+    def get(self, model_cls, identifier):
+        """Return the model with the given class and identifier, if any.
+
+        Arguments:
+            model_cls (type): the class of the model
+            identifier (int): the identifier of the model
+
+        Return:
+            a model object, or None
+        """
+        model_objects = self.objects.get(model_cls)
+        if model_objects is None:
+            return None
+        return model_objects.get(identifier)
+
+    def track_map_changes(self):
+        """Start recording which locations have their exits changed."""
+        if self.map_changes is None:
+            self.map_changes = WeakKeyDictionary()
+
+    def record_map_change(self, location):
+        """Record that the exits of a location changed, if tracking changes.
+
+        Arguments:
+            location (Location): a location of this arena's world
+        """
+        if self.map_changes is not None:
+            self.map_version += 1
+            self.map_changes[location] = self.map_version
+
+    def add_fork(self, fork):
+        """Freeze this arena for as long as a world forked from it lives.
+
+        The world is stood for by an object that lives exactly as long as it
+        (eg. the `ForkResolver` held by a forked game), and is weakly held,
+        so that this arena thaws as soon as the last fork is dropped.
+
+        Arguments:
+            fork (object): an object standing for a world forked from this
+                one
+        """
+        if self.forks is None:
+            self.forks = WeakSet()
+        self.forks.add(fork)
+
+    @property
+    def is_frozen(self):
+        """Whether the models of this arena may not be modified, as live
+        worlds were forked from it.
+        """
+        return bool(self.forks) and not self.loads
+
+    def check_modifiable(self):
+        """Raise an exception if the models of this arena may not be
+        modified.
+
+        Raises:
+            FrozenWorldError: if live worlds were forked from this one
+        """
+        if self.forks and not self.loads:
+            raise FrozenWorldError(
+                'A world cannot be modified once forked; modify the fork'
+            )
+
+    @contextmanager
+    def loading(self):
+        """Let models be built and loaded within a `with` block, even while
+        this arena is frozen.
+
+        Loading the models of a world (eg. lazily, as they are reached) only
+        builds what was saved, which worlds forked from it would read all
+        the same.
+        """
+        self.loads += 1
+        try:
+            yield self
+        finally:
+            self.loads -= 1
+
+    @contextmanager
+    def activate(self):
+        """Make models instantiated within a `with` block join this arena."""
+        token = active_arena.set(self)
+        try:
+            yield self
+        finally:
+            active_arena.reset(token)
+
+
+# Identifier counters, keyed by model class, shared by every arena. Drawing
+# from an `itertools.count` is atomic, so allocation needs no lock.
+counters = {}
+
+# The arena to which models join when instantiated outside of any world
+default_arena = Arena()
+
+active_arena = ContextVar('active_arena', default=default_arena)
+
+
+def get_arena():
+    """Return the arena active in the current context."""
+    return active_arena.get()
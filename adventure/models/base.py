@@ -1,29 +1,152 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from adventure.models.arena import default_arena, get_arena
+from adventure.models.flyweights import flyweights
 
 
 class BaseModel(ABC):
-    """A base model providing common functionality expected of all models."""
+    """A base model providing common functionality expected of all models.
+
+    Models that exist in large numbers declare `__slots__` to do without a
+    per-instance `__dict__`; others (eg. `Game`) keep one.
+    """
+
+    # Weak references are needed by the arena's identity map
+    __slots__ = ('_identifier', '_arena', '__weakref__')
 
-    # Class attribute to track the number of instantiated objects of this
-    # particular class.
-    COUNT = 0
+    # Names of attributes that are not part of the saved state of a model,
+    # and so do not make it dirty when set
+    UNTRACKED_ATTRIBUTES = frozenset()
 
     def __init__(self, _identifier=None):
         """Create a new instance of this class.
 
-        Increment the COUNT for this class, and assign the latest value to the
-        `_identifier` attribute. Though not guaranteed to be unique, this
-        should function as a poor-man's auto-incrementing primary key.
+        The object joins the arena active in the current context, which
+        allocates its `_identifier` unless one is given (in which case the
+        arena reserves it), and maps the identifier back to the object.
 
         Arguments:
             _identifier (int): an optional unique identifier for this object
         """
+        arena = get_arena()
+        object.__setattr__(self, '_arena', arena)
         if _identifier is not None:
-            self._identifier = _identifier
-            self.__class__.COUNT = max(self._identifier, self.__class__.COUNT)
+            arena.reserve(type(self), _identifier)
         else:
-            self.__class__.COUNT += 1
-            self._identifier = self.__class__.COUNT
+            _identifier = arena.allocate(type(self))
+        self._identifier = _identifier
+        arena.register(self)
+
+    def __setattr__(self, name, value):
+        tracked = name not in self.UNTRACKED_ATTRIBUTES
+        if tracked:
+            self.check_modifiable()
+            if isinstance(value, BaseModel):
+                self.take_in(value)
+        super().__setattr__(name, value)
+        if tracked:
+            self.mark_dirty()
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for name in get_state_slots(type(self)):
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        # Unpickled and copied objects join the arena active in the current
+        # context, like new objects, keeping their identifier
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        arena = get_arena()
+        object.__setattr__(self, '_arena', arena)
+        arena.reserve(type(self), self._identifier)
+        arena.register(self)
+
+    @property
+    def arena(self):
+        """The arena of the world to which this object belongs."""
+        return self._arena
+
+    @property
+    def is_dirty(self):
+        """Whether this object changed since it was last saved or loaded."""
+        return self in self._arena.dirty
+
+    def mark_dirty(self):
+        """Flag this object as changed since it was last saved or loaded.
+
+        New objects are dirty, as are objects whose attributes are set, or
+        whose list attributes are modified.
+        """
+        # Objects can only be tracked once they have an identifier
+        if getattr(self, '_identifier', None) is not None:
+            self._arena.check_modifiable()
+            self._arena.dirty[self] = None
+
+    def mark_contents_changed(self):
+        """Record that a model held by this object changed.
+
+        Changes to held models are not changes to this object, which stays
+        clean. Models deriving state from the models they hold (eg.
+        `Location`) override this to keep up with them.
+        """
+
+    def check_modifiable(self):
+        """Raise an exception if this object may not be modified.
+
+        Raises:
+            FrozenWorldError: if live worlds were forked from the world of
+                this object (see `Game.fork`)
+        """
+        arena = getattr(self, '_arena', None)
+        # Only worlds forked from are ever frozen
+        if arena is not None and arena.forks:
+            if getattr(self, '_identifier', None) is not None:
+                arena.check_modifiable()
+
+    def take_in(self, obj):
+        """Move a model built outside of any world into this object's world.
+
+        Models instantiated outside of any world (see `Arena.activate`) join
+        the world of the first model of a world holding them (eg. an item put
+        in a location, or a new direction given to an exit), along with the
+        models they hold in turn, so that the world saves them when changed.
+        Canonical instances (see `adventure.models.flyweights`) are shared
+        by every world, and stay out of them.
+
+        Arguments:
+            obj (BaseModel): a model held by this object
+        """
+        arena = getattr(self, '_arena', None)
+        if arena is None or arena is default_arena:
+            return
+        pending = [obj]
+        while pending:
+            obj = pending.pop()
+            if getattr(obj, '_arena', None) is not default_arena:
+                continue
+            if flyweights.is_canonical(obj):
+                continue
+            is_dirty = default_arena.unregister(obj)
+            object.__setattr__(obj, '_arena', arena)
+            arena.register(obj)
+            if is_dirty:
+                arena.dirty[obj] = None
+            for value in obj.__getstate__().values():
+                if isinstance(value, BaseModel):
+                    pending.append(value)
+                elif isinstance(value, list):
+                    pending.extend(
+                        held for held in list.__iter__(value)
+                        if isinstance(held, BaseModel)
+                    )
+
+    def mark_clean(self):
+        """Flag this object as unchanged since it was last saved or loaded."""
+        self._arena.dirty.pop(self, None)
 
     @abstractmethod
     def serialize(self):
@@ -37,18 +160,23 @@ class BaseModel(ABC):
     @property
     def reference(self):
         """Return a SerializedReference to represent this object."""
-        module_path = '{module}.{cls}'.format(
-            module=self.__module__,
-            cls=self.__class__.__name__
-        )
-        return SerializedReference(module_path, self._identifier)
+        return SerializedReference(get_model_ref(type(self)), self._identifier)
 
     def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            # Let other objects (eg. a LazyReference) compare themselves
+            return NotImplemented
         return (
-            isinstance(other, type(self))
+            type(other) is type(self)
             and self._identifier == other._identifier
         )
 
+    def __hash__(self):
+        # Models are keyed on their class and identifier, consistently with
+        # __eq__, so that they may be used in sets and as dictionary keys. An
+        # object's `_identifier` must not change while it is hashed.
+        return hash((self.__class__, self._identifier))
+
     def __neq__(self, other):
         return not self.__eq__(other)
 
@@ -86,3 +214,96 @@ class SerializedReference(dict):
             model_ref=self['model_ref'],
             identifier=self['identifier']
         )
+
+
+class LazyReference:
+    """Stands in for a model object that has not been instantiated yet.
+
+    A `LazyReference` compares and hashes equal to the object it stands in
+    for, so that it can be held in collections alongside model objects. The
+    attribute or collection holding it is expected to call `resolve` to
+    substitute the actual object the first time it is accessed.
+    """
+
+    __slots__ = ('model_cls', 'identifier', 'resolver')
+
+    def __init__(self, model_cls, identifier, resolver):
+        """Creates a new `LazyReference` instance.
+
+        Arguments:
+            model_cls (type): the class of the object referenced
+            identifier (int): a unique identifier for the object referenced
+            resolver (callable): a function accepting model_cls and
+                identifier, and returning the object referenced
+        """
+        self.model_cls = model_cls
+        self.identifier = identifier
+        self.resolver = resolver
+
+    def resolve(self):
+        """Return the object referenced, instantiating it if need be."""
+        return self.resolver(self.model_cls, self.identifier)
+
+    @property
+    def reference(self):
+        """Return a SerializedReference to represent the object referenced."""
+        return SerializedReference(
+            get_model_ref(self.model_cls),
+            self.identifier
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, LazyReference):
+            return (
+                other.model_cls is self.model_cls
+                and other.identifier == self.identifier
+            )
+        return (
+            type(other) is self.model_cls
+            and other._identifier == self.identifier
+        )
+
+    def __hash__(self):
+        return hash((self.model_cls, self.identifier))
+
+    def __str__(self):
+        return '<LazyReference: {model} {identifier}>'.format(
+            model=self.model_cls.__name__,
+            identifier=self.identifier
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+
+@lru_cache(maxsize=None)
+def get_state_slots(model_cls):
+    """Return the names of the slots holding the state of a model class.
+
+    Arguments:
+        model_cls (type): a model class
+
+    Return:
+        a tuple of slot names, from all classes of the model's MRO
+    """
+    return tuple(
+        name
+        for cls in model_cls.__mro__
+        for name in cls.__dict__.get('__slots__', ())
+        if name not in ('_arena', '_holders', '__weakref__')
+    )
+
+
+def get_model_ref(model_cls):
+    """Return the dot-delimited path to a model class.
+
+    Arguments:
+        model_cls (type): a model class
+
+    Return:
+        a str, as used by SerializedReference
+    """
+    return '{module}.{cls}'.format(
+        module=model_cls.__module__,
+        cls=model_cls.__name__
+    )
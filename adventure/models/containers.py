@@ -0,0 +1,419 @@
+from weakref import ref
+
+from adventure.models.base import BaseModel, LazyReference
+
+
+class TrackedList(list):
+    """A list that notifies the model owning it whenever it is modified.
+
+    This allows a model to notice changes to its list attributes (eg. items
+    being added to a location) as well as to its other attributes, and to
+    refuse them before they are made (see `BaseModel.check_modifiable`).
+    Models added to the list join the world of its owner if they were built
+    outside of any (see `BaseModel.take_in`). Copies of a `TrackedList` are
+    detached from its owner.
+
+    The owner is weakly held, so that the list and its owner form no
+    reference cycle, and models holding lists are freed as soon as they are
+    dropped (which lets a world thaw as soon as its forks are dropped).
+    """
+
+    def __init__(self, iterable=(), owner=None):
+        """Create a new `TrackedList` instance.
+
+        Arguments:
+            iterable (iterable): optional initial contents of the list
+            owner (BaseModel): an optional model to mark as dirty whenever
+                the list is modified
+        """
+        super().__init__(iterable)
+        self._owner_ref = None if owner is None else ref(owner)
+
+    @property
+    def owner(self):
+        """The model owning this list, if any and still alive."""
+        owner_ref = self._owner_ref
+        return None if owner_ref is None else owner_ref()
+
+    def adopt(self, owner):
+        """Make the given model the owner of this list, unless it has one.
+
+        Models call this when unpickled or copied, as their lists are then
+        detached from them.
+
+        Arguments:
+            owner (BaseModel): the model holding this list
+        """
+        if self.owner is None:
+            self._owner_ref = ref(owner)
+
+    def _changing(self):
+        owner = self.owner
+        if owner is not None:
+            owner.check_modifiable()
+
+    def _changed(self):
+        owner = self.owner
+        if owner is not None:
+            owner.mark_dirty()
+
+    def _taking_in(self, objs):
+        owner = self.owner
+        if owner is not None:
+            for obj in objs:
+                if isinstance(obj, BaseModel):
+                    owner.take_in(obj)
+
+    def append(self, obj):
+        self._changing()
+        self._taking_in((obj,))
+        super().append(obj)
+        self._changed()
+
+    def extend(self, iterable):
+        self._changing()
+        objs = list(iterable)
+        self._taking_in(objs)
+        super().extend(objs)
+        self._changed()
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def remove(self, obj):
+        self._changing()
+        super().remove(obj)
+        self._changed()
+
+    def pop(self, position=-1):
+        self._changing()
+        obj = super().pop(position)
+        self._changed()
+        return obj
+
+    def insert(self, position, obj):
+        self._changing()
+        self._taking_in((obj,))
+        super().insert(position, obj)
+        self._changed()
+
+    def clear(self):
+        self._changing()
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        self._changing()
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        self._changing()
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, position, value):
+        self._changing()
+        if isinstance(position, slice):
+            value = list(value)
+            self._taking_in(value)
+        else:
+            self._taking_in((value,))
+        super().__setitem__(position, value)
+        self._changed()
+
+    def __delitem__(self, position):
+        self._changing()
+        super().__delitem__(position)
+        self._changed()
+
+    def __imul__(self, count):
+        self._changing()
+        result = super().__imul__(count)
+        self._changed()
+        return result
+
+    def __copy__(self):
+        return self.__class__(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+
+class LazyList(TrackedList):
+    """A `TrackedList` that may hold `LazyReference` placeholders.
+
+    Each placeholder is resolved, and replaced by the object it stands in
+    for, the first time it is accessed by position or by iteration. Since
+    placeholders compare equal to the objects they stand in for, membership
+    tests and comparisons do not resolve them.
+    """
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [
+                self[index] for index in range(*position.indices(len(self)))
+            ]
+
+        obj = super().__getitem__(position)
+        if isinstance(obj, LazyReference):
+            obj = obj.resolve()
+            # Resolving a placeholder is not a modification
+            list.__setitem__(self, position, obj)
+        return obj
+
+    def __iter__(self):
+        position = 0
+        while position < len(self):
+            yield self[position]
+            position += 1
+
+
+class IndexedList(TrackedList):
+    """A list that maintains a lookup table of its contents by key.
+
+    The index is built the first time a lookup is performed, and is then kept
+    up to date as objects are appended to or removed from the list, so that
+    lookups take constant time regardless of the size of the list. Membership
+    tests (`in`) are answered from the same table, so contained objects must
+    be hashable. Mutations that reorder or replace contents wholesale (eg.
+    `insert`, `sort`, slice assignment) discard the index, to be rebuilt on
+    the next lookup.
+
+    Removing an object still takes linear time, as the list keeps its order
+    (in which contents are listed to the player and saved): the object is
+    found by scanning the list, and the objects after it are shifted down.
+
+    When several objects share a key, the one added last takes precedence.
+    Objects whose keys change while in a list must report it through
+    `keys_changed`, which reindexes them (and them only).
+    """
+
+    def __init__(self, iterable=(), owner=None):
+        """Create a new `IndexedList` instance.
+
+        Arguments:
+            iterable (iterable): optional initial contents of the list
+            owner (BaseModel): an optional model to mark as dirty whenever
+                the list is modified
+        """
+        super().__init__(iterable, owner=owner)
+        self._index = None
+        self._counts = None
+        # The keys each object was indexed under, keyed by object
+        self._keys = None
+
+    @staticmethod
+    def index_keys(obj):
+        """Return the keys by which the given object can be looked up.
+
+        Arguments:
+            obj (object): an object contained by this list
+
+        Return:
+            an iterable of hashable keys
+        """
+        raise NotImplementedError()
+
+    def keys_changed(self, obj):
+        """Index an object anew under its current keys, if the index holds it.
+
+        Call this after changing an attribute of obj that `index_keys` reads
+        (eg. renaming an object held by a `NamedObjectList`).
+
+        Arguments:
+            obj (object): an object, held by this list or not
+        """
+        if not self._is_indexed() or obj not in self._counts:
+            return
+        count = self._counts[obj]
+        for _ in range(count):
+            self._remove_from_index(obj)
+        for _ in range(count):
+            self._add_to_index(obj)
+
+    def find(self, key):
+        """Return the object indexed under the given key.
+
+        Arguments:
+            key (hashable): a key, as returned by `index_keys`
+
+        Return:
+            the matching object, or None
+        """
+        if not self._is_indexed():
+            self._build_index()
+        bucket = self._index.get(key)
+        return bucket[-1] if bucket else None
+
+    def __contains__(self, obj):
+        if not self._is_indexed():
+            self._build_index()
+        return obj in self._counts
+
+    def _is_indexed(self):
+        return self._index is not None
+
+    def _build_index(self):
+        self._index = {}
+        self._counts = {}
+        self._keys = {}
+        for obj in self:
+            self._add_to_index(obj)
+
+    def _add_to_index(self, obj):
+        count = self._counts.get(obj, 0)
+        self._counts[obj] = count + 1
+        if count:
+            keys = self._keys[obj]
+        else:
+            keys = self._keys[obj] = tuple(self.index_keys(obj))
+        for key in keys:
+            self._index.setdefault(key, []).append(obj)
+
+    def _remove_from_index(self, obj):
+        keys = self._keys[obj]
+        if self._counts[obj] == 1:
+            del self._counts[obj]
+            del self._keys[obj]
+        else:
+            self._counts[obj] -= 1
+        for key in keys:
+            bucket = self._index[key]
+            for position in range(len(bucket) - 1, -1, -1):
+                if bucket[position] is obj:
+                    del bucket[position]
+                    break
+            if not bucket:
+                del self._index[key]
+
+    def _invalidate_index(self):
+        self._index = None
+        self._counts = None
+        self._keys = None
+
+    def append(self, obj):
+        super().append(obj)
+        if self._is_indexed():
+            self._add_to_index(obj)
+
+    def extend(self, iterable):
+        objs = list(iterable)
+        super().extend(objs)
+        if self._is_indexed():
+            for obj in objs:
+                self._add_to_index(obj)
+
+    def remove(self, obj):
+        # Unindex the object actually held by the list, which may be equal to
+        # (but not the same instance as) the given object.
+        if self._is_indexed() and obj not in self._counts:
+            raise ValueError('{!r} is not in list'.format(obj))
+        self.pop(self.index(obj))
+
+    def pop(self, position=-1):
+        obj = super().pop(position)
+        if self._is_indexed():
+            self._remove_from_index(obj)
+        return obj
+
+    def insert(self, position, obj):
+        super().insert(position, obj)
+        self._invalidate_index()
+
+    def clear(self):
+        super().clear()
+        self._invalidate_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_index()
+
+    def __setitem__(self, position, value):
+        super().__setitem__(position, value)
+        self._invalidate_index()
+
+    def __delitem__(self, position):
+        super().__delitem__(position)
+        self._invalidate_index()
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._invalidate_index()
+        return result
+
+
+class NamedObjectList(IndexedList):
+    """An `IndexedList` of named models (see `adventure.models.named`),
+    looked up by name or synonym name.
+
+    Objects indexed by the list remember it, reindex themselves in it when
+    renamed, and report any other change to them through it to the model
+    owning it (see `BaseModel.mark_contents_changed`).
+    """
+
+    # The attributes of contained objects read by `index_keys`
+    KEY_ATTRIBUTES = frozenset(('name', 'synonym_names'))
+
+    @staticmethod
+    def index_keys(obj):
+        return [obj.name] + list(obj.synonym_names)
+
+    def watch(self):
+        """Index the list now, unless it already is, so that changes to the
+        objects it holds are reported from now on.
+        """
+        if not self._is_indexed():
+            self._build_index()
+
+    def contents_changed(self, obj):
+        """Report a change to an object held by this list to its owner.
+
+        Arguments:
+            obj (NamedModel): the object that changed
+        """
+        owner = self.owner
+        if owner is not None:
+            owner.mark_contents_changed()
+
+    def _add_to_index(self, obj):
+        super()._add_to_index(obj)
+        obj.add_holder(self)
+
+    def _remove_from_index(self, obj):
+        super()._remove_from_index(obj)
+        if obj not in self._counts:
+            obj.remove_holder(self)
+
+
+class SynonymList(TrackedList):
+    """A `TrackedList` of the synonym names of a named model, which has the
+    lists indexing the model reindex it whenever modified in place.
+    """
+
+    def _changed(self):
+        super()._changed()
+        owner = self.owner
+        if owner is not None:
+            owner.keys_changed()
+
+
+class ExitList(IndexedList):
+    """An `IndexedList` of exits looked up by their direction's name or
+    abbreviation.
+    """
+
+    @staticmethod
+    def index_keys(exit):
+        return [exit.direction.name, exit.direction.abbrev]
+
+    def _changed(self):
+        super()._changed()
+        owner = self.owner
+        if owner is not None:
+            owner.mark_exits_changed()
@@ -0,0 +1,88 @@
+from adventure.models.arena import get_arena
+
+
+class FlyweightRegistry(dict):
+    """Registry of canonical model instances shared by every world.
+
+    Models such as directions and genders are identical across most games. A
+    canonical instance is registered under its serialized content (identifier
+    included), so that loading a game can reuse it instead of building a copy
+    of its own whenever the saved content matches.
+
+    Canonical instances are shared between worlds, and must not be modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Functions registering canonical instances, called on first lookup
+        self.sources = []
+        # The ids of canonical instances, which the registry keeps alive
+        self.instance_ids = set()
+
+    def add_source(self, source):
+        """Add a function registering canonical instances when first needed.
+
+        Arguments:
+            source (callable): a function taking no arguments, which
+                registers canonical instances with `register`
+        """
+        self.sources.append(source)
+
+    def register(self, obj):
+        """Make obj the canonical instance for its content.
+
+        Arguments:
+            obj (BaseModel): a model whose serialized form holds no references
+        """
+        self[self.get_key(type(obj), obj.serialize())] = obj
+        self.instance_ids.add(id(obj))
+
+    def is_canonical(self, obj):
+        """Return whether obj is a canonical instance, shared by every world.
+
+        Arguments:
+            obj (BaseModel): any model
+        """
+        self._add_sources()
+        return id(obj) in self.instance_ids
+
+    def intern(self, model_cls, serialized):
+        """Return the canonical instance matching a serialized model.
+
+        If no canonical instance matches, a new instance is built in the
+        active arena instead. Either way, the identifier is reserved in the
+        active arena, so that no model of that world may reuse it.
+
+        Arguments:
+            model_cls (type): the class of the serialized model
+            serialized (dict): a serialized model holding no references
+
+        Return:
+            an instance of model_cls
+        """
+        self._add_sources()
+        obj = self.get(self.get_key(model_cls, serialized))
+        if obj is None:
+            return model_cls(**serialized)
+        get_arena().reserve(model_cls, obj._identifier)
+        return obj
+
+    def _add_sources(self):
+        while self.sources:
+            self.sources.pop(0)()
+
+    @staticmethod
+    def get_key(model_cls, serialized):
+        """Return the key under which a serialized model is registered.
+
+        Arguments:
+            model_cls (type): the class of the serialized model
+            serialized (dict): a serialized model holding no references
+
+        Return:
+            a hashable tuple
+        """
+        return (model_cls, tuple(sorted(serialized.items())))
+
+
+flyweights = FlyweightRegistry()
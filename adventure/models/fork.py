@@ -0,0 +1,269 @@
+"""Copy-on-access forking of games, for undo and state-space search.
+
+Forking a game creates a new world, with an arena of its own, that initially
+shares every object of the original world. Objects are copied into the fork
+the first time they are reached through it: the player when `Game.player` is
+accessed, a location (along with its items, people and exits) when it is
+entered or otherwise accessed, and so on. Forking is therefore a constant
+time operation, and a fork only ever holds copies of the parts of the world
+it has visited.
+
+Until then, the fork holds `LazyReference` placeholders, resolved by a
+`ForkResolver`. Copies keep the identifiers of the objects they copy.
+Directions and genders are never modified, and so are shared rather than
+copied.
+
+Since unvisited objects are read from the original world when they are first
+reached, the original world must not be modified once forked: play on the
+fork, and keep the original as a snapshot (eg. to undo back to). This is
+enforced: the arena of the original world stays frozen (see
+`Arena.add_fork`) for as long as any of its forks lives. A fork lives as
+long as its game: placeholders hold the resolver of the fork weakly, and
+raise `ReferenceError` once the game is dropped.
+
+Forks of forks (eg. successive undo checkpoints) read unvisited objects from
+every fork they descend from, nearest first, and then from the original
+game. Once `MAX_FORK_DEPTH` forks separate a fork from the original game,
+the fork copies every object of those forks up front instead, and descends
+from the original game alone, so that chains of forks never keep more than
+that many forks alive, nor search more than that many worlds for an object.
+"""
+from copy import copy
+from functools import partial
+from weakref import ref
+
+from adventure.models.arena import Arena
+from adventure.models.base import LazyReference
+from adventure.models.containers import (
+    ExitList, LazyList, NamedObjectList, SynonymList
+)
+from adventure.models.item import Item
+from adventure.models.location import Exit, Location
+from adventure.models.person import Person
+from adventure.models.player import Player
+
+
+# The number of forks a fork may descend from before it collapses them
+MAX_FORK_DEPTH = 8
+
+# The models copied into forks; others (directions and genders) are shared
+COPIED_MODELS = (Player, Location, Item, Person, Exit)
+
+
+def resolve_in_fork(resolver_ref, model_cls, identifier):
+    """Resolve a placeholder held by a fork, through a weak reference to
+    the resolver of the fork.
+
+    Arguments:
+        resolver_ref (weakref.ref): a reference to a `ForkResolver`
+        model_cls (type): a model class
+        identifier (int): the identifier of an object of that class
+
+    Return:
+        an instance of model_cls, belonging to the fork
+
+    Raises:
+        ReferenceError: if the game of the fork was dropped
+    """
+    resolver = resolver_ref()
+    if resolver is None:
+        raise ReferenceError('The forked game was dropped')
+    return resolver.resolve(model_cls, identifier)
+
+
+class ForkResolver:
+    """Copies objects of a forked world into the fork as they are needed."""
+
+    def __init__(self, game):
+        """Creates a new `ForkResolver` instance.
+
+        Arguments:
+            game (Game): the game to fork
+        """
+        self.game = game
+        parent = getattr(game, 'fork_resolver', None)
+        if parent is None:
+            # The original game, from which every fork of it descends
+            self.root = game
+            # Placeholders held by the original world, keyed by class and
+            # identifier, for objects it has not built (eg. locations of a
+            # lazily loaded game)
+            self.root_sources = {}
+            # The resolvers of the forks this one descends from, nearest
+            # first
+            self.layers = ()
+        else:
+            self.root = parent.root
+            self.root_sources = parent.root_sources
+            self.layers = (parent,) + parent.layers
+        self.arena = Arena()
+        # Copies are weakly held by the identity map of the fork's arena; the
+        # resolver holds them strongly, so that a copy reached and modified
+        # once is not dropped and copied afresh when reached again
+        self.copies = []
+        # Placeholders resolve through a weak reference, so that the objects
+        # of the fork hold no reference cycle through the resolver, which
+        # lives exactly as long as the game of the fork
+        self.resolver = partial(resolve_in_fork, ref(self))
+
+    def fork_game(self):
+        """Return the fork of the game, copying no other object unless the
+        forks it descends from are collapsed.
+
+        Return:
+            a Game object
+        """
+        game = self.game
+        with self.arena.activate():
+            fork = copy(game)
+        object.__setattr__(fork, 'fork_resolver', self)
+        object.__setattr__(
+            fork,
+            '_player',
+            self._get_lazily(Player, game._player, game)
+        )
+        if len(self.layers) < MAX_FORK_DEPTH:
+            object.__setattr__(fork, '_locations', self._list_locations)
+        else:
+            self._collapse()
+            object.__setattr__(fork, '_locations', LazyList(
+                self._list_locations(),
+                owner=fork
+            ))
+            self.game = self.root
+            self.layers = ()
+        for layer in self.layers:
+            layer.arena.add_fork(self)
+        self.root.arena.add_fork(self)
+        # The fork's map is made of copies, which it indexes afresh
+        object.__setattr__(fork, 'navigation', None)
+        if game.is_dirty:
+            fork.mark_dirty()
+        return fork
+
+    def resolve(self, model_cls, identifier):
+        """Return the copy of an object in the fork, copying it if need be.
+
+        Arguments:
+            model_cls (type): a model class
+            identifier (int): the identifier of an object of that class
+
+        Return:
+            an instance of model_cls, belonging to the fork
+        """
+        obj = self.arena.get(model_cls, identifier)
+        if obj is None:
+            original = self._find(model_cls, identifier)
+            # Copying is no modification of the fork, even once games are
+            # forked from it in turn
+            with self.arena.loading():
+                obj = self._copy(original)
+        return obj
+
+    def _find(self, model_cls, identifier):
+        """Return the object of the forked worlds a placeholder stands for."""
+        for layer in self.layers:
+            original = layer.arena.get(model_cls, identifier)
+            if original is not None:
+                return original
+        original = self.root.arena.get(model_cls, identifier)
+        if original is None:
+            original = self.root_sources[(model_cls, identifier)].resolve()
+        return original
+
+    def _collapse(self):
+        """Copy every object of the forks this one descends from, so that
+        only objects of the original game are left to read.
+        """
+        for layer in self.layers:
+            for model_cls in COPIED_MODELS:
+                objs = list(layer.arena.objects.get(model_cls, {}).values())
+                for obj in objs:
+                    if self.arena.get(model_cls, obj._identifier) is None:
+                        self._copy(obj)
+
+    def _list_locations(self):
+        # Only the placeholders held by the original list are looked at, so
+        # that listing the locations of the fork resolves none of them
+        game = self.game
+        return [
+            self._get_lazily(Location, location, game)
+            for location in list.__iter__(game.locations)
+        ]
+
+    def _get(self, obj):
+        """Return the copy of obj in the fork, copying it if need be."""
+        copied = self.arena.get(type(obj), obj._identifier)
+        if copied is None:
+            copied = self._copy(obj)
+        return copied
+
+    def _get_lazily(self, model_cls, obj, holder):
+        """Return the copy of obj in the fork, or a placeholder for it.
+
+        Arguments:
+            model_cls (type): the class of obj
+            obj (BaseModel | LazyReference): an object of the forked worlds,
+                or a placeholder for it
+            holder (BaseModel): the object of the forked worlds holding obj
+        """
+        if isinstance(obj, LazyReference):
+            identifier = obj.identifier
+            if holder.arena is self.root.arena:
+                self.root_sources[(model_cls, identifier)] = obj
+        else:
+            identifier = obj._identifier
+        copied = self.arena.get(model_cls, identifier)
+        if copied is not None:
+            return copied
+        return LazyReference(model_cls, identifier, self.resolver)
+
+    def _copy(self, obj):
+        """Copy obj into the fork, along with the objects it holds.
+
+        Objects referenced but not held (eg. the destination of an exit) are
+        left as placeholders.
+        """
+        model_cls = type(obj)
+        copied = model_cls.__new__(model_cls)
+        for name, value in obj.__getstate__().items():
+            object.__setattr__(copied, name, value)
+        # Identifiers of the forked world are all below those the fork's
+        # arena allocates, and so need not be reserved
+        object.__setattr__(copied, '_arena', self.arena)
+        self.arena.register(copied)
+        self.copies.append(copied)
+        if isinstance(obj, (Item, Person)):
+            object.__setattr__(copied, '_synonym_names', SynonymList(
+                obj.synonym_names,
+                owner=copied
+            ))
+        elif isinstance(obj, Exit):
+            object.__setattr__(
+                copied,
+                '_destination',
+                self._get_lazily(Location, obj._destination, obj)
+            )
+        elif isinstance(obj, Location):
+            for attribute, list_cls in (
+                    ('_items', NamedObjectList),
+                    ('_people', NamedObjectList),
+                    ('_exits', ExitList),
+            ):
+                object.__setattr__(copied, attribute, list_cls(
+                    [self._get(held) for held in getattr(obj, attribute)],
+                    owner=copied
+                ))
+        elif isinstance(obj, Player):
+            object.__setattr__(
+                copied,
+                '_location',
+                self._get_lazily(Location, obj._location, obj)
+            )
+            object.__setattr__(copied, '_inventory', NamedObjectList(
+                [self._get(item) for item in obj.inventory],
+                owner=copied
+            ))
+        if obj.is_dirty:
+            copied.mark_dirty()
+        return copied
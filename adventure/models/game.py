@@ -1,11 +1,15 @@
-from adventure.models.base import BaseModel
+from adventure.models.base import BaseModel, LazyReference
+from adventure.models.containers import LazyList
+from adventure.models.fork import ForkResolver
 
 
 class Game(BaseModel):
     """Contains data concerning the overall game in progress."""
 
+    UNTRACKED_ATTRIBUTES = frozenset(('outputter', 'navigation'))
+
     def __init__(self, title, start_blurb, player, locations,
-                 _identifier=None):
+                 _identifier=None, outputter=None):
         """Creates a new `Game` instance.
 
         Arguments:
@@ -15,6 +19,9 @@ class Game(BaseModel):
             player (Player): a player object
             locations (list): all locations involved with this game
             _identifier (int): an optional unique identifier
+            outputter (BaseOutputter | None): an optional outputter to which
+                text about this game is displayed, instead of the outputter
+                active in the current context
         """
         self.title = title
         self.start_blurb = start_blurb
@@ -22,8 +29,75 @@ class Game(BaseModel):
         self.locations = locations
         self.is_over = False
         self.is_won = False
+        self.outputter = outputter
+        # The index of routes between locations, built on first use (see
+        # `adventure.navigation.get_navigation`)
+        self.navigation = None
         super().__init__(_identifier=_identifier)
 
+    @property
+    def player(self):
+        player = self._player
+        if isinstance(player, LazyReference):
+            player = player.resolve()
+            # Resolving a placeholder is not a modification
+            object.__setattr__(self, '_player', player)
+        return player
+
+    @player.setter
+    def player(self, player):
+        self._player = player
+
+    @property
+    def locations(self):
+        locations = self._locations
+        if callable(locations):
+            # Forked games list their locations on first access (see `fork`)
+            locations = LazyList(locations(), owner=self)
+            object.__setattr__(self, '_locations', locations)
+        return locations
+
+    @locations.setter
+    def locations(self, locations):
+        self._locations = LazyList(locations, owner=self)
+
+    def fork(self):
+        """Return a copy of this game, in constant time.
+
+        The fork shares every object of this game until it is reached through
+        the fork, at which point it is copied (see `adventure.models.fork`).
+        This game must not be modified afterwards: play on the fork, and keep
+        this game as a snapshot of the state it was forked in. The fork lives
+        as long as the game returned: objects held by the fork raise
+        `ReferenceError` when reaching objects not copied yet once it is
+        dropped, and this game can then be modified again.
+
+        Return:
+            a Game object, belonging to an arena of its own
+        """
+        return ForkResolver(self).fork_game()
+
+    def iterate_objects(self):
+        """Generate every model object that makes up this game.
+
+        Objects shared by several others (eg. directions) may be generated
+        more than once.
+        """
+        yield self
+        yield self.player
+        yield from self.player.inventory
+        for location in self.locations:
+            yield location
+            yield from location.items
+            for person in location.people:
+                yield person
+                if person.gender is not None:
+                    yield person.gender
+            for exit in location.exits:
+                yield exit
+                if exit.direction is not None:
+                    yield exit.direction
+
     def serialize(self):
         """Transform this game object into a JSON-serializable dictionary.
 
@@ -33,7 +107,8 @@ class Game(BaseModel):
         return {
             'title': self.title,
             'start_blurb': self.start_blurb,
-            'player': self.player.reference,
+            # Avoid resolving a lazy player just to reference it
+            'player': self._player.reference,
             'locations': [location.reference for location in self.locations],
             '_identifier': self._identifier,
         }
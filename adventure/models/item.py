@@ -1,10 +1,8 @@
-from copy import copy
-
 from adventure.display.helpers import guess_article
-from adventure.models.base import BaseModel
+from adventure.models.named import NamedModel
 
 
-class Item(BaseModel):
+class Item(NamedModel):
     """An `Item` represents any object with which the player can interact.
 
     This defines a broad catch-all category for anything that has a specific
@@ -12,6 +10,8 @@ class Item(BaseModel):
     it, separate from other defined models.
     """
 
+    __slots__ = ('name', '_article', 'description', 'is_gettable')
+
     def __init__(self, name, article=None, synonym_names=None,
                  description=None, is_gettable=False, _identifier=None):
         """Creates a new `Item` instance.
@@ -59,9 +59,14 @@ class Item(BaseModel):
         Return:
             a dictionary representation of self
         """
-        serialized_item = copy(self.__dict__)
-        serialized_item['article'] = serialized_item.pop('_article')
-        return serialized_item
+        return {
+            'name': self.name,
+            'article': self._article,
+            'synonym_names': list(self.synonym_names),
+            'description': self.description,
+            'is_gettable': self.is_gettable,
+            '_identifier': self._identifier,
+        }
 
     def __str__(self):
         return '<Item {}: {}>'.format(self._identifier, self.name)
@@ -1,9 +1,12 @@
-from adventure.models.base import BaseModel
+from adventure.models.base import BaseModel, LazyReference
+from adventure.models.containers import ExitList, NamedObjectList
 
 
 class Direction(BaseModel):
     """Describes a direction (either cardinal or relative) to place exits."""
 
+    __slots__ = ('name', 'abbrev')
+
     def __init__(self, name, abbrev, _identifier=None):
         """Creates a new `Direction` instance.
 
@@ -23,7 +26,11 @@ class Direction(BaseModel):
         Return:
             a dictionary representation of self
         """
-        return self.__dict__
+        return {
+            'name': self.name,
+            'abbrev': self.abbrev,
+            '_identifier': self._identifier,
+        }
 
     def __str__(self):
         return '<Direction {}: {}>'.format(self._identifier, self.name)
@@ -32,6 +39,8 @@ class Direction(BaseModel):
 class Exit(BaseModel):
     """Represents a connection from one location to another."""
 
+    __slots__ = ('direction', '_destination')
+
     def __init__(self, direction, destination, _identifier=None):
         """Creates a new `Exit` instance.
 
@@ -45,6 +54,19 @@ class Exit(BaseModel):
         self.destination = destination
         super().__init__(_identifier=_identifier)
 
+    @property
+    def destination(self):
+        destination = self._destination
+        if isinstance(destination, LazyReference):
+            destination = destination.resolve()
+            # Resolving a placeholder is not a modification
+            object.__setattr__(self, '_destination', destination)
+        return destination
+
+    @destination.setter
+    def destination(self, destination):
+        self._destination = destination
+
     def serialize(self):
         """Transform this exit into a JSON-serializable dictionary.
 
@@ -53,7 +75,8 @@ class Exit(BaseModel):
         """
         return {
             'direction': self.direction.reference,
-            'destination': self.destination.reference,
+            # Avoid resolving a lazy destination just to reference it
+            'destination': self._destination.reference,
             '_identifier': self._identifier
         }
 
@@ -70,7 +93,21 @@ class Exit(BaseModel):
 
 
 class Location(BaseModel):
-    """A `Location` represents a single area on a map."""
+    """A `Location` represents a single area on a map.
+
+    Every change to a location, including to its lists of items, people and
+    exits and to the items and people it holds, increments its `version`,
+    which lets renderings of the location (see `render_cache`) tell whether
+    they are still current.
+    """
+
+    __slots__ = (
+        'name', 'description', '_items', '_people', '_exits', '_version',
+        'render_cache'
+    )
+
+    # A rendering is derived from the location, not part of its saved state
+    UNTRACKED_ATTRIBUTES = frozenset(('render_cache',))
 
     def __init__(self, name, description, items=None, people=None, exits=None,
                  _identifier=None):
@@ -87,6 +124,10 @@ class Location(BaseModel):
                 how to leave this location for another
             _identifier (int): an optional unique identifier
         """
+        object.__setattr__(self, '_version', 0)
+        # A (version, rendering) pair, where the rendering may be any value
+        # derived from the location as of that version
+        self.render_cache = None
         self.name = name
         self.description = description
         self.items = items or []
@@ -94,6 +135,75 @@ class Location(BaseModel):
         self.exits = exits or []
         super().__init__(_identifier=_identifier)
 
+    @property
+    def version(self):
+        """The number of changes made to this location, or to the items and
+        people it holds (eg. renaming an item), since it was built.
+        """
+        # Held objects only report changes to the lists indexing them
+        self._items.watch()
+        self._people.watch()
+        return self._version
+
+    def mark_dirty(self):
+        super().mark_dirty()
+        self.mark_contents_changed()
+
+    def mark_contents_changed(self):
+        object.__setattr__(self, '_version', self._version + 1)
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        for attribute in ('_items', '_people', '_exits'):
+            getattr(self, attribute).adopt(self)
+
+    @property
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = NamedObjectList(items, owner=self)
+
+    @property
+    def people(self):
+        return self._people
+
+    @people.setter
+    def people(self, people):
+        self._people = NamedObjectList(people, owner=self)
+
+    @property
+    def exits(self):
+        return self._exits
+
+    @exits.setter
+    def exits(self, exits):
+        self._exits = ExitList(exits, owner=self)
+        self.mark_exits_changed()
+
+    def mark_exits_changed(self):
+        """Record that the exits of this location changed.
+
+        This lets navigation indexes of the world (see `adventure.navigation`)
+        catch up with the change. Exits are expected not to change while a
+        location holds them: exits are added, removed or replaced instead.
+        """
+        # Locations can only be tracked once they have an identifier
+        if getattr(self, '_identifier', None) is not None:
+            self._arena.record_map_change(self)
+
+    def find_exit(self, direction):
+        """Return the exit leading in the given direction, if any.
+
+        Arguments:
+            direction (str): the name or abbreviation of a direction
+
+        Return:
+            an Exit object or None
+        """
+        return self.exits.find(direction)
+
     def serialize(self):
         """Transform this location object into a JSON-serializable dictionary.
 
@@ -0,0 +1,73 @@
+from weakref import WeakValueDictionary
+
+from adventure.models.base import BaseModel
+from adventure.models.containers import NamedObjectList, SynonymList
+
+
+class NamedModel(BaseModel):
+    """A model looked up by name and synonym names (eg. an item or person).
+
+    Named models remember the `NamedObjectList`s indexing them, so that
+    renaming one (or changing its synonym names, even in place) reindexes it
+    in those lists only, and so that any change to one is reported to the
+    models owning those lists (eg. to let a location tell that its rendering
+    is out of date).
+    """
+
+    __slots__ = ('_synonym_names', '_holders')
+
+    @property
+    def synonym_names(self):
+        return self._synonym_names
+
+    @synonym_names.setter
+    def synonym_names(self, synonym_names):
+        self._synonym_names = SynonymList(synonym_names, owner=self)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in NamedObjectList.KEY_ATTRIBUTES:
+            self.keys_changed()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._synonym_names.adopt(self)
+
+    def mark_dirty(self):
+        super().mark_dirty()
+        for holder in self._get_holders():
+            holder.contents_changed(self)
+
+    def add_holder(self, holder):
+        """Remember a list indexing this object, for as long as it lives.
+
+        Arguments:
+            holder (NamedObjectList): a list indexing this object
+        """
+        holders = getattr(self, '_holders', None)
+        if holders is None:
+            # Lists are unhashable, so they are keyed by identity
+            holders = WeakValueDictionary()
+            object.__setattr__(self, '_holders', holders)
+        holders[id(holder)] = holder
+
+    def remove_holder(self, holder):
+        """Forget a list that no longer indexes this object.
+
+        Arguments:
+            holder (NamedObjectList): a list indexing this object no more
+        """
+        holders = getattr(self, '_holders', None)
+        if holders is not None:
+            holders.pop(id(holder), None)
+
+    def keys_changed(self):
+        """Reindex this object in the lists indexing it, after its name or
+        synonym names changed.
+        """
+        for holder in self._get_holders():
+            holder.keys_changed(self)
+
+    def _get_holders(self):
+        holders = getattr(self, '_holders', None)
+        return list(holders.values()) if holders else []
@@ -1,9 +1,14 @@
 from adventure.models.base import BaseModel
+from adventure.models.named import NamedModel
 
 
 class Gender(BaseModel):
     """Associates a gender with its gendered pronouns."""
 
+    __slots__ = (
+        'gender', 'subject_pronoun', 'object_pronoun', 'possessive_pronoun'
+    )
+
     def __init__(self, gender, subject_pronoun, object_pronoun,
                  possessive_pronoun, _identifier=None):
         """Creates a new `Gender` instance.
@@ -29,15 +34,23 @@ class Gender(BaseModel):
         Return:
             a dictionary representation of self
         """
-        return self.__dict__
+        return {
+            'gender': self.gender,
+            'subject_pronoun': self.subject_pronoun,
+            'object_pronoun': self.object_pronoun,
+            'possessive_pronoun': self.possessive_pronoun,
+            '_identifier': self._identifier,
+        }
 
     def __str__(self):
         return '<Gender {}: {}>'.format(self._identifier, self.gender)
 
 
-class Person(BaseModel):
+class Person(NamedModel):
     """Represents any living being with whom the player can interact."""
 
+    __slots__ = ('name', 'description', 'gender')
+
     def __init__(self, name, description, gender, synonym_names=None,
                  _identifier=None):
         """Creates a new `Person` instance.
@@ -74,7 +87,7 @@ class Person(BaseModel):
             'name': self.name,
             'description': self.description,
             'gender': self.gender.reference,
-            'synonym_names': self.synonym_names,
+            'synonym_names': list(self.synonym_names),
             '_identifier': self._identifier,
         }
 
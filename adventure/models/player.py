@@ -1,4 +1,5 @@
-from adventure.models.base import BaseModel
+from adventure.models.base import BaseModel, LazyReference
+from adventure.models.containers import NamedObjectList
 
 
 class Player(BaseModel):
@@ -17,38 +18,57 @@ class Player(BaseModel):
         self.score = score or 0
         super().__init__(_identifier=_identifier)
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._inventory.adopt(self)
+
+    @property
+    def location(self):
+        location = self._location
+        if isinstance(location, LazyReference):
+            location = location.resolve()
+            # Resolving a placeholder is not a modification
+            object.__setattr__(self, '_location', location)
+        return location
+
+    @location.setter
+    def location(self, location):
+        self._location = location
+
+    @property
+    def inventory(self):
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, inventory):
+        self._inventory = NamedObjectList(inventory, owner=self)
+
     def find_visible_object(self, obj_name):
         """Given the name of an object, return the object if it is visible.
 
+        People take precedence over items, and items in the current location
+        take precedence over those in the inventory. Each collection keeps its
+        own name index, so the lookup cost does not depend on the number of
+        visible objects.
+
         Arguments:
             obj_name (str): name of an object visible to the player
 
         Returns:
             the object matching obj_name or None
         """
-        visible_people = self.location.people
-        visible_items = self.inventory + self.location.items
-
-        named_people = {}
-        for person in visible_people:
-            named_people[person.name] = person
-            named_people.update(
-                {name: person for name in person.synonym_names}
-            )
-
-        named_items = {}
-        for item in visible_items:
-            named_items[item.name] = item
-            named_items.update({name: item for name in item.synonym_names})
-
-        obj = None
         if obj_name == self.location.name:
-            obj = self.location
-        elif obj_name in named_people.keys():
-            obj = named_people[obj_name]
-        elif obj_name in named_items.keys():
-            obj = named_items[obj_name]
-        return obj
+            return self.location
+
+        for visible_objects in (
+                self.location.people,
+                self.location.items,
+                self.inventory,
+        ):
+            obj = visible_objects.find(obj_name)
+            if obj is not None:
+                return obj
+        return None
 
     def serialize(self):
         """Transform this player object into a JSON-serializable dictionary.
@@ -57,7 +77,8 @@ class Player(BaseModel):
             a dictionary representation of self
         """
         return {
-            'location': self.location.reference,
+            # Avoid resolving a lazy location just to reference it
+            'location': self._location.reference,
             'inventory': [item.reference for item in self.inventory],
             'score': self.score,
             '_identifier': self._identifier,
@@ -0,0 +1,565 @@
+"""Shortest routes between the locations of a game.
+
+A `NavigationIndex` reads the exits of every location of a game once, then
+answers route queries from caches, rather than searching the map afresh for
+each query:
+
+- on small maps, the tree of shortest routes from a location is built the
+  first time a route from it is asked for, and kept, so that every later
+  route from it takes time proportional to its length (all pairs, as they
+  are needed);
+- on large maps, where a tree per location would take too much memory,
+  routes are found by searching from both ends at once, over the numbered
+  locations and exits held by the index (never over the models), and
+  recently found routes are kept.
+
+Games whose locations are not all built yet (eg. lazily loaded games, and
+forks, which copy locations as they are reached) are indexed as they are
+searched instead: the exits of a location are only read once a search
+reaches it, and the locations they lead to are numbered without being built
+(see `LazyReference`). Routes are then found by searching forward only,
+reusing the part of the tree of routes from a location built so far on
+small maps, so that finding a nearby location only builds the locations
+nearer still.
+
+Changing the exits of a location is recorded by the arena of its world (see
+`Arena.record_map_change`). The index then rereads the exits of the changed
+locations only, and discards only the cached trees that the change could
+have made wrong.
+
+Location names are expected not to change once a location is indexed.
+"""
+from collections import OrderedDict, deque
+from weakref import ref
+
+from adventure.commands.dispatch import strip_article, tokenize
+from adventure.models.base import LazyReference
+
+
+# Maps of up to this many locations keep a tree of routes per location
+ALL_PAIRS_LIMIT = 500
+# The number of routes kept on larger maps
+ROUTE_CACHE_SIZE = 4096
+
+
+def get_navigation(game):
+    """Return the navigation index of a game, building it if need be.
+
+    Arguments:
+        game (Game): a game
+
+    Return:
+        a NavigationIndex object
+    """
+    navigation = game.navigation
+    if navigation is None:
+        navigation = game.navigation = NavigationIndex(game)
+    return navigation
+
+
+def get_name_key(name):
+    """Return the key under which a location is found by name.
+
+    Names are matched regardless of case, and of a leading article, which
+    player input does not keep (see `strip_articles`).
+
+    Arguments:
+        name (str): the name of a location, or player input naming one
+
+    Return:
+        a str
+    """
+    return ' '.join(strip_article(tokenize(name))).lower()
+
+
+class NavigationIndex:
+    """Finds shortest routes between the locations of a game.
+
+    Locations are numbered in the order they are indexed, and searched by
+    number, which is much cheaper to hash than a model.
+
+    Games holding placeholders for some of their locations are indexed
+    lazily (see the module documentation), as only the searches made
+    reach them.
+    """
+
+    def __init__(self, game, all_pairs_limit=ALL_PAIRS_LIMIT,
+                 route_cache_size=ROUTE_CACHE_SIZE):
+        """Creates a new `NavigationIndex` instance.
+
+        Arguments:
+            game (Game): the game whose map to index
+            all_pairs_limit (int): the largest number of locations for which
+                a tree of routes is kept per location
+            route_cache_size (int): the number of routes kept on maps with
+                more locations than that
+        """
+        # The game holds its index in turn (see `get_navigation`), and is
+        # weakly held so as not to be kept alive by the reference cycle
+        self._game = ref(game)
+        self.arena = game.arena
+        self.all_pairs_limit = all_pairs_limit
+        self.route_cache_size = route_cache_size
+
+        self.arena.track_map_changes()
+        self.map_version = self.arena.map_version
+        # Whether locations are only indexed as searches reach them
+        self.lazy = any(
+            isinstance(location, LazyReference)
+            for location in list.__iter__(game.locations)
+        )
+        # Indexed locations (or placeholders for them, until their exits are
+        # read), by number, and their numbers
+        self.locations = []
+        self.numbers = {}
+        # The (exit, destination number) pairs leading out of each location,
+        # or None for locations whose exits are not read yet
+        self.edges = []
+        # The number of exits into each location, keyed by origin number
+        self.entrances = []
+        # Lists of locations, keyed by name key
+        self.names = {}
+        # Trees of shortest routes, keyed by origin; see `_search_from`
+        self.trees = {}
+        # Queues of the locations left to search from, keyed by the origin
+        # of trees not fully built yet; see `_grow`
+        self.frontiers = {}
+        # Routes found by search, most recently used last
+        self.routes = OrderedDict()
+
+        if not self.lazy:
+            for location in game.locations:
+                self._load(location)
+
+    @property
+    def game(self):
+        """The game whose map is indexed."""
+        return self._game()
+
+    def find_locations(self, name):
+        """Return the locations of the map going by a name.
+
+        When indexing lazily, every location of the game is built first.
+
+        Arguments:
+            name (str): the name of a location, in any case
+
+        Return:
+            a list of Location objects
+        """
+        self.refresh()
+        if self.lazy:
+            for location in self.game.locations:
+                self._expand(self._number(location))
+        return list(self.names.get(get_name_key(name), ()))
+
+    def find_route_to_name(self, origin, name):
+        """Return the shortest route from a location to any location going
+        by a name.
+
+        When indexing lazily, only the locations nearer to the origin than
+        the location found are built.
+
+        Arguments:
+            origin (Location): the location to start from
+            name (str): the name of a location, in any case
+
+        Return:
+            a list of the Exit objects to take in turn, or None if no
+            location going by that name can be reached from the origin
+        """
+        if not self.lazy:
+            routes = [
+                self.find_route(origin, location)
+                for location in self.find_locations(name)
+            ]
+            routes = [route for route in routes if route is not None]
+            return min(routes, key=len) if routes else None
+
+        self.refresh()
+        key = get_name_key(name)
+        origin = self._number(origin)
+        route_key = (origin, key)
+        if route_key in self.routes:
+            self.routes.move_to_end(route_key)
+            route = self.routes[route_key]
+            return None if route is None else list(route)
+
+        tree, queue = self._get_tree(origin)
+        reached = [
+            self.numbers[location] for location in self.names.get(key, ())
+            if self.numbers[location] in tree
+        ]
+        nearest = min(reached, key=lambda number: tree[number][0],
+                      default=None)
+        # Locations are searched in order of distance, so that once one is
+        # found, only locations as near need be looked at
+        while queue and (
+                nearest is None or tree[queue[0]][0] < tree[nearest][0]):
+            number = self._grow(tree, queue)
+            if get_name_key(self.locations[number].name) == key and (
+                    nearest is None or tree[number][0] < tree[nearest][0]):
+                nearest = number
+        if not queue:
+            self.frontiers.pop(origin, None)
+        route = None if nearest is None else self._trace(tree, nearest)
+        self._cache_route(route_key, route)
+        return route
+
+    def find_route(self, origin, destination):
+        """Return the shortest route from one location to another.
+
+        Arguments:
+            origin (Location): the location to start from
+            destination (Location): the location to reach
+
+        Return:
+            a list of the Exit objects to take in turn, or None if the
+            destination cannot be reached from the origin
+        """
+        self.refresh()
+        if self.lazy:
+            return self._find_route_lazily(origin, destination)
+        origin = self._load(origin)
+        destination = self.numbers.get(destination)
+        if destination is None:
+            # Every location reachable from an indexed location is indexed
+            return None
+        if destination == origin:
+            return []
+
+        if len(self.locations) <= self.all_pairs_limit:
+            tree = self.trees.get(origin)
+            if tree is None:
+                tree = self.trees[origin] = self._search_from(origin)
+            return self._trace(tree, destination)
+
+        key = (origin, destination)
+        if key in self.routes:
+            self.routes.move_to_end(key)
+            route = self.routes[key]
+        else:
+            route = self._search_between(origin, destination)
+            self._cache_route(key, route)
+        return None if route is None else list(route)
+
+    def _find_route_lazily(self, origin, destination):
+        """Return the shortest route between two locations, reading the
+        exits of locations only as the search reaches them.
+        """
+        origin = self._number(origin)
+        destination = self._number(destination)
+        key = (origin, destination)
+        if key in self.routes:
+            self.routes.move_to_end(key)
+            route = self.routes[key]
+            return None if route is None else list(route)
+
+        tree, queue = self._get_tree(origin)
+        while destination not in tree and queue:
+            self._grow(tree, queue)
+        if not queue:
+            self.frontiers.pop(origin, None)
+        route = self._trace(tree, destination)
+        self._cache_route(key, route)
+        return route
+
+    def _get_tree(self, origin):
+        """Return the tree of routes from a location built so far, and the
+        queue of locations it is still to be grown from (see `_grow`).
+
+        On small maps, trees and their queues (in `frontiers`, until they
+        are empty) are kept, to be grown further by later searches; on large
+        maps, a new tree is started every time.
+        """
+        tree = self.trees.get(origin)
+        if tree is not None:
+            return tree, self.frontiers.get(origin, deque())
+        tree = {origin: (0, None, None)}
+        queue = deque((origin,))
+        if len(self.game.locations) <= self.all_pairs_limit:
+            self.trees[origin] = tree
+            self.frontiers[origin] = queue
+        return tree, queue
+
+    def _grow(self, tree, queue):
+        """Search onward from the next location queued, reading its exits
+        if need be, and return its number.
+        """
+        number = queue.popleft()
+        distance = tree[number][0] + 1
+        for exit, destination in self._expand(number):
+            if destination not in tree:
+                tree[destination] = (distance, number, exit)
+                queue.append(destination)
+        return number
+
+    def _cache_route(self, key, route):
+        self.routes[key] = None if route is None else tuple(route)
+        if len(self.routes) > self.route_cache_size:
+            self.routes.popitem(last=False)
+
+    def refresh(self):
+        """Catch up with changes made to the map since the last query."""
+        arena = self.arena
+        if arena.map_version == self.map_version:
+            return
+        changed = [
+            location
+            for location, version in list(arena.map_changes.items())
+            if version > self.map_version
+        ]
+        self.map_version = arena.map_version
+        for location in changed:
+            # Locations not indexed yet are read as they are when indexed
+            number = self.numbers.get(location)
+            if number is not None:
+                self._update(number)
+
+    def _load(self, location):
+        """Index a location, and every location its exits reach.
+
+        Return:
+            the number of the location
+        """
+        number = self.numbers.get(location)
+        if number is None:
+            number = self._add(location)
+            self._read_pending([number])
+        return number
+
+    def _read_pending(self, pending):
+        """Read the exits of newly numbered locations, and of those they
+        reach in turn.
+        """
+        while pending:
+            origin = pending.pop()
+            edges = self.edges[origin] = self._read_edges(
+                self._build(origin),
+                pending
+            )
+            for _, destination in edges:
+                self._add_entrance(origin, destination)
+
+    def _number(self, location):
+        """Return the number of a location, numbering it if need be, without
+        reading its exits.
+        """
+        number = self.numbers.get(location)
+        if number is None:
+            number = self._add(location)
+        return number
+
+    def _expand(self, number):
+        """Return the (exit, destination number) pairs of a location,
+        reading its exits (and so building it) if need be.
+        """
+        edges = self.edges[number]
+        if edges is None:
+            edges = self.edges[number] = self._read_edges(self._build(number))
+            for _, destination in edges:
+                self._add_entrance(number, destination)
+        return edges
+
+    def _build(self, number):
+        """Return a numbered location, resolving its placeholder if need
+        be.
+        """
+        location = self.locations[number]
+        if isinstance(location, LazyReference):
+            location = self.locations[number] = location.resolve()
+            self._add_name(location)
+        return location
+
+    def _add(self, location):
+        """Number a location, leaving its exits to be read."""
+        number = self.numbers[location] = len(self.locations)
+        self.locations.append(location)
+        self.edges.append(None)
+        self.entrances.append({})
+        # Placeholders are named once built
+        if not isinstance(location, LazyReference):
+            self._add_name(location)
+        return number
+
+    def _add_name(self, location):
+        self.names.setdefault(get_name_key(location.name), []).append(
+            location
+        )
+
+    def _read_edges(self, location, pending=None):
+        """Return the (exit, destination number) pairs of a location,
+        numbering new destinations and adding them to pending (if given).
+
+        Destinations are read without building them.
+        """
+        numbers = self.numbers
+        edges = []
+        for exit in location.exits:
+            destination = exit._destination
+            number = numbers.get(destination)
+            if number is None:
+                number = self._add(destination)
+                if pending is not None:
+                    pending.append(number)
+            edges.append((exit, number))
+        return tuple(edges)
+
+    def _add_entrance(self, origin, destination):
+        entrances = self.entrances[destination]
+        entrances[origin] = entrances.get(origin, 0) + 1
+
+    def _remove_entrance(self, origin, destination):
+        entrances = self.entrances[destination]
+        if entrances[origin] == 1:
+            del entrances[origin]
+        else:
+            entrances[origin] -= 1
+
+    def _update(self, origin):
+        """Reread the exits of a changed location, and discard what the
+        change could have made wrong.
+        """
+        old_edges = self.edges[origin]
+        if old_edges is None:
+            # Exits not read yet are read as they are when first needed
+            return
+        # Lazily indexed locations reached by new exits are left unread
+        pending = None if self.lazy else []
+        new_edges = self._read_edges(self.locations[origin], pending)
+        removed = [edge for edge in old_edges if edge not in new_edges]
+        added = [edge for edge in new_edges if edge not in old_edges]
+        if not removed and not added:
+            return
+
+        self.edges[origin] = new_edges
+        for _, destination in removed:
+            self._remove_entrance(origin, destination)
+        for _, destination in added:
+            self._add_entrance(origin, destination)
+        if pending:
+            self._read_pending(pending)
+
+        self.trees = {
+            tree_origin: tree
+            for tree_origin, tree in self.trees.items()
+            if not self._changes_tree(tree, origin, removed, added)
+        }
+        self.frontiers = {
+            tree_origin: queue
+            for tree_origin, queue in self.frontiers.items()
+            if tree_origin in self.trees
+        }
+        self.routes.clear()
+
+    @staticmethod
+    def _changes_tree(tree, origin, removed, added):
+        """Return whether exits removed from or added to a location make a
+        tree of routes wrong.
+        """
+        for exit, destination in removed:
+            reached = tree.get(destination)
+            if reached is not None and reached[2] is exit:
+                return True
+        if origin not in tree:
+            return False
+        distance = tree[origin][0] + 1
+        for _, destination in added:
+            reached = tree.get(destination)
+            if reached is None or distance < reached[0]:
+                return True
+        return False
+
+    def _search_from(self, origin):
+        """Return the tree of shortest routes from a location.
+
+        The tree maps every location reachable from the origin to a
+        (distance, previous location, exit taken) triple, describing the
+        last step of a shortest route to it. The origin maps to
+        (0, None, None).
+        """
+        edges = self.edges
+        tree = {origin: (0, None, None)}
+        queue = deque((origin,))
+        while queue:
+            location = queue.popleft()
+            distance = tree[location][0] + 1
+            for exit, destination in edges[location]:
+                if destination not in tree:
+                    tree[destination] = (distance, location, exit)
+                    queue.append(destination)
+        return tree
+
+    @staticmethod
+    def _trace(tree, destination):
+        """Return the route to a location along a tree, or None."""
+        if destination not in tree:
+            return None
+        route = []
+        _, location, exit = tree[destination]
+        while exit is not None:
+            route.append(exit)
+            _, location, exit = tree[location]
+        route.reverse()
+        return route
+
+    def _search_between(self, origin, destination):
+        """Return the shortest route between two locations, as a tuple of
+        exits, or None.
+
+        The map is searched breadth first both forward from the origin and
+        backward from the destination, a whole step at a time, extending
+        whichever search has the fewer locations to extend, until the two
+        meet.
+        """
+        edges = self.edges
+        entrances = self.entrances
+        # Locations reached forward map to (distance, previous location,
+        # exit taken); locations reached backward to (distance, next
+        # location)
+        forward = {origin: (0, None, None)}
+        backward = {destination: (0, None)}
+        forward_frontier = [origin]
+        backward_frontier = [destination]
+        while forward_frontier and backward_frontier:
+            meetings = []
+            frontier = []
+            if len(forward_frontier) <= len(backward_frontier):
+                for location in forward_frontier:
+                    distance = forward[location][0] + 1
+                    for exit, onward in edges[location]:
+                        if onward not in forward:
+                            forward[onward] = (distance, location, exit)
+                            frontier.append(onward)
+                            if onward in backward:
+                                meetings.append(onward)
+                forward_frontier = frontier
+            else:
+                for location in backward_frontier:
+                    distance = backward[location][0] + 1
+                    for previous in entrances[location]:
+                        if previous not in backward:
+                            backward[previous] = (distance, location)
+                            frontier.append(previous)
+                            if previous in forward:
+                                meetings.append(previous)
+                backward_frontier = frontier
+
+            if meetings:
+                # Routes through locations met in the same step may differ
+                # in length
+                location = min(
+                    meetings,
+                    key=lambda met: forward[met][0] + backward[met][0]
+                )
+                route = self._trace(forward, location)
+                while location != destination:
+                    onward = backward[location][1]
+                    route.append(next(
+                        exit
+                        for exit, reached in edges[location]
+                        if reached == onward
+                    ))
+                    location = onward
+                return tuple(route)
+        return None
@@ -0,0 +1,276 @@
+"""An asyncio server hosting many concurrent game sessions in one process.
+
+Each connection is a session with its own `Game`, and its own outputter
+writing to the connection. Players send one command per line; the output of
+each command is sent back in a single write, followed by `PROMPT`.
+
+Run with `python -m adventure.server`, passing either `--port` or `--unix`,
+and the name of a save file from which to load the game of each session.
+"""
+import argparse
+import asyncio
+import os
+
+from adventure.commands import built_ins  # noqa: F401 (registers commands)
+from adventure.commands.dispatch import Dispatcher
+from adventure.commands.registry import registry
+from adventure.commands.replay import CommandJournal
+from adventure.display import active_outputter
+from adventure.display.buffered_text import BufferedTextOutputter
+from adventure.exc import CommandArgumentError, UnknownCommandError
+from adventure.loaders import GameLoader
+
+
+PROMPT = '> '
+QUIT_COMMANDS = frozenset(('quit', 'exit'))
+
+
+class StreamWriterFile:
+    """Adapts an asyncio `StreamWriter` to the text file interface.
+
+    Writes are queued on the transport without blocking; the server awaits
+    `StreamWriter.drain` between commands to apply backpressure.
+    """
+
+    def __init__(self, writer):
+        """Creates a new `StreamWriterFile` instance.
+
+        Arguments:
+            writer (asyncio.StreamWriter): the writer of a connection
+        """
+        self.writer = writer
+
+    def write(self, text):
+        self.writer.write(text.encode('utf-8'))
+
+    def flush(self):
+        pass
+
+
+class SessionOutputter(BufferedTextOutputter):
+    """Buffers the output of a session until the player is prompted.
+
+    The whole reply to a command, prompt included, is then handed to the
+    connection in a single write.
+    """
+
+    def __init__(self, writer):
+        """Creates a new `SessionOutputter` instance.
+
+        Arguments:
+            writer (asyncio.StreamWriter): the writer of a connection
+        """
+        super().__init__(StreamWriterFile(writer), frames_per_flush=None)
+
+    def prompt(self):
+        """Write all buffered output, followed by the prompt."""
+        self.buffer.append(PROMPT)
+        self.buffer_size += len(PROMPT)
+        self.flush()
+
+
+class Session:
+    """A single player's game, played over a connection."""
+
+    def __init__(self, game, reader, writer, dispatcher, journal=None):
+        """Creates a new `Session` instance.
+
+        Arguments:
+            game (Game): the game played in this session
+            reader (asyncio.StreamReader): the reader of the connection
+            writer (asyncio.StreamWriter): the writer of the connection
+            dispatcher (Dispatcher): the dispatcher running commands
+            journal (CommandJournal | None): an optional journal in which to
+                record every command dispatched
+        """
+        self.game = game
+        self.reader = reader
+        self.writer = writer
+        self.dispatcher = dispatcher
+        self.journal = journal
+        self.outputter = SessionOutputter(writer)
+        game.outputter = self.outputter
+
+    async def run(self):
+        """Play the game until the player quits, or the connection closes.
+
+        Must run in its own asyncio task, whose context holds the outputter of
+        the session for any text displayed without reference to the game.
+        """
+        active_outputter.set(self.outputter)
+        with self.outputter.frame():
+            self.outputter.display_game_text(self.game.start_blurb)
+            built_ins.look(self.game)
+        await self.prompt()
+
+        while not self.game.is_over:
+            line = await self.reader.readline()
+            if not line:
+                break
+            text = line.decode('utf-8', errors='replace').strip()
+            if text.lower() in QUIT_COMMANDS:
+                break
+            if text:
+                self.run_command(text)
+            await self.prompt()
+
+    def run_command(self, text):
+        """Dispatch a line of player input, reporting unusable input.
+
+        Arguments:
+            text (str): a line of player input
+        """
+        try:
+            self.dispatcher.dispatch(text, self.game, journal=self.journal)
+        except UnknownCommandError:
+            self.outputter.display_game_text("I don't know how to do that.")
+        except CommandArgumentError:
+            self.outputter.display_game_text("I don't understand that.")
+
+    async def prompt(self):
+        """Send the reply and prompt, and wait for them to be sent."""
+        self.outputter.prompt()
+        await self.writer.drain()
+
+
+class GameServer:
+    """Accepts connections, and runs a game session for each of them."""
+
+    def __init__(self, game_factory, command_registry=registry,
+                 journal_directory=None):
+        """Creates a new `GameServer` instance.
+
+        Arguments:
+            game_factory (callable): a function returning a new Game object
+                for each session
+            command_registry (CommandRegistry): the registry of commands
+                available to players (by default, the package-wide registry)
+            journal_directory (str | None): an optional directory in which
+                to write the command journal of each session once it ends
+                (see `adventure.commands.replay`)
+        """
+        self.game_factory = game_factory
+        self.journal_directory = journal_directory
+        # A single dispatcher, and its compiled verb trie, serves every
+        # session; commands display text to the outputter of the session
+        # active in the current task.
+        self.dispatcher = Dispatcher(command_registry)
+        self.session_count = 0
+        self.sessions_started = 0
+
+    async def start(self, host='127.0.0.1', port=None, path=None):
+        """Start listening for connections.
+
+        Arguments:
+            host (str): the address on which to listen for TCP connections
+            port (int | None): the port on which to listen for TCP
+                connections, if path is None
+            path (str | None): the path of a Unix socket on which to listen
+
+        Return:
+            an asyncio.Server object
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self.handle_connection,
+                path=path,
+                backlog=4096
+            )
+        return await asyncio.start_server(
+            self.handle_connection,
+            host=host,
+            port=port,
+            backlog=4096
+        )
+
+    async def serve(self, **kwargs):
+        """Listen for connections until cancelled.
+
+        Arguments:
+            **kwargs: as accepted by `start`
+        """
+        server = await self.start(**kwargs)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        """Run a session over a new connection, then close it.
+
+        Arguments:
+            reader (asyncio.StreamReader): the reader of the connection
+            writer (asyncio.StreamWriter): the writer of the connection
+        """
+        self.session_count += 1
+        self.sessions_started += 1
+        session_number = self.sessions_started
+        journal = None if self.journal_directory is None else CommandJournal()
+        session = Session(
+            self.game_factory(),
+            reader,
+            writer,
+            self.dispatcher,
+            journal
+        )
+        try:
+            await session.run()
+        except ConnectionError:
+            pass
+        finally:
+            self.session_count -= 1
+            writer.close()
+            if journal is not None:
+                self.write_journal(journal, session_number)
+
+    def write_journal(self, journal, session_number):
+        """Write the command journal of a session that ended.
+
+        Arguments:
+            journal (CommandJournal): the journal of the session
+            session_number (int): the number of the session, counting from 1
+                in the order sessions started
+        """
+        journal_path = os.path.join(
+            self.journal_directory,
+            'session-{}.journal'.format(session_number)
+        )
+        with open(journal_path, 'w') as journal_file:
+            journal.dump(journal_file)
+
+
+def main(argv=None):
+    """Serve the game of a save file over a socket.
+
+    Arguments:
+        argv (list): command line arguments (by default, sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description='Serve the game of a save file over a socket.'
+    )
+    parser.add_argument('file_name', help='save file (without extension)')
+    parser.add_argument('--directory', help='directory of the save file')
+    parser.add_argument('--extension', default='json')
+    parser.add_argument('--host', default='127.0.0.1')
+    listen_group = parser.add_mutually_exclusive_group(required=True)
+    listen_group.add_argument('--port', type=int)
+    listen_group.add_argument('--unix', help='path of a Unix socket')
+    parser.add_argument(
+        '--journal-directory',
+        help='directory in which to write the command journal of each session'
+    )
+    args = parser.parse_args(argv)
+
+    loader = GameLoader(directory=args.directory, extension=args.extension)
+    server = GameServer(
+        lambda: loader.load(args.file_name, cached=True),
+        journal_directory=args.journal_directory
+    )
+    try:
+        asyncio.run(
+            server.serve(host=args.host, port=args.port, path=args.unix)
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Measure how batch runs of scripts scale with the number of processes.
+
+Run with `python -m benchmarks.batch [PROCESSES ...]` (by default, powers of
+two up to the number of CPUs). A generated world is saved to a temporary
+directory, then `NUM_SCRIPTS` scripts of `SCRIPT_LENGTH` commands each are
+played from it with each number of worker processes, and the speedup over a
+single process is reported.
+"""
+import os
+import sys
+import tempfile
+from itertools import cycle, islice
+
+from adventure.batch import BatchRunner
+from adventure.loaders import GameSaver
+from adventure.models import Arena
+from benchmarks.dispatch import INPUT_LINES
+from benchmarks.worlds import build_world
+
+
+NUM_SCRIPTS = 2000
+SCRIPT_LENGTH = 200
+
+
+def get_process_counts():
+    cpu_count = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpu_count:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpu_count:
+        counts.append(cpu_count)
+    return counts
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    process_counts = [int(arg) for arg in argv] or get_process_counts()
+    lines = list(INPUT_LINES)
+    scripts = [
+        list(islice(cycle(lines[number % len(lines):] + lines), SCRIPT_LENGTH))
+        for number in range(NUM_SCRIPTS)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        with Arena().activate():
+            GameSaver(build_world(1000), directory=directory).save('world')
+
+        print('{} CPU(s) available'.format(os.cpu_count()))
+        print('{:>10} {:>10} {:>12} {:>14} {:>9}'.format(
+            'processes', 'seconds', 'scripts/s', 'commands/s', 'speedup'
+        ))
+        baseline = None
+        for processes in process_counts:
+            runner = BatchRunner(
+                'world',
+                directory=directory,
+                processes=processes
+            )
+            report = runner.run(scripts)
+            baseline = baseline or report.elapsed
+            print('{:>10} {:>10.3f} {:>12,.0f} {:>14,.0f} {:>8.2f}x'.format(
+                processes,
+                report.elapsed,
+                report.throughput,
+                report.command_count / report.elapsed,
+                baseline / report.elapsed
+            ))
+
+
+if __name__ == '__main__':
+    main()
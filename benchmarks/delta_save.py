@@ -0,0 +1,38 @@
+"""Compare full saves with delta saves after a single player move.
+
+Run with `python -m benchmarks.delta_save`. The cost of a delta save should
+not depend on the size of the world.
+"""
+import tempfile
+import time
+
+from adventure.loaders import GameSaver
+from benchmarks.worlds import build_world
+
+
+SIZES = (10000, 100000)
+
+
+def main():
+    print('{:>10} {:>12} {:>12}'.format('objects', 'full ms', 'delta ms'))
+    with tempfile.TemporaryDirectory() as directory:
+        for num_objects in SIZES:
+            game = build_world(num_objects, shared_fixtures=True)
+            saver = GameSaver(game, directory=directory)
+
+            start = time.perf_counter()
+            saver.save('delta_save')
+            full_time = time.perf_counter() - start
+
+            game.player.location = game.player.location.exits[0].destination
+            start = time.perf_counter()
+            saver.save_delta('delta_save')
+            delta_time = time.perf_counter() - start
+
+            print('{:>10} {:>12.2f} {:>12.2f}'.format(
+                num_objects, full_time * 1000, delta_time * 1000
+            ))
+
+
+if __name__ == '__main__':
+    main()
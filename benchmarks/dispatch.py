@@ -0,0 +1,58 @@
+"""Measure the throughput of the command dispatcher.
+
+Run with `python -m benchmarks.dispatch`. One million lines of input, mixing
+built-in verbs and their aliases, are first only parsed, then fully
+dispatched to the built-in commands with output discarded.
+"""
+import time
+from itertools import cycle, islice
+
+from adventure.commands import built_ins  # noqa: F401 (registers commands)
+from adventure.commands.dispatch import Dispatcher
+from adventure.display import active_outputter
+from adventure.display.null import NullOutputter
+from benchmarks.worlds import build_world
+
+
+NUM_COMMANDS = 1000000
+INPUT_LINES = (
+    'look',
+    'examine thing 1',
+    'get the thing 2',
+    'throw thing 2',
+    'kick the item 0-3',
+    'inventory',
+    'wait',
+    'talk person 0',
+)
+
+
+def main():
+    game = build_world(1000)
+    dispatcher = Dispatcher()
+    lines = list(islice(cycle(INPUT_LINES), NUM_COMMANDS))
+
+    start = time.perf_counter()
+    for line in lines:
+        dispatcher.parse(line)
+    parse_elapsed = time.perf_counter() - start
+
+    token = active_outputter.set(NullOutputter())
+    start = time.perf_counter()
+    for line in lines:
+        dispatcher.dispatch(line, game)
+    dispatch_elapsed = time.perf_counter() - start
+    active_outputter.reset(token)
+
+    print('{:>10} {:>10} {:>14}'.format('stage', 'seconds', 'commands/s'))
+    for stage, elapsed in (
+            ('parse', parse_elapsed),
+            ('dispatch', dispatch_elapsed),
+    ):
+        print('{:>10} {:>10.3f} {:>14,.0f}'.format(
+            stage, elapsed, NUM_COMMANDS / elapsed
+        ))
+
+
+if __name__ == '__main__':
+    main()
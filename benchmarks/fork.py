@@ -0,0 +1,64 @@
+"""Measure the cost of forking games, compared to a save and load round trip.
+
+Run with `python -m benchmarks.fork`. For each world size, games are forked
+repeatedly, first without touching the fork, then playing a few commands on
+each fork (as an undo checkpoint or a search step would). A JSON round trip
+through `GameSaver` and `GameLoader` is timed once for comparison.
+"""
+import tempfile
+import time
+
+from adventure.commands.built_ins import get, move
+from adventure.display import active_outputter
+from adventure.display.null import NullOutputter
+from adventure.loaders import GameLoader, GameSaver
+from adventure.models import Arena
+from benchmarks.worlds import build_world
+
+
+SIZES = (1000, 100000, 1000000)
+NUM_FORKS = 10000
+
+
+def play(game):
+    get('item 0-0', game)
+    move('onward', game)
+    move('onward', game)
+
+
+def time_forks(game, touch):
+    start = time.perf_counter()
+    for _ in range(NUM_FORKS):
+        fork = game.fork()
+        if touch:
+            play(fork)
+    return (time.perf_counter() - start) / NUM_FORKS
+
+
+def time_round_trip(game):
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        GameSaver(game, directory=directory).save('fork')
+        GameLoader(directory=directory).load('fork')
+        return time.perf_counter() - start
+
+
+def main():
+    token = active_outputter.set(NullOutputter())
+    print('{:>10} {:>12} {:>14} {:>14}'.format(
+        'objects', 'fork us', 'fork+play us', 'round trip ms'
+    ))
+    for size in SIZES:
+        with Arena().activate():
+            game = build_world(size, shared_fixtures=True)
+        print('{:>10,} {:>12.1f} {:>14.1f} {:>14.1f}'.format(
+            size,
+            time_forks(game, touch=False) * 1e6,
+            time_forks(game, touch=True) * 1e6,
+            time_round_trip(game) * 1000,
+        ))
+    active_outputter.reset(token)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Compare file size and save/load speed of each registered save format.
+
+Run with `python -m benchmarks.formats`.
+"""
+import os
+import tempfile
+import time
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.formats import formats
+from benchmarks.worlds import build_world
+
+
+NUM_OBJECTS = 100000
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    game = build_world(NUM_OBJECTS, shared_fixtures=True)
+    print('{} objects'.format(NUM_OBJECTS))
+    print('{:>8} {:>10} {:>10} {:>10} {:>12}'.format(
+        'format', 'MiB', 'save s', 'load s', 'stream load s'
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in formats:
+            saver = GameSaver(game, directory=directory, extension=extension)
+            loader = GameLoader(directory=directory, extension=extension)
+            save_time = timed(saver.save, 'formats')
+            size = os.path.getsize(saver.get_file_path('formats'))
+            load_time = timed(loader.load, 'formats')
+            stream_load_time = timed(loader.load, 'formats', stream=True)
+            print('{:>8} {:>10.2f} {:>10.3f} {:>10.3f} {:>12.3f}'.format(
+                extension, size / 2 ** 20, save_time, load_time,
+                stream_load_time
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Measure how long it takes to import parts of the package from cold.
+
+Run with `python -m benchmarks.import_time [MODULE ...]` (by default, the
+modules in `MODULES`), where a module may be followed by `:NAME` to import a
+single name out of it (eg. `adventure.loaders.loader:GameLoader`). Each
+module is imported `REPEATS` times, each time in a fresh interpreter, and the
+median time taken by the import statement alone is reported (interpreter
+startup is left out), along with the number of modules the import loaded.
+"""
+import statistics
+import subprocess
+import sys
+
+
+MODULES = (
+    'adventure',
+    'adventure.models',
+    'adventure.fixtures',
+    'adventure.loaders',
+    'adventure.loaders.loader:GameLoader',
+    'adventure.commands.built_ins',
+    'adventure.server',
+)
+REPEATS = 15
+SCRIPT = '''\
+import sys, time
+before = len(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules) - before)
+'''
+
+
+def get_statement(module):
+    """Return the import statement timed for a module (see `MODULES`)."""
+    module, _, name = module.partition(':')
+    if name:
+        return 'from {} import {}'.format(module, name)
+    return 'import {}'.format(module)
+
+
+def time_import(module):
+    timings = []
+    script = SCRIPT.format(statement=get_statement(module))
+    for _ in range(REPEATS):
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        elapsed, module_count = result.stdout.split()
+        timings.append(float(elapsed))
+    return statistics.median(timings), int(module_count)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    modules = argv or MODULES
+    print('{:>36} {:>10} {:>9}'.format('module', 'ms', 'modules'))
+    for module in modules:
+        elapsed, module_count = time_import(module)
+        print('{:>36} {:>10.1f} {:>9}'.format(
+            module, elapsed * 1000, module_count
+        ))
+
+
+if __name__ == '__main__':
+    main()
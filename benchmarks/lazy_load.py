@@ -0,0 +1,61 @@
+"""Compare the cost of starting a game eagerly and lazily.
+
+Run with `python -m benchmarks.lazy_load`. Eager figures grow with the size
+of the map, while lazy ones only depend on the player's location; a handful
+of moves are then made to show the cost of building locations on demand.
+"""
+import tempfile
+import time
+import tracemalloc
+
+from adventure.loaders import GameLoader, GameSaver
+from benchmarks.worlds import build_world
+
+
+SIZES = (25000, 100000)
+MOVES = 10
+
+
+def profile_load(loader, lazy):
+    tracemalloc.start()
+    start = time.perf_counter()
+    game = loader.load('lazy_load', lazy=lazy)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return game, peak, elapsed
+
+
+def explore(game):
+    start = time.perf_counter()
+    location = game.player.location
+    for _ in range(MOVES):
+        if not location.exits:
+            break
+        location = location.exits[0].destination
+    return time.perf_counter() - start
+
+
+def main():
+    print('{:>10} {:>8} {:>12} {:>10} {:>12}'.format(
+        'objects', 'mode', 'peak MiB', 'seconds', 'explore ms'
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        loader = GameLoader(directory=directory, extension='ijson')
+        for num_objects in SIZES:
+            game = build_world(num_objects, shared_fixtures=True)
+            GameSaver(game, directory=directory, extension='ijson').save(
+                'lazy_load'
+            )
+            del game
+            for mode, lazy in (('eager', False), ('lazy', True)):
+                game, peak, elapsed = profile_load(loader, lazy)
+                print('{:>10} {:>8} {:>12.2f} {:>10.3f} {:>12.3f}'.format(
+                    num_objects, mode, peak / 2 ** 20, elapsed,
+                    explore(game) * 1000
+                ))
+                del game
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Compare peak memory allocated while loading with and without streaming.
+
+Run with `python -m benchmarks.load_memory`. Both figures include the loaded
+model graph itself; the difference is the raw file contents and parsed dict
+tree that the buffered loader keeps alive alongside it.
+"""
+import tempfile
+import time
+import tracemalloc
+
+from adventure.loaders import GameLoader, GameSaver
+from benchmarks.worlds import build_world
+
+
+SIZES = (25000, 100000)
+
+
+def profile_load(loader, stream):
+    tracemalloc.start()
+    start = time.perf_counter()
+    loader.load('load_memory', stream=stream)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    print('{:>10} {:>10} {:>12} {:>10}'.format(
+        'objects', 'mode', 'peak MiB', 'seconds'
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        loader = GameLoader(directory=directory)
+        for num_objects in SIZES:
+            game = build_world(num_objects, shared_fixtures=True)
+            GameSaver(game, directory=directory).save('load_memory')
+            del game
+            for mode, stream in (('buffered', False), ('stream', True)):
+                peak, elapsed = profile_load(loader, stream)
+                print('{:>10} {:>10} {:>12.2f} {:>10.3f}'.format(
+                    num_objects, mode, peak / 2 ** 20, elapsed
+                ))
+
+
+if __name__ == '__main__':
+    main()
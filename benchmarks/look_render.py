@@ -0,0 +1,44 @@
+"""Measure the cost of `look` with and without its rendering cache.
+
+Run with `python -m benchmarks.look_render`. `look` is called repeatedly in
+the same location, with output discarded: first with the rendering cache
+cleared before every call (as if the location changed each time), then with
+the cache left in place.
+"""
+import time
+
+from adventure.commands.built_ins import look
+from adventure.display import active_outputter
+from adventure.display.null import NullOutputter
+from benchmarks.worlds import build_world
+
+
+NUM_LOOKS = 200000
+ITEM_COUNTS = (0, 8, 32)
+
+
+def time_looks(game, clear_cache):
+    location = game.player.location
+    start = time.perf_counter()
+    for _ in range(NUM_LOOKS):
+        if clear_cache:
+            location.render_cache = None
+        look(game)
+    return time.perf_counter() - start
+
+
+def main():
+    token = active_outputter.set(NullOutputter())
+    print('{:>6} {:>14} {:>14}'.format('items', 'uncached/s', 'cached/s'))
+    for item_count in ITEM_COUNTS:
+        game = build_world(item_count + 4, items_per_location=item_count)
+        uncached = time_looks(game, clear_cache=True)
+        cached = time_looks(game, clear_cache=False)
+        print('{:>6} {:>14,.0f} {:>14,.0f}'.format(
+            item_count, NUM_LOOKS / uncached, NUM_LOOKS / cached
+        ))
+    active_outputter.reset(token)
+
+
+if __name__ == '__main__':
+    main()
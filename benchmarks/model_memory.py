@@ -0,0 +1,104 @@
+"""Compare the memory taken by slotted models and by per-instance dicts.
+
+Run with `python -m benchmarks.model_memory`. For each slotted model class,
+one million instances are laid out both as the class does (slots) and as it
+did before declaring `__slots__` (a per-instance `__dict__` holding the same
+attributes, set in the same order). Attribute values are shared by every
+instance, so that only the cost of the instances themselves is measured.
+
+Finally, a whole world of one million models is built and measured, which
+includes attribute values, lists and the arena's identity map.
+"""
+import gc
+import sys
+import tracemalloc
+
+from adventure.models import (
+    Arena, Direction, Exit, Gender, Item, Location, Person
+)
+from benchmarks.worlds import build_world
+
+
+NUM_OBJECTS = 1000000
+
+
+class DictLayout:
+    """Stands in for a model class that has no `__slots__`."""
+
+
+def build_templates():
+    direction = Direction('north', 'n')
+    gender = Gender('unspecified', 'they', 'them', 'their')
+    location = Location('Attic', 'Dusty', items=[Item('box')])
+    return (
+        direction,
+        gender,
+        Exit(direction, location),
+        Item('lamp', synonym_names=['lantern'], description='Brass'),
+        Person('Hamlet', 'A prince', gender),
+        location,
+    )
+
+
+def measure(make_instance):
+    gc.collect()
+    tracemalloc.start()
+    instances = [make_instance() for _ in range(NUM_OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Leave out the list holding the instances
+    size -= sys.getsizeof(instances)
+    del instances
+    return size / NUM_OBJECTS
+
+
+def slotted_factory(template):
+    model_cls = type(template)
+    state = template.__getstate__()
+    arena = template.arena
+
+    def make_instance():
+        instance = model_cls.__new__(model_cls)
+        object.__setattr__(instance, '_arena', arena)
+        for name, value in state.items():
+            object.__setattr__(instance, name, value)
+        return instance
+    return make_instance
+
+
+def dict_factory(template):
+    state = template.__getstate__()
+    state['_arena'] = template.arena
+
+    def make_instance():
+        instance = DictLayout()
+        for name, value in state.items():
+            setattr(instance, name, value)
+        return instance
+    return make_instance
+
+
+def main():
+    print('{:>10} {:>12} {:>12}'.format('model', 'dict B/obj', 'slots B/obj'))
+    for template in build_templates():
+        print('{:>10} {:>12.1f} {:>12.1f}'.format(
+            type(template).__name__,
+            measure(dict_factory(template)),
+            measure(slotted_factory(template)),
+        ))
+
+    gc.collect()
+    tracemalloc.start()
+    with Arena().activate():
+        game = build_world(NUM_OBJECTS, shared_fixtures=True)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    num_objects = sum(1 for _ in game.iterate_objects())
+    print('world of {:,} models: {:.1f} B/obj'.format(
+        num_objects,
+        size / num_objects
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Measure route queries with a navigation index, against plain search.
+
+Run with `python -m benchmarks.navigation`. Generated worlds (a ring of
+locations, with extra exits between random locations) are queried for
+routes between random pairs of locations, first by a breadth-first search
+per query (as done before the index existed), then through a
+`NavigationIndex`: with a tree of routes per location on the small map, and
+searching from both ends on the large one. Queries repeat after a while, as
+they do when bots and guides keep heading to the same places.
+"""
+import random
+import time
+from collections import deque
+
+from adventure.models import Arena, Direction, Exit
+from adventure.navigation import ALL_PAIRS_LIMIT, NavigationIndex
+from benchmarks.worlds import build_world
+
+
+WORLD_SIZES = (3000, 120000)
+NUM_QUERIES = 2000
+DISTINCT_QUERIES = 500
+
+
+def search(origin, destination):
+    previous = {origin: None}
+    queue = deque((origin,))
+    while queue:
+        location = queue.popleft()
+        if location == destination:
+            route = []
+            while previous[location] is not None:
+                location, exit = previous[location]
+                route.append(exit)
+            return route[::-1]
+        for exit in location.exits:
+            if exit.destination not in previous:
+                previous[exit.destination] = (location, exit)
+                queue.append(exit.destination)
+    return None
+
+
+def main():
+    rng = random.Random(0)
+    print('{:>9} {:>12} {:>14} {:>14} {:>9}'.format(
+        'locations', 'mode', 'search us/q', 'index us/q', 'speedup'
+    ))
+    for world_size in WORLD_SIZES:
+        with Arena().activate():
+            game = build_world(world_size)
+            locations = list(game.locations)
+            shortcut = Direction('shortcut', 'sc')
+            for location in rng.sample(locations, len(locations) // 4):
+                location.exits.append(Exit(shortcut, rng.choice(locations)))
+        pairs = [
+            tuple(rng.sample(locations, 2)) for _ in range(DISTINCT_QUERIES)
+        ]
+        queries = [rng.choice(pairs) for _ in range(NUM_QUERIES)]
+
+        start = time.perf_counter()
+        for origin, destination in queries:
+            search(origin, destination)
+        search_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        navigation = NavigationIndex(game)
+        for origin, destination in queries:
+            navigation.find_route(origin, destination)
+        index_elapsed = time.perf_counter() - start
+
+        print('{:>9,} {:>12} {:>14.1f} {:>14.1f} {:>8.1f}x'.format(
+            len(locations),
+            'all pairs' if len(locations) <= ALL_PAIRS_LIMIT else 'two-way',
+            search_elapsed / NUM_QUERIES * 1e6,
+            index_elapsed / NUM_QUERIES * 1e6,
+            search_elapsed / index_elapsed
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Measure how fast new games are started from a save file.
+
+Run with `python -m benchmarks.new_game`. For each world size, a save file
+is loaded repeatedly, as a server starting a session per connection would:
+first by a full load each time (as done before templates were cached), then
+through the template cache, where only the first game is loaded from disk
+and every other one is forked from it. A few commands are played on each
+cached game, to include the cost of copying what a session touches.
+"""
+import tempfile
+import time
+
+from adventure.commands.built_ins import get, move
+from adventure.display import active_outputter
+from adventure.display.null import NullOutputter
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.templates import TemplateCache
+from adventure.models import Arena
+from benchmarks.worlds import build_world
+
+
+SIZES = (1000, 10000, 100000)
+NUM_GAMES = 20
+
+
+def play(game):
+    get('item 0-0', game)
+    move('onward', game)
+    move('onward', game)
+
+
+def main():
+    active_outputter.set(NullOutputter())
+    print('{:>9} {:>14} {:>14} {:>10}'.format(
+        'objects', 'load ms/game', 'cached ms/game', 'speedup'
+    ))
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            with Arena().activate():
+                GameSaver(build_world(size), directory=directory).save('w')
+            loader = GameLoader(directory=directory)
+
+            games = max(2, NUM_GAMES * 1000 // size)
+            start = time.perf_counter()
+            for _ in range(games):
+                loader.load('w')
+            load_elapsed = (time.perf_counter() - start) / games
+
+            cache = TemplateCache()
+            games *= 100
+            start = time.perf_counter()
+            for _ in range(games):
+                play(cache.get_game(loader, 'w'))
+            cached_elapsed = (time.perf_counter() - start) / games
+
+        print('{:>9,} {:>14.3f} {:>14.3f} {:>9.0f}x'.format(
+            size,
+            load_elapsed * 1e3,
+            cached_elapsed * 1e3,
+            load_elapsed / cached_elapsed
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Compare unbuffered and buffered output of the built-in commands.
+
+Run with `python -m benchmarks.output_buffering`. The same commands are
+dispatched with output sent to the null device, once printing each line and
+once collecting the output of each command into a single write; the number
+of write calls reaching the underlying file is counted for both.
+"""
+import os
+import time
+from contextlib import redirect_stdout
+from itertools import cycle, islice
+
+from adventure.commands import built_ins  # noqa: F401 (registers commands)
+from adventure.commands.dispatch import Dispatcher
+from adventure.display import active_outputter
+from adventure.display.basic_text import TextOutputter
+from adventure.display.buffered_text import BufferedTextOutputter
+from benchmarks.worlds import build_world
+
+
+NUM_COMMANDS = 100000
+INPUT_LINES = ('look', 'inventory', 'examine thing 1', 'wait')
+
+
+class CountingFile:
+    """Wraps a file object, counting calls to `write`."""
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return self.wrapped.write(text)
+
+    def flush(self):
+        self.wrapped.flush()
+
+
+def run(outputter, stream, game):
+    dispatcher = Dispatcher()
+    lines = islice(cycle(INPUT_LINES), NUM_COMMANDS)
+    token = active_outputter.set(outputter)
+    try:
+        with redirect_stdout(stream):
+            start = time.perf_counter()
+            for line in lines:
+                dispatcher.dispatch(line, game)
+            return time.perf_counter() - start
+    finally:
+        active_outputter.reset(token)
+
+
+def main():
+    game = build_world(1000)
+    print('{:>12} {:>10} {:>12}'.format('mode', 'seconds', 'writes'))
+    with open(os.devnull, 'w', buffering=1) as null_file:
+        for mode, make_outputter in (
+                ('print', TextOutputter),
+                ('buffered', BufferedTextOutputter),
+        ):
+            stream = CountingFile(null_file)
+            elapsed = run(make_outputter(), stream, game)
+            print('{:>12} {:>10.3f} {:>12}'.format(
+                mode, elapsed, stream.writes
+            ))
+
+
+if __name__ == '__main__':
+    main()
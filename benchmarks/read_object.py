@@ -0,0 +1,89 @@
+"""Measure reading single objects out of a save file, against full loads.
+
+Run with `python -m benchmarks.read_object`. For each world size, a world is
+saved as indexed JSON, then the player's inventory and location are read out
+of it: first by parsing the whole document (as tooling did before), then by
+mapping the file and decoding only those objects through its index. The
+cost of each further object read from an open file is reported too.
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.models import Arena
+from benchmarks.worlds import build_world
+
+
+SIZES = (10000, 100000, 1000000)
+NUM_READS = 10000
+
+
+def read_parsed(loader, file_name):
+    with open(loader.get_file_path(file_name), 'rb') as load_file:
+        serialized_objs = json.loads(load_file.read())
+    items = {item['_identifier']: item for item in serialized_objs['items']}
+    player = serialized_objs['player']
+    inventory = [items[ref['identifier']] for ref in player['inventory']]
+    location_identifier = player['location']['identifier']
+    location = next(
+        location for location in serialized_objs['locations']
+        if location['_identifier'] == location_identifier
+    )
+    return inventory, location
+
+
+def read_indexed(loader, file_name):
+    with loader.open_indexed(file_name) as save_file:
+        player = save_file.read_section('player')
+        inventory = [
+            save_file.read_reference(ref) for ref in player['inventory']
+        ]
+        return inventory, save_file.read_reference(player['location'])
+
+
+def main():
+    rng = random.Random(0)
+    print('{:>9} {:>9} {:>12} {:>12} {:>9} {:>10}'.format(
+        'objects', 'MB', 'parse ms', 'indexed ms', 'speedup', 'us/object'
+    ))
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            with Arena().activate():
+                game = build_world(size)
+            GameSaver(game, directory=directory, extension='ijson').save('w')
+            loader = GameLoader(directory=directory, extension='ijson')
+            megabytes = os.path.getsize(loader.get_file_path('w')) / 1e6
+
+            start = time.perf_counter()
+            parsed = read_parsed(loader, 'w')
+            parse_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            indexed = read_indexed(loader, 'w')
+            indexed_elapsed = time.perf_counter() - start
+            assert indexed == parsed
+
+            with loader.open_indexed('w') as save_file:
+                identifiers = list(save_file.get_identifiers('locations'))
+                sample = [rng.choice(identifiers) for _ in range(NUM_READS)]
+                start = time.perf_counter()
+                for identifier in sample:
+                    save_file.read_section('locations', identifier)
+                read_elapsed = (time.perf_counter() - start) / NUM_READS
+            del game
+
+        print('{:>9,} {:>9.1f} {:>12.1f} {:>12.1f} {:>8.1f}x {:>10.1f}'.format(
+            size,
+            megabytes,
+            parse_elapsed * 1e3,
+            indexed_elapsed * 1e3,
+            parse_elapsed / indexed_elapsed,
+            read_elapsed * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
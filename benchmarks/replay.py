@@ -0,0 +1,57 @@
+"""Measure how fast a recorded session replays, compared to live dispatch.
+
+Run with `python -m benchmarks.replay`. A session of one million commands is
+dispatched against a fork of a generated world and recorded in a journal,
+which is then replayed against another fork of the same world.
+"""
+import time
+from itertools import cycle, islice
+
+from adventure.commands.dispatch import Dispatcher
+from adventure.commands.replay import CommandJournal, ReplayEngine
+from adventure.display.null import NullOutputter
+from adventure.models import Arena
+from benchmarks.dispatch import INPUT_LINES
+from benchmarks.worlds import build_world
+
+
+NUM_COMMANDS = 1000000
+
+
+def main():
+    with Arena().activate():
+        game = build_world(1000)
+    lines = list(islice(cycle(INPUT_LINES), NUM_COMMANDS))
+
+    played = game.fork()
+    played.outputter = NullOutputter()
+    dispatcher = Dispatcher()
+    journal = CommandJournal()
+    start = time.perf_counter()
+    for line in lines:
+        dispatcher.dispatch(line, played, journal)
+    dispatch_elapsed = time.perf_counter() - start
+
+    report = ReplayEngine().replay(journal, game.fork())
+
+    print('{:>10} {:>10} {:>14}'.format('stage', 'seconds', 'commands/s'))
+    for stage, elapsed in (
+            ('dispatch', dispatch_elapsed),
+            ('replay', report.elapsed),
+    ):
+        print('{:>10} {:>10.3f} {:>14,.0f}'.format(
+            stage, elapsed, NUM_COMMANDS / elapsed
+        ))
+    print('replay p50 {:.1f}us, p99 {:.1f}us'.format(
+        report.percentile(0.5) * 1e6,
+        report.percentile(0.99) * 1e6
+    ))
+    print('{:>10} {:>10} {:>12}'.format('verb', 'count', 'mean us'))
+    for verb, (count, seconds) in sorted(report.by_verb().items()):
+        print('{:>10} {:>10,} {:>12.1f}'.format(
+            verb, count, seconds / count * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Compare peak memory allocated while saving with and without streaming.
+
+Run with `python -m benchmarks.save_memory`. Only allocations made during
+the save itself are traced; the world is built beforehand.
+"""
+import tempfile
+import tracemalloc
+
+from adventure.loaders import GameSaver
+from benchmarks.worlds import build_world
+
+
+SIZES = (25000, 100000)
+
+
+def peak_save_memory(game, directory, stream):
+    saver = GameSaver(game, directory=directory)
+    tracemalloc.start()
+    saver.save('save_memory', stream=stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print('{:>10} {:>14} {:>14}'.format(
+        'objects', 'buffered MiB', 'stream MiB'
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        for num_objects in SIZES:
+            game = build_world(num_objects, shared_fixtures=True)
+            buffered = peak_save_memory(game, directory, stream=False)
+            streamed = peak_save_memory(game, directory, stream=True)
+            print('{:>10} {:>14.2f} {:>14.2f}'.format(
+                num_objects, buffered / 2 ** 20, streamed / 2 ** 20
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Measure how `GameSaver` scales with the number of objects in a world.
+
+Run with `python -m benchmarks.save_scaling`. With linear scaling, the time
+per object should stay roughly constant as the world grows.
+"""
+import tempfile
+import time
+
+from adventure.loaders import GameSaver
+from benchmarks.worlds import build_world
+
+
+SIZES = (12500, 25000, 50000, 100000)
+
+
+def time_save(num_objects, directory):
+    game = build_world(num_objects)
+    saver = GameSaver(game, directory=directory)
+    start = time.perf_counter()
+    saver.save('save_scaling')
+    return time.perf_counter() - start
+
+
+def main():
+    print('{:>10} {:>12} {:>16}'.format('objects', 'seconds', 'usec/object'))
+    with tempfile.TemporaryDirectory() as directory:
+        for num_objects in SIZES:
+            elapsed = time_save(num_objects, directory)
+            print('{:>10} {:>12.3f} {:>16.2f}'.format(
+                num_objects, elapsed, elapsed / num_objects * 1e6
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Load-test the game server with many simulated connections.
+
+Run with `python -m benchmarks.server_load [CONNECTIONS ...]` (by default,
+1000, 10000 and 50000 connections). The server runs in a separate process,
+listening on a Unix socket. For each level, every connection is opened and
+kept open, then each sends `COMMANDS_PER_CONNECTION` commands one after the
+other, waiting for each reply. Throughput and latency are reported over all
+commands of the level.
+
+Each connection needs a file descriptor in both processes, so the soft limit
+on open files is raised to the hard limit; levels beyond it are skipped.
+"""
+import asyncio
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from adventure.server import PROMPT, GameServer
+from benchmarks.worlds import build_world
+
+
+LEVELS = (1000, 10000, 50000)
+COMMANDS_PER_CONNECTION = 10
+CONNECT_CONCURRENCY = 256
+INPUT_LINES = ('look', 'examine thing 1', 'inventory', 'wait', 'kick thing 2')
+PROMPT_BYTES = PROMPT.encode('utf-8')
+
+
+def raise_file_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def run_server(path):
+    raise_file_limit()
+    # Each session gets a small world of its own: a single location
+    server = GameServer(lambda: build_world(12, shared_fixtures=True))
+    asyncio.run(server.serve(path=path))
+
+
+async def open_connection(path, semaphore):
+    async with semaphore:
+        reader, writer = await asyncio.open_unix_connection(path)
+        await reader.readuntil(PROMPT_BYTES)
+    return reader, writer
+
+
+async def play(reader, writer, latencies):
+    for number in range(COMMANDS_PER_CONNECTION):
+        line = INPUT_LINES[number % len(INPUT_LINES)]
+        start = time.perf_counter()
+        writer.write('{}\n'.format(line).encode('utf-8'))
+        await reader.readuntil(PROMPT_BYTES)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_level(path, num_connections):
+    semaphore = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    connections = await asyncio.gather(*(
+        open_connection(path, semaphore) for _ in range(num_connections)
+    ))
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        play(reader, writer, latencies) for reader, writer in connections
+    ))
+    elapsed = time.perf_counter() - start
+    for _, writer in connections:
+        writer.close()
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return len(latencies) / elapsed, p99
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    levels = [int(arg) for arg in argv] or LEVELS
+    file_limit = raise_file_limit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'server.sock')
+        server_process = multiprocessing.Process(
+            target=run_server,
+            args=(path,),
+            daemon=True
+        )
+        server_process.start()
+        while not os.path.exists(path):
+            time.sleep(0.05)
+
+        print('{:>12} {:>14} {:>12}'.format(
+            'connections', 'commands/s', 'p99 ms'
+        ))
+        try:
+            for num_connections in levels:
+                # Leave room for the descriptors the processes already use
+                if num_connections + 64 > file_limit:
+                    print('{:>12} skipped: open file limit is {}'.format(
+                        num_connections, file_limit
+                    ))
+                    continue
+                throughput, p99 = asyncio.run(
+                    run_level(path, num_connections)
+                )
+                print('{:>12} {:>14,.0f} {:>12.2f}'.format(
+                    num_connections, throughput, p99 * 1000
+                ))
+        finally:
+            server_process.terminate()
+            server_process.join()
+
+
+if __name__ == '__main__':
+    main()
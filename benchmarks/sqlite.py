@@ -0,0 +1,73 @@
+"""Compare SQLite save files with JSON ones.
+
+Run with `python -m benchmarks.sqlite`. For each world size, a world is
+saved, saved again after a player move (a delta save: a journal line for
+JSON, an update of the changed rows for SQLite), then loaded in full. For
+SQLite, a lazy load (building only the player's surroundings) and reading a
+single location out of the file are timed too.
+"""
+import os
+import tempfile
+import time
+
+from adventure.commands.built_ins import move
+from adventure.display import active_outputter
+from adventure.display.null import NullOutputter
+from adventure.loaders import GameLoader, GameSaver
+from adventure.models import Arena
+from benchmarks.worlds import build_world
+
+
+SIZES = (10000, 100000)
+NUM_DELTAS = 100
+
+
+def time_call(function, *args, repeat=1, **kwargs):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args, **kwargs)
+    return (time.perf_counter() - start) / repeat * 1e3, result
+
+
+def main():
+    active_outputter.set(NullOutputter())
+    print('{:>9} {:>7} {:>8} {:>9} {:>9} {:>9} {:>9} {:>9}'.format(
+        'objects', 'format', 'MB', 'save ms', 'delta ms', 'load ms',
+        'lazy ms', 'read ms'
+    ))
+    for size in SIZES:
+        with Arena().activate():
+            game = build_world(size)
+        for extension in ('json', 'sqlite'):
+            with tempfile.TemporaryDirectory() as directory:
+                saver = GameSaver(game, directory=directory,
+                                  extension=extension)
+                loader = GameLoader(directory=directory, extension=extension)
+                save_ms, _ = time_call(saver.save, 'w')
+
+                def move_and_save():
+                    move('onward', game)
+                    saver.save_delta('w')
+                delta_ms, _ = time_call(move_and_save, repeat=NUM_DELTAS)
+                megabytes = os.path.getsize(loader.get_file_path('w')) / 1e6
+
+                load_ms, _ = time_call(loader.load, 'w')
+                lazy_ms = read_ms = float('nan')
+                if extension == 'sqlite':
+                    lazy_ms, _ = time_call(loader.load, 'w', lazy=True)
+                    with loader.open_indexed('w') as save_file:
+                        identifier = game.player.location._identifier
+                        read_ms, _ = time_call(
+                            save_file.read_section, 'locations', identifier,
+                            repeat=1000
+                        )
+
+            print('{:>9,} {:>7} {:>8.1f} {:>9.1f} {:>9.2f} {:>9.1f} {:>9.2f}'
+                  ' {:>9.3f}'.format(
+                      size, extension, megabytes, save_ms, delta_ms,
+                      load_ms, lazy_ms, read_ms
+                  ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Measure how fast batches of save files are validated.
+
+Run with `python -m benchmarks.validate [PROCESSES ...]` (by default, powers
+of two up to the number of CPUs). `NUM_FILES` generated worlds are saved to
+a temporary directory, then validated with each number of worker processes.
+For comparison, the time taken to fully load the same files (the only check
+available before validation existed) is also reported.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.validator import validate_files
+from adventure.models import Arena
+from benchmarks.batch import get_process_counts
+from benchmarks.worlds import build_world
+
+
+NUM_FILES = 200
+WORLD_SIZE = 2000
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    process_counts = [int(arg) for arg in argv] or get_process_counts()
+
+    with tempfile.TemporaryDirectory() as directory:
+        with Arena().activate():
+            saver = GameSaver(build_world(WORLD_SIZE), directory=directory)
+        file_names = ['world-{}'.format(number) for number in range(NUM_FILES)]
+        for file_name in file_names:
+            saver.save(file_name)
+        file_paths = [saver.get_file_path(name) for name in file_names]
+
+        loader = GameLoader(directory=directory)
+        start = time.perf_counter()
+        for file_name in file_names:
+            loader.load(file_name)
+        load_elapsed = time.perf_counter() - start
+
+        print('{} CPU(s) available; {:,} files of {:,} objects'.format(
+            os.cpu_count(), NUM_FILES, WORLD_SIZE
+        ))
+        print('{:>14} {:>10} {:>10}'.format('check', 'seconds', 'files/s'))
+        print('{:>14} {:>10.3f} {:>10,.1f}'.format(
+            'full load', load_elapsed, NUM_FILES / load_elapsed
+        ))
+        for processes in process_counts:
+            start = time.perf_counter()
+            reports = validate_files(file_paths, processes=processes)
+            elapsed = time.perf_counter() - start
+            assert all(report.is_valid for report in reports)
+            print('{:>14} {:>10.3f} {:>10,.1f}'.format(
+                'validate x{}'.format(processes),
+                elapsed,
+                NUM_FILES / elapsed
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Helpers to generate large, synthetic game worlds for benchmarking."""
+from adventure.models import (
+    Direction, Exit, Game, Gender, Item, Location, Person, Player
+)
+
+
+def build_world(num_objects, items_per_location=8, shared_fixtures=False):
+    """Build a game whose world contains roughly `num_objects` models.
+
+    Locations are laid out in a ring, each with one exit onward, one person
+    and `items_per_location` items.
+
+    Arguments:
+        num_objects (int): the approximate total number of models to create
+        items_per_location (int): the number of items placed in each location
+        shared_fixtures (bool): if True, all exits and people share a single
+            Direction and Gender; otherwise each gets its own, as happens
+            when worlds are stitched together from separately-authored files
+
+    Return:
+        a Game object
+    """
+    objects_per_location = items_per_location + 4
+    num_locations = max(1, num_objects // objects_per_location)
+    shared_direction = Direction('onward', 'o')
+    shared_gender = Gender('unspecified', 'they', 'them', 'their')
+
+    locations = []
+    for location_number in range(num_locations):
+        items = [
+            Item(
+                'item {}-{}'.format(location_number, item_number),
+                synonym_names=['thing {}'.format(item_number)],
+                description='An unremarkable object',
+                is_gettable=True,
+            )
+            for item_number in range(items_per_location)
+        ]
+        gender = shared_gender if shared_fixtures else Gender(
+            'unspecified', 'they', 'them', 'their'
+        )
+        people = [Person('person {}'.format(location_number), '', gender)]
+        locations.append(Location(
+            'room {}'.format(location_number),
+            'A nondescript room',
+            items=items,
+            people=people,
+        ))
+
+    for location_number, location in enumerate(locations):
+        direction = shared_direction if shared_fixtures else Direction(
+            'onward', 'o'
+        )
+        destination = locations[(location_number + 1) % num_locations]
+        location.exits.append(Exit(direction, destination))
+
+    player = Player(location=locations[0])
+    return Game('Benchmark World', 'A very large world', player, locations)
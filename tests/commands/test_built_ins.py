@@ -1,9 +1,10 @@
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 from adventure.commands.built_ins import (
-    attack, drop, examine, get, inventory, look, move, outputter, talk, wait
+    attack, drop, examine, get, goto, inventory, look, move, talk, wait
 )
+from adventure.display import outputter
 from adventure.models import (
     Direction, Exit, Game, Item, Location, Person, Player
 )
@@ -99,6 +100,35 @@ class LookTestCase(CommandTestCase):
             'Macbeth and Lady Macbeth are here.'
         )
 
+    def test_reuses_rendering_until_location_changes(self):
+        item = Item('rock', 'a')
+        location = Location('Quarry', 'Dusty', items=[item])
+        self.player.location = location
+        with patch.object(Item, 'full_name', new_callable=PropertyMock,
+                          return_value='a rock') as mock_full_name:
+            look(self.game)
+            look(self.game)
+            self.assertEqual(mock_full_name.call_count, 1)
+            location.items.append(Item('pebble'))
+            look(self.game)
+        self.assertEqual(mock_full_name.call_count, 3)
+        self.mock_display_text.assert_called_with('You see a rock and a rock.')
+
+    def test_renders_again_after_contents_change(self):
+        lamp = Item('lamp')
+        yorick = Person('Yorick', '', None)
+        location = Location('Crypt', 'Dank', items=[lamp], people=[yorick])
+        self.player.location = location
+        look(self.game)
+        lamp.name = 'torch'
+        look(self.game)
+        self.mock_display_text.assert_any_call('You see a torch.')
+        lamp.article = 'the'
+        yorick.name = 'Ophelia'
+        look(self.game)
+        self.mock_display_text.assert_any_call('You see the torch.')
+        self.mock_display_text.assert_any_call('Ophelia is here.')
+
 
 class ExamineTestCase(CommandTestCase):
     def test_describe_object(self):
@@ -165,6 +195,54 @@ class MoveTestCase(CommandTestCase):
         self.assertEqual(self.player.location, self.destination)
 
 
+class GotoTestCase(CommandTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hall = Location('Great Hall', '')
+        self.kitchen = Location('Kitchen', '')
+        self.cellar = Location('Cellar', '')
+        self.hall.exits = [Exit(Direction('east', 'e'), self.kitchen)]
+        self.kitchen.exits = [Exit(Direction('down', 'd'), self.cellar)]
+        self.game.locations = [self.hall, self.kitchen, self.cellar]
+        self.player.location = self.hall
+
+    def test_follow_route_and_look(self):
+        with patch('adventure.commands.built_ins.look') as mock_look:
+            goto('cellar', self.game)
+        self.assertEqual(self.player.location, self.cellar)
+        self.mock_display_text.assert_called_once_with(
+            'You go east and down.'
+        )
+        mock_look.assert_called_once_with(self.game)
+
+    def test_unknown_location(self):
+        goto('garden', self.game)
+        self.assertEqual(self.player.location, self.hall)
+        self.mock_display_text.assert_called_once_with(
+            "You don't know of anywhere called garden."
+        )
+
+    def test_no_route(self):
+        self.player.location = self.cellar
+        goto('great hall', self.game)
+        self.assertEqual(self.player.location, self.cellar)
+        self.mock_display_text.assert_called_once_with(
+            "You can't find a way there."
+        )
+
+    def test_already_there(self):
+        goto('great hall', self.game)
+        self.mock_display_text.assert_called_once_with(
+            "You're already there."
+        )
+
+    def test_follows_changed_exits(self):
+        goto('kitchen', self.game)
+        self.kitchen.exits.append(Exit(Direction('west', 'w'), self.hall))
+        goto('great hall', self.game)
+        self.assertEqual(self.player.location, self.hall)
+
+
 class TalkTestCase(CommandTestCase):
     def setUp(self):
         super().setUp()
@@ -0,0 +1,200 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+
+from adventure.commands.binding import CommandBinding
+from adventure.commands.dispatch import (
+    Dispatcher, VerbTrie, strip_article, strip_articles, tokenize
+)
+from adventure.commands.registry import CommandRegistry, registry
+from adventure.commands.replay import CommandJournal, get_handler_ref
+from adventure.exc import CommandArgumentError, UnknownCommandError
+from adventure.models import Arena, Game, Item, Player
+
+
+class TokenizeTestCase(TestCase):
+    def test_splits_words(self):
+        self.assertEqual(tokenize('  get  lamp '), ['get', 'lamp'])
+
+    def test_keeps_articles(self):
+        self.assertEqual(tokenize('Get The lamp'), ['Get', 'The', 'lamp'])
+
+    def test_preserves_case(self):
+        self.assertEqual(tokenize('talk Hamlet'), ['talk', 'Hamlet'])
+
+
+class StripArticlesTestCase(TestCase):
+    def test_strip_article(self):
+        self.assertEqual(strip_article(['The', 'lamp']), ['lamp'])
+        self.assertEqual(
+            strip_article(['jack', 'of', 'the', 'woods']),
+            ['jack', 'of', 'the', 'woods']
+        )
+        self.assertEqual(strip_article(['a']), ['a'])
+
+    def test_strips_each_argument(self):
+        binding = CommandBinding(lambda first, second, game: None)
+        self.assertEqual(
+            strip_articles(['the', 'key', 'a', 'box', 'of', 'the', 'dead'],
+                           binding),
+            ['key', 'box', 'of', 'the', 'dead']
+        )
+
+    def test_strips_varargs(self):
+        binding = CommandBinding(lambda *names: None)
+        self.assertEqual(
+            strip_articles(['the', 'key', 'an', 'apple'], binding),
+            ['key', 'apple']
+        )
+
+
+class VerbTrieTestCase(TestCase):
+    def setUp(self):
+        self.trie = VerbTrie()
+        self.trie.add('pick', 1)
+        self.trie.add('pick up', 2)
+
+    def test_match(self):
+        self.assertEqual(self.trie.match(['pick', 'lamp']), ('pick', 1, 1))
+
+    def test_longest_match(self):
+        self.assertEqual(
+            self.trie.match(['Pick', 'up', 'lamp']),
+            ('pick up', 2, 2)
+        )
+
+    def test_no_match(self):
+        self.assertIsNone(self.trie.match(['up']))
+        self.assertIsNone(self.trie.match([]))
+
+    def test_compile_includes_aliases(self):
+        from adventure.commands import built_ins  # noqa: F401
+        trie = VerbTrie.compile(registry)
+        for alias in ('drop', 'discard', 'throw', 'leave'):
+            verb, binding, _ = trie.match([alias, 'lamp'])
+            self.assertEqual(verb, alias)
+            self.assertEqual(binding.function.__name__, 'drop')
+
+
+class CommandBindingTestCase(TestCase):
+    def test_binds_words_in_order(self):
+        binding = CommandBinding(lambda first, second, game: None)
+        self.assertEqual(binding.bind(['a', 'b']), ['a', 'b'])
+
+    def test_joins_extra_words(self):
+        binding = CommandBinding(lambda item_name, game: None)
+        self.assertEqual(
+            binding.bind(['skeleton', 'key']),
+            ['skeleton key']
+        )
+
+    def test_optional_arguments(self):
+        binding = CommandBinding(lambda subject=None: None)
+        self.assertEqual(binding.bind([]), [])
+
+    def test_varargs(self):
+        binding = CommandBinding(lambda *words: None)
+        self.assertEqual(binding.bind(['a', 'b']), ['a', 'b'])
+
+    def test_too_few_words(self):
+        binding = CommandBinding(lambda item_name, game: None)
+        with self.assertRaises(CommandArgumentError):
+            binding.bind([])
+
+    def test_too_many_words(self):
+        binding = CommandBinding(lambda game: None)
+        with self.assertRaises(CommandArgumentError):
+            binding.bind(['around'])
+
+    def test_call_passes_game(self):
+        function = Mock()
+        binding = CommandBinding(lambda item_name, game: function(
+            item_name,
+            game=game
+        ))
+        game = object()
+        binding.call(['lamp'], game)
+        function.assert_called_once_with('lamp', game=game)
+
+    def test_call_without_game(self):
+        binding = CommandBinding(lambda item_name: item_name)
+        self.assertEqual(binding.call(['lamp'], object()), 'lamp')
+
+
+class DispatcherTestCase(TestCase):
+    def setUp(self):
+        self.registry = CommandRegistry()
+        self.registry.add_command('get', lambda item_name, game: (
+            'get', item_name, game
+        ))
+        self.registry.add_command('pick up', lambda item_name, game: (
+            'pick up', item_name, game
+        ))
+        self.dispatcher = Dispatcher(self.registry)
+        with Arena().activate():
+            self.game = Game('Dispatch Test', '', Player(None), [])
+
+    def test_dispatch(self):
+        self.assertEqual(
+            self.dispatcher.dispatch('get the brass lamp', self.game),
+            ('get', 'brass lamp', self.game)
+        )
+
+    def test_dispatch_keeps_articles_within_names(self):
+        self.assertEqual(
+            self.dispatcher.dispatch('get the jack of the woods', self.game),
+            ('get', 'jack of the woods', self.game)
+        )
+        self.assertEqual(
+            self.dispatcher.dispatch('get a day at a time', self.game),
+            ('get', 'day at a time', self.game)
+        )
+
+    def test_dispatch_multiple_word_verb(self):
+        self.assertEqual(
+            self.dispatcher.dispatch('pick up lamp', self.game),
+            ('pick up', 'lamp', self.game)
+        )
+
+    def test_unknown_command(self):
+        with self.assertRaises(UnknownCommandError):
+            self.dispatcher.dispatch('dance', self.game)
+
+    def test_empty_input(self):
+        with self.assertRaises(UnknownCommandError):
+            self.dispatcher.dispatch('  ', self.game)
+
+    def test_recompiles_after_registration(self):
+        self.dispatcher.parse('get lamp')
+        self.registry.add_command('dance', lambda game: 'dancing')
+        self.assertEqual(
+            self.dispatcher.dispatch('dance', self.game),
+            'dancing'
+        )
+
+    def test_dispatch_frames_output(self):
+        outputter = MagicMock()
+        dispatcher = Dispatcher(self.registry, outputter=outputter)
+        dispatcher.dispatch('get lamp', self.game)
+        outputter.frame.assert_called_once_with()
+
+    def test_dispatch_in_game_arena(self):
+        self.registry.add_command('conjure', lambda game: Item('rabbit'))
+        rabbit = self.dispatcher.dispatch('conjure', self.game)
+        self.assertIs(rabbit.arena, self.game.arena)
+
+    def test_dispatch_records_in_journal(self):
+        journal = CommandJournal()
+        self.dispatcher.dispatch('pick up the lamp', self.game, journal)
+        self.assertEqual(len(journal), 1)
+        self.assertEqual(journal[0].verb, 'pick up')
+        self.assertEqual(journal[0].words, ['lamp'])
+        self.assertEqual(
+            journal[0].handler,
+            get_handler_ref(self.registry['pick up'])
+        )
+
+    def test_parse(self):
+        parsed = self.dispatcher.parse('get lamp')
+        self.assertEqual(parsed.verb, 'get')
+        self.assertEqual(parsed.words, ['lamp'])
+        self.assertIs(parsed.binding, self.registry.get_binding('get'))
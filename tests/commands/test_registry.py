@@ -23,6 +23,22 @@ class CommandRegistryTestCase(TestCase):
         test_registry.add_command('sleep', sleep_fn)
         self.assertEqual(test_registry, {'sleep': sleep_fn})
 
+    def test_add_command_inspects_signature_once(self):
+        test_registry = CommandRegistry()
+        sleep_fn = lambda game: 'zzz'
+        test_registry.add_command('sleep', sleep_fn)
+        test_registry.add_command('nap', sleep_fn)
+        binding = test_registry.get_binding('sleep')
+        self.assertIs(test_registry.get_binding('nap'), binding)
+        self.assertTrue(binding.accepts_game)
+
+    def test_changes_increment_version(self):
+        test_registry = CommandRegistry()
+        test_registry.add_command('sleep', lambda game: 'zzz')
+        version = test_registry.version
+        test_registry.update({'run': lambda game: None})
+        self.assertGreater(test_registry.version, version)
+
 
 class RegistryInstanceTestCase(TestCase):
     def test_registry_type(self):
@@ -36,3 +52,10 @@ class CommandDecoratorTestCase(TestCase):
         self.assertIn('talk', registry.commands)
         self.assertEqual(registry['talk'], command_verb)
         self.assertEqual(command_verb('foo'), talk('foo'))
+
+    def test_stacked_decorators_keep_signature(self):
+        def shout(words, game):
+            pass
+        command('yell')(command('shout')(shout))
+        self.assertEqual(registry.get_binding('yell').parameter_count, 1)
+        self.assertTrue(registry.get_binding('yell').accepts_game)
@@ -0,0 +1,99 @@
+import io
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from adventure.commands.dispatch import Dispatcher
+from adventure.commands.registry import CommandRegistry, registry
+from adventure.commands.replay import (
+    CommandJournal, JournalEntry, ReplayEngine, ReplayReport, get_handler_ref
+)
+from adventure.exc import ReplayError
+from tests.worlds import build_castle, serialize
+
+
+class CommandJournalTestCase(TestCase):
+    def test_record(self):
+        journal = CommandJournal()
+        journal.record('get', ['lamp'], serialize)
+        self.assertEqual(journal, [
+            JournalEntry('get', ['lamp'], get_handler_ref(serialize))
+        ])
+
+    def test_dump_and_load(self):
+        journal = CommandJournal([
+            JournalEntry('get', ['brass lamp'], 'module.get'),
+            JournalEntry('look', [], 'module.look'),
+        ])
+        journal_file = io.StringIO()
+        journal.dump(journal_file)
+        journal_file.seek(0)
+        self.assertEqual(CommandJournal.load(journal_file), journal)
+
+
+class ReplayEngineTestCase(TestCase):
+    def setUp(self):
+        self.game = build_castle()
+        self.outputter = MagicMock()
+        self.dispatcher = Dispatcher(outputter=self.outputter)
+        self.engine = ReplayEngine()
+
+    def record(self, game, lines):
+        journal = CommandJournal()
+        for line in lines:
+            self.dispatcher.dispatch(line, game, journal)
+        return journal
+
+    def test_replay_reproduces_session(self):
+        lines = ['get lamp', 'move d', 'drop lamp', 'drop key', 'look']
+        played = self.game.fork()
+        journal = self.record(played, lines)
+        replayed = self.game.fork()
+        report = self.engine.replay(journal, replayed)
+        self.assertEqual(serialize(replayed), serialize(played))
+        self.assertEqual(report.command_count, len(lines))
+        self.assertEqual(report.error_count, 0)
+
+    def test_replay_discards_output(self):
+        journal = self.record(self.game.fork(), ['look'])
+        self.outputter.reset_mock()
+        self.game.outputter = self.outputter
+        self.engine.replay(journal, self.game)
+        self.outputter.display_location_name.assert_not_called()
+        self.assertIs(self.game.outputter, self.outputter)
+
+    def test_counts_argument_errors(self):
+        journal = CommandJournal([
+            JournalEntry('look', ['around'], get_handler_ref(registry['look']))
+        ])
+        report = self.engine.replay(journal, self.game)
+        self.assertEqual(report.error_count, 1)
+
+    def test_changed_handler(self):
+        test_registry = CommandRegistry()
+        test_registry.add_command('look', lambda game: None)
+        journal = self.record(self.game.fork(), ['look'])
+        with self.assertRaises(ReplayError):
+            ReplayEngine(test_registry).replay(journal, self.game)
+
+
+class ReplayReportTestCase(TestCase):
+    def setUp(self):
+        self.report = ReplayReport(
+            ['look', 'get', 'look', 'look'],
+            [0.001, 0.004, 0.002, 0.003],
+            0.02,
+            0
+        )
+
+    def test_throughput(self):
+        self.assertEqual(self.report.throughput, 200)
+
+    def test_percentile(self):
+        self.assertEqual(self.report.percentile(0.5), 0.002)
+        self.assertEqual(self.report.percentile(1.0), 0.004)
+
+    def test_by_verb(self):
+        by_verb = self.report.by_verb()
+        self.assertEqual(by_verb['look'][0], 3)
+        self.assertAlmostEqual(by_verb['look'][1], 0.006)
+        self.assertEqual(by_verb['get'][0], 1)
@@ -29,3 +29,11 @@ class BaseOutputterTestCase(TestCase):
     def test_display_person_reaction(self):
         with self.assertRaises(NotImplementedError):
             self.dummy.display_person_reaction('Jane', 'Hello!')
+
+    def test_frame_calls_hooks(self):
+        calls = []
+        self.dummy.begin_frame = lambda: calls.append('begin')
+        self.dummy.end_frame = lambda: calls.append('end')
+        with self.dummy.frame():
+            calls.append('body')
+        self.assertEqual(calls, ['begin', 'body', 'end'])
@@ -0,0 +1,79 @@
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from adventure.display.buffered_text import BufferedTextOutputter
+
+
+class BufferedTextOutputterTestCase(TestCase):
+    def setUp(self):
+        self.stream = StringIO()
+        self.write = patch.object(
+            self.stream,
+            'write',
+            wraps=self.stream.write
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def test_frame_written_at_once(self):
+        outputter = BufferedTextOutputter(self.stream)
+        with outputter.frame():
+            outputter.display_location_name('Elsinore')
+            outputter.display_game_text('A drafty Danish castle.')
+            outputter.display_person_reaction('Hamlet', 'To be...')
+            self.write.assert_not_called()
+        self.write.assert_called_once_with(
+            'Elsinore\nA drafty Danish castle.\nTo be...\n'
+        )
+
+    def test_output_outside_frame_written_immediately(self):
+        outputter = BufferedTextOutputter(self.stream)
+        outputter.display_game_text('Hello')
+        self.assertEqual(self.stream.getvalue(), 'Hello\n')
+
+    def test_nested_frames(self):
+        outputter = BufferedTextOutputter(self.stream)
+        with outputter.frame():
+            with outputter.frame():
+                outputter.display_game_text('Inner')
+            self.assertEqual(self.stream.getvalue(), '')
+        self.assertEqual(self.stream.getvalue(), 'Inner\n')
+
+    def test_frames_per_flush(self):
+        outputter = BufferedTextOutputter(self.stream, frames_per_flush=2)
+        with outputter.frame():
+            outputter.display_game_text('One')
+        self.assertEqual(self.stream.getvalue(), '')
+        with outputter.frame():
+            outputter.display_game_text('Two')
+        self.write.assert_called_once_with('One\nTwo\n')
+
+    def test_max_buffer_size(self):
+        outputter = BufferedTextOutputter(
+            self.stream,
+            frames_per_flush=None,
+            max_buffer_size=8
+        )
+        with outputter.frame():
+            outputter.display_game_text('1234')
+            self.assertEqual(self.stream.getvalue(), '')
+            outputter.display_game_text('5678')
+            self.assertEqual(self.stream.getvalue(), '1234\n5678\n')
+
+    def test_manual_flush(self):
+        outputter = BufferedTextOutputter(self.stream, frames_per_flush=None)
+        with outputter.frame():
+            outputter.display_game_text('Later')
+        self.assertEqual(self.stream.getvalue(), '')
+        outputter.flush()
+        self.assertEqual(self.stream.getvalue(), 'Later\n')
+
+    def test_flush_empty_buffer(self):
+        outputter = BufferedTextOutputter(self.stream)
+        outputter.flush()
+        self.write.assert_not_called()
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_defaults_to_stdout(self, mock_stdout):
+        BufferedTextOutputter().display_game_text('Hello')
+        self.assertEqual(mock_stdout.getvalue(), 'Hello\n')
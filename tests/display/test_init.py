@@ -0,0 +1,75 @@
+import threading
+from contextvars import copy_context
+from io import StringIO
+from unittest import TestCase
+
+from adventure.commands.built_ins import look
+from adventure.display import active_outputter, get_outputter, outputter
+from adventure.display.buffered_text import BufferedTextOutputter
+from adventure.models import Game, Location, Player
+
+
+def make_game(name, game_outputter=None):
+    location = Location(name, 'Somewhere.')
+    return Game(
+        name,
+        '',
+        Player(location),
+        [location],
+        outputter=game_outputter
+    )
+
+
+class GetOutputterTestCase(TestCase):
+    def test_defaults_to_package_outputter(self):
+        self.assertIs(get_outputter(), outputter)
+        self.assertIs(get_outputter(make_game('Elsinore')), outputter)
+
+    def test_active_outputter(self):
+        session_outputter = BufferedTextOutputter()
+
+        def get_active():
+            active_outputter.set(session_outputter)
+            return get_outputter()
+
+        self.assertIs(copy_context().run(get_active), session_outputter)
+        self.assertIs(get_outputter(), outputter)
+
+    def test_game_outputter_takes_precedence(self):
+        game_outputter = BufferedTextOutputter()
+        game = make_game('Elsinore', game_outputter)
+
+        def get_for_game():
+            active_outputter.set(BufferedTextOutputter())
+            return get_outputter(game)
+
+        self.assertIs(copy_context().run(get_for_game), game_outputter)
+
+    def test_setting_game_outputter_leaves_game_clean(self):
+        game = make_game('Elsinore')
+        game.mark_clean()
+        game.outputter = BufferedTextOutputter()
+        self.assertFalse(game.is_dirty)
+
+    def test_threads_do_not_interleave(self):
+        streams = {}
+
+        def play(name):
+            streams[name] = StringIO()
+            game = make_game(name, BufferedTextOutputter(streams[name]))
+            for _ in range(200):
+                look(game)
+
+        threads = [
+            threading.Thread(target=play, args=(name,))
+            for name in ('Elsinore', 'Inverness')
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for name, stream in streams.items():
+            self.assertEqual(
+                stream.getvalue(),
+                '{}\nSomewhere.\n'.format(name) * 200
+            )
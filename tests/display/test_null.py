@@ -0,0 +1,15 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from adventure.display.null import NullOutputter
+
+
+@patch('builtins.print')
+class NullOutputterTestCase(TestCase):
+    def test_displays_nothing(self, mock_print):
+        outputter = NullOutputter()
+        with outputter.frame():
+            outputter.display_location_name('location_name')
+            outputter.display_game_text('This is some text')
+            outputter.display_person_reaction('Jane', 'Hello!')
+        mock_print.assert_not_called()
@@ -1,8 +1,14 @@
 import json
 import os
+import subprocess
+import sys
 from unittest import TestCase
 
+from adventure import fixtures
 from adventure.fixtures import load_fixture
+from adventure.models import Arena, Direction
+from adventure.models.arena import default_arena
+from adventure.models.flyweights import flyweights
 
 
 class DummyModel:
@@ -30,3 +36,38 @@ class LoadFixtureTestCase(TestCase):
     @classmethod
     def tearDownClass(cls):
         os.remove(cls.file_path)
+
+
+class LazyFixturesTestCase(TestCase):
+    def test_not_loaded_on_import(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import adventure.fixtures as f; print("genders" in vars(f))',
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_loaded_on_access(self):
+        self.assertEqual(fixtures.directions[0].name, 'north')
+        self.assertEqual(fixtures.genders[0].gender, 'male')
+
+    def test_registered_as_flyweights(self):
+        direction = fixtures.directions[0]
+        self.assertIs(
+            flyweights.intern(Direction, direction.serialize()),
+            direction
+        )
+
+    def test_joined_default_arena(self):
+        with Arena().activate():
+            fixtures.load_fixtures()
+        self.assertIs(fixtures.genders[0].arena, default_arena)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            fixtures.colors
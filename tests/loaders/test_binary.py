@@ -0,0 +1,95 @@
+from io import BytesIO
+from unittest import TestCase
+
+from adventure.loaders.binary import (
+    BinaryDecoder, BinaryEncoder, END, ITERATION, MAGIC, RECORD
+)
+from adventure.models.base import SerializedReference
+
+
+class BinaryRoundTripTestCase(TestCase):
+    def round_trip(self, value, chunk_size=65536):
+        stream_file = BytesIO()
+        encoder = BinaryEncoder(stream_file)
+        encoder.write_value(value)
+        encoder.flush()
+        stream_file.seek(0)
+        decoder = BinaryDecoder(stream_file, chunk_size=chunk_size)
+        return decoder.read_value()
+
+    def test_scalars(self):
+        for value in (None, True, False, 0, 1, -1, 300, -2 ** 70, 1.5, ''):
+            self.assertEqual(self.round_trip(value), value)
+            self.assertIs(type(self.round_trip(value)), type(value))
+
+    def test_strings(self):
+        value = ['café', 'café', 'x' * 1000]
+        self.assertEqual(self.round_trip(value), value)
+        self.assertEqual(self.round_trip(value, chunk_size=1), value)
+
+    def test_containers(self):
+        value = {'name': 'lamp', 'synonym_names': ['lantern'], 'nested': {}}
+        self.assertEqual(self.round_trip(value), value)
+
+    def test_reference(self):
+        reference = SerializedReference('adventure.models.item.Item', 130)
+        decoded = self.round_trip([reference, reference])
+        self.assertEqual(decoded, [reference, reference])
+        self.assertIsInstance(decoded[0], SerializedReference)
+
+    def test_non_integer_reference_identifier(self):
+        reference = SerializedReference('adventure.models.item.Item', '42')
+        self.assertEqual(self.round_trip(reference), reference)
+
+    def test_repeated_strings_interned(self):
+        stream_file = BytesIO()
+        encoder = BinaryEncoder(stream_file)
+        encoder.write_value({'description': 'A nondescript room'})
+        first_size = len(encoder.buffer)
+        encoder.write_value({'description': 'A nondescript room'})
+        # RECORD tag, length, DICT tag, count and two interned strings
+        self.assertEqual(len(encoder.buffer) - first_size, 8)
+
+    def test_unserializable_value(self):
+        encoder = BinaryEncoder(BytesIO())
+        with self.assertRaises(TypeError):
+            encoder.write_value(object())
+
+
+class BinaryDecoderTestCase(TestCase):
+    def test_read_magic(self):
+        BinaryDecoder(BytesIO(MAGIC)).read_magic()
+
+    def test_read_bad_magic(self):
+        with self.assertRaises(ValueError):
+            BinaryDecoder(BytesIO(b'{"json": true}')).read_magic()
+
+    def test_structural_tags(self):
+        stream_file = BytesIO()
+        encoder = BinaryEncoder(stream_file)
+        encoder.write_tag(ITERATION)
+        encoder.write_value(1)
+        encoder.write_value(2)
+        encoder.write_tag(END)
+        encoder.flush()
+        stream_file.seek(0)
+        decoder = BinaryDecoder(stream_file)
+        self.assertEqual(decoder.read_tag(), ITERATION)
+        self.assertEqual(decoder.peek_tag(), RECORD)
+        self.assertEqual(decoder.read_value(), 1)
+        self.assertEqual(decoder.read_value(), 2)
+        self.assertEqual(decoder.read_tag(), END)
+
+    def test_value_expected(self):
+        decoder = BinaryDecoder(BytesIO(bytes([END])))
+        with self.assertRaises(ValueError):
+            decoder.read_value()
+
+    def test_truncated_file(self):
+        stream_file = BytesIO()
+        encoder = BinaryEncoder(stream_file)
+        encoder.write_value('truncated')
+        encoder.flush()
+        decoder = BinaryDecoder(BytesIO(stream_file.getvalue()[:-2]))
+        with self.assertRaises(ValueError):
+            decoder.read_value()
@@ -0,0 +1,213 @@
+import json
+import os
+from io import BytesIO, StringIO
+from unittest import TestCase
+
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.formats import (
+    BinaryFormat, FormatRegistry, IndexedJSONFormat, JSONFormat, formats
+)
+from adventure.models import (
+    Direction, Exit, Game, Gender, Item, Location, Person, Player
+)
+from tests.worlds import serialize
+
+
+class FormatRegistryTestCase(TestCase):
+    def test_add_format(self):
+        registry = FormatRegistry()
+        json_format = JSONFormat()
+        registry.add_format(json_format)
+        self.assertEqual(registry, {'json': json_format})
+
+    def test_get_format(self):
+        self.assertIsInstance(formats.get_format('json'), JSONFormat)
+        self.assertIsInstance(formats.get_format('advb'), BinaryFormat)
+
+    def test_get_unknown_format(self):
+        with self.assertRaises(UnsupportedFormatError):
+            formats.get_format('xml')
+
+
+class SaveFormatTestCase(TestCase):
+    serialized_objects = {
+        'game': {'title': 'Hamlet', '_identifier': 1},
+        'items': [{'name': 'skull'}, {'name': 'rapier'}],
+        'exits': [],
+    }
+
+    def round_trip(self, save_format, stream_file_cls):
+        save_file = stream_file_cls()
+        save_format.dump(self.serialized_objects, save_file)
+        return save_format.load(stream_file_cls(save_file.getvalue()))
+
+    def iterate_streamed_sections(self, save_format, stream_file_cls):
+        save_file = stream_file_cls()
+        save_format.dump_sections(
+            (
+                (section, content if isinstance(content, dict)
+                 else iter(content))
+                for section, content in self.serialized_objects.items()
+            ),
+            save_file
+        )
+        return list(save_format.iterate_sections(
+            stream_file_cls(save_file.getvalue())
+        ))
+
+    def test_json_round_trip(self):
+        self.assertEqual(
+            self.round_trip(JSONFormat(), StringIO),
+            self.serialized_objects
+        )
+
+    def test_binary_round_trip(self):
+        self.assertEqual(
+            self.round_trip(BinaryFormat(), BytesIO),
+            self.serialized_objects
+        )
+
+    def test_streamed_sections(self):
+        expected = [
+            ('game', {'title': 'Hamlet', '_identifier': 1}),
+            ('items', {'name': 'skull'}),
+            ('items', {'name': 'rapier'}),
+        ]
+        self.assertEqual(
+            self.iterate_streamed_sections(JSONFormat(), StringIO),
+            expected
+        )
+        self.assertEqual(
+            self.iterate_streamed_sections(BinaryFormat(), BytesIO),
+            expected
+        )
+
+
+class IndexedJSONFormatTestCase(TestCase):
+    serialized_objects = {
+        'game': {'title': 'Hamlet', '_identifier': 1},
+        'items': [
+            {'name': 'skull', '_identifier': 12},
+            {'name': 'rapier', '_identifier': 3},
+            {'name': 'letter', '_identifier': 140},
+        ],
+        'exits': [],
+    }
+
+    def dump(self):
+        save_file = BytesIO()
+        IndexedJSONFormat().dump(self.serialized_objects, save_file)
+        save_file.seek(0)
+        return save_file
+
+    def test_round_trip(self):
+        save_file = self.dump()
+        self.assertEqual(
+            IndexedJSONFormat().load(save_file),
+            self.serialized_objects
+        )
+
+    def test_read_objects(self):
+        save_format = IndexedJSONFormat()
+        save_file = self.dump()
+        index = save_format.read_index(save_file)
+        self.assertEqual(list(index['items']), ['3', '12', '140'])
+        self.assertEqual(list(reversed(index['items'])), ['140', '12', '3'])
+        self.assertEqual(len(index['exits']), 0)
+        for serialized_obj in self.serialized_objects['items']:
+            position = index['items'][str(serialized_obj['_identifier'])]
+            self.assertEqual(
+                save_format.read_object(save_file, position),
+                serialized_obj
+            )
+        self.assertEqual(
+            save_format.read_object(save_file, index['game']),
+            self.serialized_objects['game']
+        )
+        for identifier in ('0', '4', '141', 'skull'):
+            self.assertNotIn(identifier, index['items'])
+
+    def test_read_index_of_dict_positions(self):
+        # Index as written before positions were held in records
+        document = '{"index_offset": "0000000000000000", "items": ['
+        positions = {}
+        for serialized_obj in reversed(self.serialized_objects['items']):
+            text = json.dumps(serialized_obj)
+            positions[str(serialized_obj['_identifier'])] = [
+                len(document), len(text)
+            ]
+            document += text + ', '
+        document = document[:-2] + '], "index": '
+        document = '{}{:016d}{}'.format(
+            document[:18], len(document), document[34:]
+        )
+        document += json.dumps({'items': positions}) + '}'
+        save_format = IndexedJSONFormat()
+        save_file = BytesIO(document.encode('ascii'))
+
+        index = save_format.read_index(save_file)
+        self.assertEqual(list(index['items']), ['3', '12', '140'])
+        self.assertEqual(
+            save_format.read_object(save_file, index['items']['140']),
+            {'name': 'letter', '_identifier': 140}
+        )
+
+
+class GameRoundTripTestCase(TestCase):
+    def setUp(self):
+        gender = Gender('dinosaur', 'it', 'rawr', 'grhm?')
+        self.location = Location('Place A', 'This is place A.')
+        other_location = Location(
+            'Place B',
+            'This is place B.',
+            items=[Item('thing', synonym_names=['object'])],
+            people=[Person('Macbeth', 'Shifty guy', gender)],
+            exits=[Exit(Direction('backwards', 'b'), self.location)],
+        )
+        self.location.exits = [
+            Exit(Direction('forwards', 'f'), other_location)
+        ]
+        player = Player(self.location, inventory=[Item('dagger')], score=3)
+        self.game = Game(
+            'Serializable Game',
+            'Once upon a time',
+            player=player,
+            locations=[self.location, other_location],
+        )
+        self.file_name = 'format_round_trip'
+
+    def tearDown(self):
+        for extension in formats:
+            file_path = GameLoader(extension=extension).get_file_path(
+                self.file_name
+            )
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def test_round_trip(self):
+        for extension in formats:
+            for stream in (False, True):
+                GameSaver(self.game, extension=extension).save(
+                    self.file_name,
+                    stream=stream
+                )
+                for stream_load in (False, True):
+                    game = GameLoader(extension=extension).load(
+                        self.file_name,
+                        stream=stream_load
+                    )
+                    self.assertEqual(
+                        serialize(game),
+                        serialize(self.game)
+                    )
+
+    def test_binary_smaller_than_json(self):
+        sizes = {}
+        for extension in ('json', 'advb'):
+            saver = GameSaver(self.game, extension=extension)
+            saver.save(self.file_name)
+            sizes[extension] = os.path.getsize(
+                saver.get_file_path(self.file_name)
+            )
+        self.assertLess(sizes['advb'], sizes['json'] / 2)
@@ -0,0 +1,105 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.formats import IndexedJSONFormat
+from adventure.models import Game, Item, Location, Player
+from adventure.models.base import get_model_ref
+from tests.worlds import build_castle
+
+
+class IndexedSaveFileTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.game = build_castle()
+        self.player = self.game.player
+        self.hall, self.cellar = self.game.locations
+        (self.lamp,) = self.hall.items
+        self.saver = GameSaver(
+            self.game, directory=directory.name, extension='ijson'
+        )
+        self.saver.save('castle')
+        self.loader = GameLoader(directory=directory.name, extension='ijson')
+
+    def open(self):
+        save_file = self.loader.open_indexed('castle')
+        self.addCleanup(save_file.close)
+        return save_file
+
+    def test_read(self):
+        save_file = self.open()
+        self.assertEqual(
+            save_file.read(get_model_ref(Location), self.hall._identifier),
+            self.hall.serialize()
+        )
+        self.assertEqual(
+            save_file.read(get_model_ref(Game), self.game._identifier),
+            self.game.serialize()
+        )
+
+    def test_read_reference(self):
+        save_file = self.open()
+        player = save_file.read_section('player')
+        (key,) = player['inventory']
+        self.assertEqual(save_file.read_reference(key)['name'], 'key')
+        location = save_file.read_reference(player['location'])
+        self.assertEqual(location['name'], 'Hall')
+
+    def test_reads_only_objects_asked_for(self):
+        save_file = self.open()
+        with patch.object(
+                IndexedJSONFormat, 'read_object', autospec=True,
+                side_effect=IndexedJSONFormat.read_object
+        ) as read_object:
+            save_file.read(get_model_ref(Item), self.lamp._identifier)
+        read_object.assert_called_once()
+
+    def test_missing_objects(self):
+        save_file = self.open()
+        with self.assertRaises(KeyError):
+            save_file.read(get_model_ref(Item), 999)
+        with self.assertRaises(KeyError):
+            save_file.read(get_model_ref(Player), self.player._identifier + 1)
+
+    def test_applies_journal(self):
+        self.lamp.name = 'lantern'
+        with self.game.arena.activate():
+            self.hall.items.append(Item('rope'))
+        rope = self.hall.items[-1]
+        self.saver.save_delta('castle')
+        save_file = self.open()
+        item_ref = get_model_ref(Item)
+        self.assertEqual(
+            save_file.read(item_ref, self.lamp._identifier)['name'],
+            'lantern'
+        )
+        self.assertEqual(
+            save_file.read(item_ref, rope._identifier)['name'],
+            'rope'
+        )
+        self.assertIn(rope._identifier, save_file.get_identifiers('items'))
+        self.assertEqual(save_file.get_max_identifier('items'), (
+            rope._identifier
+        ))
+        self.assertEqual(save_file.get_max_identifier('people'), (
+            self.cellar.people[0]._identifier
+        ))
+
+    def test_reads_snapshot_opened(self):
+        save_file = self.open()
+        self.hall.name = 'Great Hall'
+        self.saver.save('castle')
+        self.assertEqual(
+            save_file.read_section('locations', self.hall._identifier)[
+                'name'
+            ],
+            'Hall'
+        )
+
+    def test_unsupported_format(self):
+        loader = GameLoader(directory=self.loader.directory)
+        with self.assertRaises(UnsupportedFormatError):
+            loader.open_indexed('castle')
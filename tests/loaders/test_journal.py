@@ -0,0 +1,110 @@
+import json
+import os
+from unittest import TestCase
+
+from adventure.loaders.journal import (
+    append_entry, apply_entries, apply_entries_to_sections, get_journal_path,
+    merge_entries, read_entries
+)
+
+
+class GetJournalPathTestCase(TestCase):
+    def test_appends_extension(self):
+        self.assertEqual(
+            get_journal_path('/tmp/save.json'),
+            '/tmp/save.json.journal'
+        )
+
+
+class ReadWriteEntriesTestCase(TestCase):
+    def setUp(self):
+        self.journal_path = 'test_journal.journal'
+
+    def tearDown(self):
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def test_missing_journal(self):
+        self.assertEqual(list(read_entries(self.journal_path)), [])
+
+    def test_round_trip(self):
+        entries = [{'player': {'score': 1}}, {'items': [{'_identifier': 1}]}]
+        for entry in entries:
+            append_entry(self.journal_path, entry)
+        self.assertEqual(list(read_entries(self.journal_path)), entries)
+
+    def test_stops_at_incomplete_entry(self):
+        append_entry(self.journal_path, {'player': {'score': 1}})
+        with open(self.journal_path, 'a') as journal_file:
+            journal_file.write(json.dumps({'player': {'score': 2}})[:-3])
+        self.assertEqual(
+            list(read_entries(self.journal_path)),
+            [{'player': {'score': 1}}]
+        )
+
+
+class ApplyEntriesTestCase(TestCase):
+    def setUp(self):
+        self.entries = [
+            {
+                'player': {'score': 1},
+                'items': [{'_identifier': 2, 'name': 'lamp'}],
+            },
+            {
+                'player': {'score': 5},
+                'items': [
+                    {'_identifier': 2, 'name': 'lit lamp'},
+                    {'_identifier': 3, 'name': 'key'},
+                ],
+            },
+        ]
+
+    def test_merge_entries(self):
+        single_objects, listed_objects = merge_entries(self.entries)
+        self.assertEqual(single_objects, {'player': {'score': 5}})
+        self.assertEqual(
+            listed_objects,
+            {
+                'items': {
+                    2: {'_identifier': 2, 'name': 'lit lamp'},
+                    3: {'_identifier': 3, 'name': 'key'},
+                }
+            }
+        )
+
+    def test_apply_entries(self):
+        serialized_objects = {
+            'player': {'score': 0},
+            'items': [
+                {'_identifier': 1, 'name': 'rock'},
+                {'_identifier': 2, 'name': 'lamp'},
+            ],
+        }
+        apply_entries(serialized_objects, self.entries)
+        self.assertEqual(
+            serialized_objects,
+            {
+                'player': {'score': 5},
+                'items': [
+                    {'_identifier': 1, 'name': 'rock'},
+                    {'_identifier': 2, 'name': 'lit lamp'},
+                    {'_identifier': 3, 'name': 'key'},
+                ],
+            }
+        )
+
+    def test_apply_entries_to_sections(self):
+        sections = [
+            ('player', {'score': 0}),
+            ('items', {'_identifier': 1, 'name': 'rock'}),
+            ('items', {'_identifier': 2, 'name': 'lamp'}),
+        ]
+        self.assertEqual(
+            list(apply_entries_to_sections(iter(sections), self.entries)),
+            [
+                ('player', {'score': 5}),
+                ('items', {'_identifier': 1, 'name': 'rock'}),
+                ('items', {'_identifier': 2, 'name': 'lit lamp'}),
+                ('items', {'_identifier': 3, 'name': 'key'}),
+            ]
+        )
@@ -0,0 +1,122 @@
+import os
+from unittest import TestCase
+from unittest.mock import Mock
+
+from adventure import fixtures
+from adventure.commands.built_ins import goto
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.journal import get_journal_path
+from adventure.models import Location
+from adventure.models.base import LazyReference
+from tests.worlds import build_places, serialize
+
+
+class LazyLoadTestCase(TestCase):
+    def setUp(self):
+        self.game = build_places()
+        self.arena = self.game.arena
+        self.start, self.other, self.far = self.game.locations
+        self.file_name = 'lazy_load'
+        self.saver = GameSaver(self.game, extension='ijson')
+        self.saver.save(self.file_name)
+        self.loader = GameLoader(extension='ijson')
+
+    def tearDown(self):
+        file_path = self.loader.get_file_path(self.file_name)
+        for path in (file_path, get_journal_path(file_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_builds_player_location_only(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        self.assertEqual(game.player.location, self.start)
+        self.assertEqual(game.player.inventory[0].name, 'dagger')
+        exit = game.player.location.find_exit('f')
+        self.assertIsInstance(exit._destination, LazyReference)
+        self.assertIsInstance(list.__getitem__(game.locations, 1),
+                              LazyReference)
+
+    def test_following_exit_builds_destination(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        destination = game.player.location.find_exit('f').destination
+        self.assertEqual(destination.name, 'Place B')
+        self.assertEqual(destination.items.find('bone').name, 'skull')
+        self.assertEqual(destination.people[0].gender.gender, 'dinosaur')
+        self.assertIs(destination.find_exit('b').destination,
+                      game.player.location)
+        self.assertIs(game.locations[1], destination)
+        self.assertIsInstance(destination.find_exit('f')._destination,
+                              LazyReference)
+
+    def test_fully_resolved_game_matches(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        self.assertEqual(serialize(game), serialize(self.game))
+
+    def test_loaded_objects_clean(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        game.player.location.find_exit('f').destination
+        self.assertEqual(list(game.arena.dirty), [])
+
+    def test_loaded_into_own_arena(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        destination = game.player.location.find_exit('f').destination
+        self.assertIsNot(game.arena, self.arena)
+        self.assertIs(destination.arena, game.arena)
+        self.assertIs(
+            game.arena.get(Location, destination._identifier),
+            destination
+        )
+
+    def test_shares_canonical_directions(self):
+        self.start.exits[0].direction = fixtures.directions[0]
+        self.saver.save(self.file_name)
+        game = self.loader.load(self.file_name, lazy=True)
+        self.assertIs(
+            game.player.location.exits[0].direction,
+            fixtures.directions[0]
+        )
+
+    def test_goto_builds_nearer_locations_only(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        game.outputter = Mock()
+        goto('place b', game)
+        self.assertEqual(game.player.location.name, 'Place B')
+        self.assertIsInstance(list.__getitem__(game.locations, 2),
+                              LazyReference)
+        self.assertIsNone(game.arena.get(Location, self.far._identifier))
+        goto('place c', game)
+        self.assertEqual(game.player.location.name, 'Place C')
+
+    def test_fork_builds_unvisited_locations(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        fork = game.fork()
+        destination = fork.player.location.find_exit('f').destination
+        self.assertEqual(destination.name, 'Place B')
+        self.assertIs(destination.arena, fork.arena)
+        self.assertEqual(serialize(fork), serialize(self.game))
+
+    def test_applies_journal(self):
+        self.other.name = 'Renamed place B'
+        self.saver.save_delta(self.file_name)
+        game = self.loader.load(self.file_name, lazy=True)
+        destination = game.player.location.find_exit('f').destination
+        self.assertEqual(destination.name, 'Renamed place B')
+
+    def test_reserves_identifiers_of_unbuilt_objects(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        with game.arena.activate():
+            self.assertGreater(
+                Location('New place', '')._identifier,
+                self.far._identifier
+            )
+
+    def test_save_over_lazily_loaded_file(self):
+        game = self.loader.load(self.file_name, lazy=True)
+        GameSaver(game, extension='ijson').save(self.file_name, stream=True)
+        reloaded = self.loader.load(self.file_name)
+        self.assertEqual(serialize(reloaded), serialize(self.game))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(UnsupportedFormatError):
+            GameLoader().load(self.file_name, lazy=True)
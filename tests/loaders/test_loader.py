@@ -3,10 +3,13 @@ from unittest.mock import patch
 import json
 import os
 
-from adventure.loaders import GameLoader
+from adventure import fixtures
+from adventure.exc import UnsupportedFormatError
+from adventure.loaders import GameLoader, GameSaver
 from adventure.models import (
     Exit, Direction, Game, Gender, Item, Location, Person, Player
 )
+from tests.worlds import serialize
 
 
 class GameLoaderTestCase(TestCase):
@@ -61,12 +64,60 @@ class LoadTestCase(GameLoaderTestCase):
         self.assertEqual(loaded_game, self.game)
 
 
+class StreamAllGameObjectsTestCase(GameLoaderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_name = 'streamed_loadfile'
+        self.other_location = Location('Place B', 'This is place B.')
+        self.location.items = [self.item]
+        self.location.people = [self.person]
+        self.location.exits = [Exit(self.direction, self.other_location)]
+        self.other_location.exits = [self.exit]
+        self.player.inventory = [Item('dagger')]
+        self.game.locations = [self.location, self.other_location]
+        GameSaver(self.game).save(self.file_name)
+
+    def tearDown(self):
+        os.remove(self.loader.get_file_path(self.file_name))
+
+    def test_matches_unstreamed_load(self):
+        streamed_game = self.loader.load(self.file_name, stream=True)
+        game = self.loader.load(self.file_name)
+        self.assertEqual(serialize(streamed_game), serialize(game))
+
+    def test_resolves_references(self):
+        game = self.loader.load(self.file_name, stream=True)
+        location, other_location = game.locations
+        self.assertIs(location.exits[0].destination, other_location)
+        self.assertIs(other_location.exits[0].destination, location)
+        self.assertEqual(location.exits[0].direction, self.direction)
+        self.assertEqual(location.people[0].gender, self.gender)
+        self.assertEqual(location.items, [self.item])
+        self.assertIs(game.player.location, location)
+        self.assertEqual(game.player.inventory, self.player.inventory)
+
+    def test_shares_canonical_genders(self):
+        self.person.gender = fixtures.genders[0]
+        GameSaver(self.game).save(self.file_name)
+        game = self.loader.load(self.file_name, stream=True)
+        self.assertIs(game.locations[0].people[0].gender, fixtures.genders[0])
+
+
 class GetFilePathTestCase(GameLoaderTestCase):
     def test_file_extension(self):
         file_path = self.loader.get_file_path('file_name')
         _, extension = os.path.splitext(file_path)
         self.assertEqual(extension, '.json')
 
+    def test_extension_selects_format(self):
+        file_path = GameLoader(extension='advb').get_file_path('file_name')
+        _, extension = os.path.splitext(file_path)
+        self.assertEqual(extension, '.advb')
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(UnsupportedFormatError):
+            GameLoader(extension='xml')
+
     def test_includes_directory_path(self):
         file_path = self.loader.get_file_path('file_name')
         self.assertTrue(file_path.startswith(self.loader.directory))
@@ -134,6 +185,14 @@ class ReconstituteSimpleObjectsTestCase(GameLoaderTestCase):
         self.assertEqual(directions[1].name, 'south')
         self.assertEqual(directions[1].abbrev, 's')
 
+    def test_shares_canonical_directions(self):
+        directions, _, _ = GameLoader()._reconstitute_simple_objects(
+            directions=[fixtures.directions[0].serialize()],
+            genders=[],
+            items=[],
+        )
+        self.assertIs(directions[0], fixtures.directions[0])
+
     def test_creates_genders(self):
         _, genders, _ = GameLoader()._reconstitute_simple_objects(
             directions=[],
@@ -4,9 +4,12 @@ from unittest.mock import patch
 import json
 import os
 
-from adventure.loaders import GameSaver
+from adventure.exc import UnsupportedFormatError
+from adventure.fixtures import directions
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.journal import get_journal_path, read_entries
 from adventure.models import (
-    Exit, Direction, Game, Gender, Item, Location, Person, Player
+    Arena, Exit, Direction, Game, Gender, Item, Location, Person, Player
 )
 
 
@@ -60,6 +63,19 @@ class SaveTestCase(GameSaverTestCase):
             written_data = f.read()
         self.assertEqual(written_data, json.dumps(mock_serialized_objs))
 
+    def test_writes_all_game_objects(self):
+        self.location.items = [self.item]
+        self.location.exits = [self.exit]
+        self.location.people = [self.person]
+        self.game_saver.save(self.file_name)
+        with open(self.game_saver.get_file_path(self.file_name)) as f:
+            written_data = json.loads(f.read())
+        self.assertEqual(written_data['items'], [self.item.serialize()])
+        self.assertEqual(
+            written_data['directions'],
+            [self.direction.serialize()]
+        )
+
 
 class GetFilePathTestCase(GameSaverTestCase):
     def test_file_extension(self):
@@ -67,6 +83,17 @@ class GetFilePathTestCase(GameSaverTestCase):
         _, extension = os.path.splitext(file_path)
         self.assertEqual(extension, '.json')
 
+    def test_extension_selects_format(self):
+        file_path = GameSaver(self.game, extension='advb').get_file_path(
+            'file_name'
+        )
+        _, extension = os.path.splitext(file_path)
+        self.assertEqual(extension, '.advb')
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(UnsupportedFormatError):
+            GameSaver(self.game, extension='xml')
+
     def test_includes_directory_path(self):
         file_path = self.game_saver.get_file_path('savefile_name')
         self.assertTrue(file_path.startswith(self.game_saver.directory))
@@ -134,3 +161,163 @@ class SerializeGameObjectTestCase(GameSaverTestCase):
                 'directions': [self.direction.serialize()],
             }
         )
+
+
+class StreamGameObjectsTestCase(GameSaverTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_name = 'streamed_savefile'
+        other_location = Location('Place B', 'This is place B.')
+        self.location.items = [self.item]
+        self.location.exits = [self.exit, Exit(self.direction, other_location)]
+        self.location.people = [
+            self.person,
+            Person('Banquo', 'Ghostly', self.gender),
+        ]
+        self.player.inventory = [Item('dagger')]
+        self.game.locations = [self.location, other_location]
+
+    def tearDown(self):
+        os.remove(self.game_saver.get_file_path(self.file_name))
+
+    def test_matches_unstreamed_content(self):
+        self.game_saver.save(self.file_name, stream=True)
+        with open(self.game_saver.get_file_path(self.file_name)) as f:
+            written_data = json.loads(f.read())
+        game_objs = self.game_saver._extract_all_game_objects()
+        self.assertEqual(
+            written_data,
+            GameSaver._serialize_game_objects(self.game, **game_objs)
+        )
+
+    def test_loadable(self):
+        self.game_saver.save(self.file_name, stream=True)
+        game = GameLoader().load(self.file_name)
+        self.assertEqual(game, self.game)
+        self.assertEqual(game.locations, self.game.locations)
+        self.assertEqual(game.player.inventory, self.player.inventory)
+
+
+class SaveDeltaTestCase(GameSaverTestCase):
+    def setUp(self):
+        # Each game is a world of its own, tracking its own dirty objects
+        self.arena = Arena()
+        with self.arena.activate():
+            super().setUp()
+            self.other_location = Location('Place B', 'This is place B.')
+        self.file_name = 'delta_savefile'
+        self.location.exits = [self.exit]
+        self.location.items = [self.item]
+        self.game.locations = [self.location, self.other_location]
+        # Forget objects built by setUp but left out of the game
+        self.arena.dirty.clear()
+        self.file_path = self.game_saver.get_file_path(self.file_name)
+        self.journal_path = get_journal_path(self.file_path)
+
+    def tearDown(self):
+        for path in (self.file_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_full_save_without_snapshot(self):
+        self.game_saver.save_delta(self.file_name)
+        self.assertTrue(os.path.exists(self.file_path))
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_full_save_marks_clean_and_clears_journal(self):
+        self.game_saver.save(self.file_name)
+        self.player.score = 10
+        self.game_saver.save_delta(self.file_name)
+        self.assertTrue(os.path.exists(self.journal_path))
+        self.game_saver.save(self.file_name)
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertFalse(
+            any(obj.is_dirty for obj in self.game.iterate_objects())
+        )
+
+    def test_journals_only_changed_objects(self):
+        self.game_saver.save(self.file_name)
+        self.player.location = self.other_location
+        self.game_saver.save_delta(self.file_name)
+        self.assertEqual(
+            list(read_entries(self.journal_path)),
+            [{'player': json.loads(json.dumps(self.player.serialize()))}]
+        )
+
+    def test_unchanged_game_writes_nothing(self):
+        self.game_saver.save(self.file_name)
+        self.game_saver.save_delta(self.file_name)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_load_replays_journal(self):
+        self.game_saver.save(self.file_name)
+        self.location.items.remove(self.item)
+        self.player.inventory.append(self.item)
+        self.game_saver.save_delta(self.file_name)
+        with self.arena.activate():
+            new_item = Item('lantern')
+        self.other_location.items.append(new_item)
+        self.player.location = self.other_location
+        self.game_saver.save_delta(self.file_name)
+
+        for stream in (False, True):
+            game = GameLoader().load(self.file_name, stream=stream)
+            location, other_location = game.locations
+            self.assertEqual(location.items, [])
+            self.assertEqual(other_location.items, [new_item])
+            self.assertEqual(game.player.inventory, [self.item])
+            self.assertEqual(game.player.location, self.other_location)
+            self.assertFalse(
+                any(obj.is_dirty for obj in game.iterate_objects())
+            )
+
+    def test_journals_synonyms_edited_in_place(self):
+        self.game_saver.save(self.file_name)
+        self.item.synonym_names.append('widget')
+        self.game_saver.save_delta(self.file_name)
+        game = GameLoader().load(self.file_name)
+        self.assertIn('widget', game.locations[0].items[0].synonym_names)
+        self.assertIs(
+            game.locations[0].items.find('widget'),
+            game.locations[0].items[0]
+        )
+
+    def test_objects_built_outside_world_saved(self):
+        self.game_saver.save(self.file_name)
+        game = GameLoader().load(self.file_name)
+        location = game.locations[0]
+        sword = Item('sword')
+        self.assertNotIn(sword, location.items)
+        location.items.append(sword)
+        GameSaver(game).save_delta(self.file_name)
+        for save in (False, True):
+            if save:
+                GameSaver(game).save(self.file_name)
+            reloaded = GameLoader().load(self.file_name)
+            self.assertEqual(
+                [item.name for item in reloaded.locations[0].items],
+                ['thing', 'sword']
+            )
+
+    def test_new_directions_kept_apart_from_fixtures(self):
+        with Arena().activate():
+            north = directions[0]
+            portal = Direction('portal', 'p')
+            hall = Location('Hall', '')
+            hall.exits = [Exit(north, hall), Exit(portal, hall)]
+            game = Game('Portals', '', Player(hall), [hall])
+        self.assertNotEqual(north, portal)
+        GameSaver(game).save(self.file_name)
+        reloaded = GameLoader().load(self.file_name)
+        self.assertEqual(
+            [exit.direction.name for exit in reloaded.locations[0].exits],
+            ['north', 'portal']
+        )
+
+    def test_compact(self):
+        self.game_saver.save(self.file_name)
+        self.player.score = 42
+        self.game_saver.save_delta(self.file_name)
+        GameLoader().compact(self.file_name)
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(GameLoader().load(self.file_name).player.score, 42)
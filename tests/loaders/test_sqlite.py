@@ -0,0 +1,171 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.formats import formats
+from adventure.loaders.journal import get_journal_path
+from adventure.loaders.sqlite import SaveDatabase, get_transaction_paths
+from adventure.loaders.validator import validate_file
+from adventure.models import Item, Location
+from adventure.models.base import LazyReference, get_model_ref
+from tests.worlds import build_castle, serialize
+
+
+class SQLiteFormatTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.game = build_castle()
+        self.hall, self.cellar = self.game.locations
+        (self.lamp,) = self.hall.items
+        (self.down,) = self.hall.exits
+        self.saver = GameSaver(
+            self.game, directory=self.directory, extension='sqlite'
+        )
+        self.saver.save('castle')
+        self.loader = GameLoader(directory=self.directory, extension='sqlite')
+        self.file_path = self.loader.get_file_path('castle')
+
+    def open(self):
+        database = SaveDatabase(self.file_path, 'r')
+        self.addCleanup(database.close)
+        return database
+
+    def test_round_trip(self):
+        for stream in (False, True):
+            self.saver.save('castle', stream=stream)
+            for stream_load in (False, True):
+                game = self.loader.load('castle', stream=stream_load)
+                self.assertEqual(
+                    serialize(game),
+                    serialize(self.game)
+                )
+
+    def test_lazy_load(self):
+        game = self.loader.load('castle', lazy=True)
+        self.assertIsInstance(
+            list.__getitem__(game.locations, 1),
+            LazyReference
+        )
+        self.assertEqual(game.player.location.exits[0].destination.name, (
+            'Cellar'
+        ))
+        self.assertEqual(serialize(game), serialize(self.game))
+
+    def test_reference_columns(self):
+        database = self.open()
+        (exit,) = database.select(
+            'exits', destination=self.cellar._identifier
+        )
+        self.assertEqual(exit, self.down.serialize())
+        self.assertEqual(
+            database.select('people', gender=999),
+            []
+        )
+        with self.assertRaises(ValueError):
+            database.select('exits', name='down')
+
+    def test_read_objects(self):
+        with self.loader.open_indexed('castle') as save_file:
+            self.assertEqual(
+                save_file.read(get_model_ref(Item), self.lamp._identifier),
+                self.lamp.serialize()
+            )
+            player = save_file.read_section('player')
+            self.assertEqual(
+                save_file.read_reference(player['location'])['name'],
+                'Hall'
+            )
+            with self.assertRaises(KeyError):
+                save_file.read(get_model_ref(Item), 999)
+            self.assertEqual(save_file.get_max_identifier('items'), max(
+                self.lamp._identifier,
+                self.game.player.inventory[0]._identifier
+            ))
+
+    def test_delta_save_updates_rows(self):
+        self.lamp.name = 'lantern'
+        with self.game.arena.activate():
+            self.hall.items.append(Item('rope'))
+        self.game.player.score = 5
+        self.saver.save_delta('castle')
+        self.assertFalse(os.path.exists(get_journal_path(self.file_path)))
+
+        database = self.open()
+        self.assertEqual(database.read('items', self.lamp._identifier)[
+            'name'
+        ], 'lantern')
+        self.assertEqual(database.count('items'), 3)
+        game = self.loader.load('castle')
+        self.assertEqual(serialize(game), serialize(self.game))
+
+    def test_lazy_games_read_snapshot_loaded(self):
+        game = self.loader.load('castle', lazy=True)
+        self.cellar.description = 'Flooded'
+        self.saver.save_delta('castle')
+        other_game = self.loader.load('castle', lazy=True)
+        self.cellar.description = 'Dry'
+        self.saver.save_delta('castle')
+        self.assertEqual(
+            game.player.location.exits[0].destination.description,
+            'Damp'
+        )
+        self.assertEqual(
+            other_game.player.location.exits[0].destination.description,
+            'Flooded'
+        )
+        game = self.loader.load('castle', lazy=True)
+        self.assertEqual(
+            game.player.location.exits[0].destination.description,
+            'Dry'
+        )
+
+    def test_write_is_transactional(self):
+        def sections():
+            yield 'items', {'_identifier': 99, 'name': 'rope'}
+            raise RuntimeError()
+
+        with SaveDatabase(self.file_path, 'a') as database:
+            with self.assertRaises(RuntimeError):
+                database.write(sections())
+        with self.assertRaises(KeyError):
+            self.open().read('items', 99)
+
+    def test_replace_discards_interrupted_transaction(self):
+        paths = get_transaction_paths(self.file_path)
+        for path in paths:
+            with open(path, 'wb') as transaction_file:
+                transaction_file.write(b'\0' * 512)
+        self.saver.save('castle')
+        for path in paths:
+            self.assertFalse(os.path.exists(path))
+
+    def test_unreadable_files(self):
+        with self.assertRaises(FileNotFoundError):
+            self.loader.load('missing')
+        with open(self.file_path, 'w') as save_file:
+            save_file.write('{"game": {}}')
+        with self.assertRaises(ValueError):
+            self.loader.load('castle')
+        os.remove(self.file_path)
+        sqlite3.connect(self.file_path).close()
+        with self.assertRaises(ValueError):
+            self.loader.load('castle')
+
+    def test_validate(self):
+        self.assertTrue(validate_file(self.file_path).is_valid)
+        with SaveDatabase(self.file_path, 'a') as database:
+            database.write([('exits', dict(
+                self.down.serialize(),
+                destination={
+                    'model_ref': get_model_ref(Location),
+                    'identifier': 99,
+                }
+            ))])
+        self.assertFalse(validate_file(self.file_path).is_valid)
+
+    def test_registered(self):
+        self.assertEqual(formats.get_format('sqlite').extension, 'sqlite')
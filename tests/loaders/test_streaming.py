@@ -0,0 +1,63 @@
+from io import StringIO
+from unittest import TestCase
+import json
+
+from adventure.loaders.streaming import JSONStreamReader, iterate_sections
+
+
+class JSONStreamReaderTestCase(TestCase):
+    def test_decode_values_across_chunks(self):
+        reader = JSONStreamReader(
+            StringIO('  {"foo": [1, 2]}  12345 "bar"'),
+            chunk_size=3
+        )
+        self.assertEqual(reader.decode_value(), {'foo': [1, 2]})
+        self.assertEqual(reader.decode_value(), 12345)
+        self.assertEqual(reader.decode_value(), 'bar')
+        self.assertEqual(reader.peek(), '')
+
+    def test_expect(self):
+        reader = JSONStreamReader(StringIO('  ,'))
+        reader.expect(',')
+        self.assertEqual(reader.peek(), '')
+
+    def test_expect_raises_decode_error(self):
+        reader = JSONStreamReader(StringIO(':'))
+        with self.assertRaises(json.JSONDecodeError):
+            reader.expect(',')
+
+    def test_truncated_value_raises_decode_error(self):
+        reader = JSONStreamReader(StringIO('{"foo": '), chunk_size=2)
+        with self.assertRaises(json.JSONDecodeError):
+            reader.decode_value()
+
+
+class IterateSectionsTestCase(TestCase):
+    def test_flattens_arrays(self):
+        document = {
+            'game': {'title': 'Hamlet'},
+            'items': [{'name': 'skull'}, {'name': 'rapier'}],
+            'exits': [],
+            'score': 7,
+        }
+        for chunk_size in (1, 5, 65536):
+            sections = list(iterate_sections(
+                StringIO(json.dumps(document, indent=2)),
+                chunk_size=chunk_size
+            ))
+            self.assertEqual(
+                sections,
+                [
+                    ('game', {'title': 'Hamlet'}),
+                    ('items', {'name': 'skull'}),
+                    ('items', {'name': 'rapier'}),
+                    ('score', 7),
+                ]
+            )
+
+    def test_empty_object(self):
+        self.assertEqual(list(iterate_sections(StringIO(' { } '))), [])
+
+    def test_malformed_document(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iterate_sections(StringIO('{"items": [1 2]}')))
@@ -0,0 +1,117 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.templates import TemplateCache, get_digest, templates
+from tests.worlds import build_castle
+
+
+class TemplateCacheTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.game = build_castle()
+        self.hall = self.game.locations[0]
+        self.saver = GameSaver(self.game, directory=directory.name)
+        self.saver.save('castle')
+        self.file_path = self.saver.get_file_path('castle')
+        self.loader = GameLoader(directory=directory.name)
+        self.cache = TemplateCache()
+        self.load_patcher = patch.object(
+            GameLoader, 'load', autospec=True, side_effect=GameLoader.load
+        )
+
+    def get_game(self, **kwargs):
+        return self.cache.get_game(self.loader, 'castle', **kwargs)
+
+    def test_forks_template(self):
+        with self.load_patcher as load:
+            games = [self.get_game() for _ in range(3)]
+        load.assert_called_once_with(
+            self.loader, 'castle', stream=False, lazy=False
+        )
+        self.assertEqual(len({id(game) for game in games}), 3)
+        self.assertEqual(games[0].player.location.name, 'Hall')
+
+    def test_games_are_independent(self):
+        game = self.get_game()
+        game.player.inventory.append(game.player.location.items.pop())
+        game.player.location = game.player.location.exits[0].destination
+        other_game = self.get_game()
+        self.assertEqual(other_game.player.location.name, 'Hall')
+        self.assertEqual(
+            [item.name for item in other_game.player.location.items],
+            ['lamp']
+        )
+        self.assertEqual(
+            [item.name for item in other_game.player.inventory],
+            ['key']
+        )
+
+    def test_unchanged_contents_not_reloaded(self):
+        self.get_game()
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        with self.load_patcher as load:
+            self.get_game()
+        load.assert_not_called()
+
+    def test_changed_file_reloaded(self):
+        self.get_game()
+        self.hall.name = 'Great Hall'
+        self.saver.save('castle')
+        game = self.get_game()
+        self.assertEqual(game.player.location.name, 'Great Hall')
+
+    def test_changed_journal_reloaded(self):
+        self.get_game()
+        self.game.player.score = 5
+        self.saver.save_delta('castle')
+        self.assertEqual(self.get_game().player.score, 5)
+
+    def test_changed_write_ahead_log_reloaded(self):
+        self.loader = GameLoader(
+            directory=self.loader.directory, extension='sqlite'
+        )
+        self.saver = GameSaver(
+            self.game, directory=self.loader.directory, extension='sqlite'
+        )
+        self.saver.save('castle')
+        # The lazily loaded template keeps the update from being checkpointed
+        self.get_game(lazy=True)
+        self.game.player.score = 5
+        self.saver.save_delta('castle')
+        self.assertEqual(self.get_game(lazy=True).player.score, 5)
+
+    def test_digest(self):
+        digest = get_digest(self.file_path)
+        self.assertEqual(get_digest(self.file_path), digest)
+        self.game.player.score = 5
+        self.saver.save_delta('castle')
+        self.assertNotEqual(get_digest(self.file_path), digest)
+
+    def test_modes_kept_apart(self):
+        self.loader = GameLoader(
+            directory=self.loader.directory, extension='ijson'
+        )
+        GameSaver(
+            self.game, directory=self.loader.directory, extension='ijson'
+        ).save('castle')
+        self.get_game()
+        game = self.get_game(lazy=True)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(game.player.location.exits[0].destination.name, (
+            'Cellar'
+        ))
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache.get_game(self.loader, 'missing')
+
+    def test_loader_cached(self):
+        self.addCleanup(templates.clear)
+        game = self.loader.load('castle', cached=True)
+        self.assertEqual(game.player.location.name, 'Hall')
+        self.assertIn((self.file_path, False), templates)
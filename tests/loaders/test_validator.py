@@ -0,0 +1,263 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+from unittest.mock import patch
+
+from adventure.loaders import GameLoader, GameSaver
+from adventure.loaders.validator import (
+    Problem, iterate_sections, main, validate_file, validate_files,
+    validate_sections
+)
+from tests.worlds import build_castle, serialize
+
+
+def get_object(serialized_objects, section, name):
+    for serialized_obj in serialized_objects[section]:
+        if serialized_obj.get('name') == name:
+            return serialized_obj
+
+
+class ValidateSectionsTestCase(TestCase):
+    def setUp(self):
+        self.serialized = serialize(build_castle())
+        self.hall = get_object(self.serialized, 'locations', 'Hall')
+        self.cellar = get_object(self.serialized, 'locations', 'Cellar')
+
+    def validate(self):
+        return validate_sections(iterate_sections(self.serialized))
+
+    def test_valid(self):
+        self.assertEqual(self.validate(), [])
+
+    def test_missing_section(self):
+        del self.serialized['player']
+        self.assertIn(Problem('player', None, 'is missing'), self.validate())
+
+    def test_dangling_references(self):
+        del self.serialized['directions'][0]
+        self.hall['items'][0]['identifier'] = 99
+        problems = self.validate()
+        self.assertIn(
+            Problem(
+                'locations',
+                self.hall['_identifier'],
+                'items refers to missing items 99'
+            ),
+            problems
+        )
+        self.assertEqual(
+            sorted(problem.section for problem in problems),
+            ['exits', 'locations']
+        )
+
+    def test_reference_of_wrong_type(self):
+        self.hall['items'].append(self.cellar['exits'][0])
+        (problem,) = self.validate()
+        self.assertEqual(problem.identifier, self.hall['_identifier'])
+        self.assertIn('not to items', problem.message)
+
+    def test_duplicate_identifier(self):
+        self.serialized['items'].append(dict(self.serialized['items'][0]))
+        problems = self.validate()
+        self.assertEqual(problems[0].message, (
+            'shares its identifier with another'
+        ))
+
+    def test_missing_identifier(self):
+        del self.serialized['genders'][0]['_identifier']
+        problems = self.validate()
+        self.assertIn(
+            Problem('genders', None, 'holds an object without an identifier'),
+            problems
+        )
+
+    def test_unreachable_location(self):
+        self.hall['exits'] = []
+        (problem,) = self.validate()
+        self.assertEqual(
+            problem,
+            Problem(
+                'locations',
+                self.cellar['_identifier'],
+                "'Cellar' cannot be reached from the player's location"
+            )
+        )
+
+    def test_item_held_twice(self):
+        key = self.serialized['player']['inventory'][0]
+        self.hall['items'].append(key)
+        (problem,) = self.validate()
+        self.assertEqual(problem.section, 'items')
+        self.assertIn('location {}'.format(self.hall['_identifier']), (
+            problem.message
+        ))
+        self.assertIn("the player's inventory", problem.message)
+
+    def test_person_in_two_locations(self):
+        self.hall['people'] = list(self.cellar['people'])
+        (problem,) = self.validate()
+        self.assertEqual(problem.section, 'people')
+
+    def test_reports_every_problem(self):
+        self.hall['exits'] = [{'model_ref': 'nonsense', 'identifier': 1}]
+        self.cellar['items'] = 'lamp'
+        self.serialized['player']['location']['identifier'] = 42
+        # Neither location can be reached from a missing location
+        self.assertEqual(len(self.validate()), 5)
+
+    def test_malformed_objects(self):
+        self.serialized['items'].append('lamp')
+        self.hall['people'] = [None]
+        self.assertEqual(len(self.validate()), 2)
+
+    def test_malformed_model_references(self):
+        self.hall['items'][0]['model_ref'] = ['Item']
+        self.serialized['game']['player']['model_ref'] = {}
+        messages = [problem.message for problem in self.validate()]
+        self.assertIn("items refers to a ['Item'], not to items", messages)
+        self.assertIn('player refers to a {}, not to player', messages)
+
+    def test_malformed_identifiers(self):
+        self.serialized['items'][0]['_identifier'] = [1]
+        self.serialized['player']['_identifier'] = {}
+        self.hall['exits'][0]['identifier'] = ['down']
+        self.serialized['player']['location']['identifier'] = [1]
+        problems = self.validate()
+        self.assertIn(Problem('items', None, (
+            'holds an object whose identifier [1] is not an integer'
+        )), problems)
+        self.assertIn(Problem('player', None, (
+            'holds an object whose identifier {} is not an integer'
+        )), problems)
+        self.assertIn(
+            "exits holds {'model_ref': 'adventure.models.location.Exit', "
+            "'identifier': ['down']} instead of a reference",
+            [problem.message for problem in problems]
+        )
+
+
+class ValidateFileTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def save(self, file_name, serialized, extension='json'):
+        saver = GameSaver(None, directory=self.directory, extension=extension)
+        file_path = saver.get_file_path(file_name)
+        with saver.save_format.open(file_path, 'w') as save_file:
+            saver.save_format.dump(serialized, save_file)
+        return file_path
+
+    def test_formats(self):
+        serialized = serialize(build_castle())
+        for extension in ('json', 'ijson', 'advb'):
+            file_path = self.save('castle', serialized, extension)
+            self.assertTrue(validate_file(file_path).is_valid)
+
+    def test_applies_journal(self):
+        game = build_castle()
+        saver = GameSaver(game, directory=self.directory)
+        saver.save('castle')
+        game.player.location.items.append(game.player.inventory[0])
+        saver.save_delta('castle')
+        report = GameLoader(directory=self.directory).validate('castle')
+        self.assertEqual(
+            [problem.section for problem in report.problems],
+            ['items']
+        )
+
+    def test_unreadable_file(self):
+        file_path = os.path.join(self.directory, 'castle.json')
+        with open(file_path, 'w') as save_file:
+            save_file.write('{"game": ')
+        (problem,) = validate_file(file_path).problems
+        self.assertEqual(problem.section, 'file')
+        (problem,) = validate_file(file_path + '.missing').problems
+        self.assertEqual(problem.section, 'file')
+
+    def test_malformed_file(self):
+        file_path = self.save('castle', [serialize(build_castle())])
+        (problem,) = validate_file(file_path).problems
+        self.assertEqual(problem, Problem('file', None, (
+            'cannot be read (holds a list instead of sections)'
+        )))
+
+    def test_malformed_journal(self):
+        serialized = serialize(build_castle())
+        item = dict(serialized['items'][0])
+        for snapshot_items, entry in (
+                (serialized['items'], ['items']),
+                (serialized['items'], {'items': [{'name': 'rope'}]}),
+                (serialized['items'], {'items': [dict(item, _identifier=[])]}),
+                ({'lamp': item}, {'items': [item]}),
+        ):
+            file_path = self.save(
+                'castle',
+                dict(serialized, items=snapshot_items)
+            )
+            with open(file_path + '.journal', 'w') as journal_file:
+                journal_file.write(json.dumps(entry) + '\n')
+            (problem,) = validate_file(file_path).problems
+            self.assertEqual(problem.section, 'file')
+            self.assertIn('cannot be read', problem.message)
+
+    def test_unreadable_shapes(self):
+        file_path = self.save('castle', serialize(build_castle()))
+        with patch(
+                'adventure.loaders.validator.apply_entries',
+                side_effect=TypeError('unhashable type')
+        ):
+            (problem,) = validate_file(file_path).problems
+        self.assertEqual(problem, Problem('file', None, (
+            'cannot be read (TypeError: unhashable type)'
+        )))
+
+    def test_validator_bugs_raised(self):
+        file_path = self.save('castle', serialize(build_castle()))
+        with patch(
+                'adventure.loaders.validator.validate_sections',
+                side_effect=TypeError('unhashable type')
+        ):
+            with self.assertRaises(TypeError):
+                validate_file(file_path)
+
+    def test_validate_files(self):
+        valid = serialize(build_castle())
+        invalid = json.loads(json.dumps(valid))
+        invalid['player']['inventory'].append({
+            'model_ref': 'adventure.models.item.Item',
+            'identifier': 99,
+        })
+        malformed = dict(valid, items={'_identifier': []})
+        file_paths = [
+            self.save('castle-{}'.format(number), serialized)
+            for number, serialized in enumerate(
+                [valid, invalid, malformed] * 3
+            )
+        ]
+        for processes in (1, 2):
+            reports = validate_files(file_paths, processes=processes)
+            self.assertEqual(
+                [report.file_path for report in reports],
+                file_paths
+            )
+            self.assertEqual(
+                [report.is_valid for report in reports],
+                [True, False, False] * 3
+            )
+
+    def test_main(self):
+        file_path = self.save('castle', serialize(build_castle()))
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main([file_path, '--processes', '1']), 0)
+            self.assertEqual(
+                main([file_path + '.missing', '--processes', '1']),
+                1
+            )
+        self.assertIn('castle.json.missing: file: cannot be read', (
+            output.getvalue()
+        ))
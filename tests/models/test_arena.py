@@ -0,0 +1,113 @@
+import copy
+import gc
+import pickle
+import threading
+from unittest import TestCase
+
+from adventure.exc import FrozenWorldError
+from adventure.models import Arena, Item, Location
+from adventure.models.arena import default_arena, get_arena
+
+
+class ArenaTestCase(TestCase):
+    def setUp(self):
+        self.arena = Arena()
+
+    def test_allocate(self):
+        identifier = self.arena.allocate(Item)
+        self.assertEqual(self.arena.allocate(Item), identifier + 1)
+
+    def test_allocate_unique_across_arenas(self):
+        identifiers = {
+            arena.allocate(Item)
+            for arena in (self.arena, Arena(), default_arena)
+        }
+        self.assertEqual(len(identifiers), 3)
+
+    def test_reserve(self):
+        identifier = self.arena.allocate(Item) + 10
+        Arena().reserve(Item, identifier)
+        self.assertEqual(self.arena.allocate(Item), identifier + 1)
+        self.arena.reserve(Item, 3)
+        self.assertEqual(self.arena.allocate(Item), identifier + 2)
+
+    def test_map_changes_untracked_by_default(self):
+        with self.arena.activate():
+            location = Location('Hall', '')
+        self.arena.record_map_change(location)
+        self.assertIsNone(self.arena.map_changes)
+        self.assertEqual(self.arena.map_version, 0)
+
+    def test_record_map_change(self):
+        with self.arena.activate():
+            hall = Location('Hall', '')
+            cellar = Location('Cellar', '')
+        self.arena.track_map_changes()
+        self.arena.record_map_change(hall)
+        self.arena.record_map_change(cellar)
+        self.arena.record_map_change(hall)
+        self.assertEqual(self.arena.map_version, 3)
+        self.assertEqual(dict(self.arena.map_changes), {hall: 3, cellar: 2})
+
+    def test_frozen_while_forks_live(self):
+        self.assertFalse(self.arena.is_frozen)
+        fork = Arena()
+        self.arena.add_fork(fork)
+        self.assertTrue(self.arena.is_frozen)
+        self.assertFalse(fork.is_frozen)
+        with self.arena.loading():
+            self.assertFalse(self.arena.is_frozen)
+            with self.arena.activate():
+                Item('lamp')
+        with self.assertRaises(FrozenWorldError):
+            self.arena.check_modifiable()
+        # Thawed as soon as the fork is dropped, without a collection
+        del fork
+        self.assertFalse(self.arena.is_frozen)
+        self.arena.check_modifiable()
+
+    def test_allocation_across_threads_is_unique(self):
+        identifiers = []
+
+        def allocate():
+            identifiers.extend(
+                self.arena.allocate(Item) for _ in range(10000)
+            )
+
+        threads = [threading.Thread(target=allocate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(identifiers)), 80000)
+
+    def test_get(self):
+        with self.arena.activate():
+            item = Item('lamp')
+        self.assertIs(self.arena.get(Item, item._identifier), item)
+        self.assertIsNone(self.arena.get(Location, item._identifier))
+        self.assertIsNone(self.arena.get(Item, item._identifier + 1))
+
+    def test_discarded_objects_forgotten(self):
+        with self.arena.activate():
+            identifier = Item('lamp')._identifier
+        gc.collect()
+        self.assertIsNone(self.arena.get(Item, identifier))
+
+    def test_activate(self):
+        self.assertIs(get_arena(), default_arena)
+        with self.arena.activate():
+            self.assertIs(get_arena(), self.arena)
+        self.assertIs(get_arena(), default_arena)
+
+    def test_copies_join_active_arena(self):
+        with self.arena.activate():
+            item = Item('lamp')
+        other_arena = Arena()
+        with other_arena.activate():
+            copied = copy.deepcopy(item)
+            unpickled = pickle.loads(pickle.dumps(item))
+        for obj in (copied, unpickled):
+            self.assertIs(obj.arena, other_arena)
+            self.assertEqual(obj._identifier, item._identifier)
+        self.assertIs(self.arena.get(Item, item._identifier), item)
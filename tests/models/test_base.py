@@ -1,7 +1,15 @@
 from unittest import TestCase
 from unittest.mock import patch
 
-from adventure.models.base import BaseModel, SerializedReference
+from adventure.fixtures import directions
+from adventure.models import Arena, Direction, Exit, Item, Location
+from adventure.models.arena import default_arena
+from adventure.models.base import (
+    BaseModel, LazyReference, SerializedReference
+)
+
+
+north = directions[0]
 
 
 class BaseModelTestCase(TestCase):
@@ -55,24 +63,93 @@ class BaseModelInitTestCase(TestCase):
             def serialize(self):
                 pass
 
-        dummy_a = DummyModelA()
-        self.assertEqual(BaseModel.COUNT, 0)
-        self.assertEqual(DummyModelA.COUNT, 1)
-        self.assertEqual(DummyModelB.COUNT, 0)
+        with Arena().activate():
+            dummy_a = DummyModelA()
+            dummy_b = DummyModelB()
+            other_dummy_a = DummyModelA()
         self.assertEqual(dummy_a._identifier, 1)
+        self.assertEqual(dummy_b._identifier, 1)
+        self.assertEqual(other_dummy_a._identifier, 2)
 
     def test_sets_identifier(self):
         class DummyModelC(BaseModel):
             def serialize(self):
                 pass
 
-        dummy_1 = DummyModelC(_identifier=5)
+        with Arena().activate():
+            dummy_1 = DummyModelC(_identifier=5)
+            dummy_2 = DummyModelC(_identifier=2)
+            dummy_3 = DummyModelC()
         self.assertEqual(dummy_1._identifier, 5)
-        self.assertEqual(DummyModelC.COUNT, 5)
-
-        dummy_2 = DummyModelC(_identifier=2)
         self.assertEqual(dummy_2._identifier, 2)
-        self.assertEqual(DummyModelC.COUNT, 5)
+        self.assertEqual(dummy_3._identifier, 6)
+
+    def test_joins_active_arena(self):
+        class DummyModelD(BaseModel):
+            def serialize(self):
+                pass
+
+        arena = Arena()
+        with arena.activate():
+            dummy = DummyModelD()
+        self.assertIs(dummy.arena, arena)
+        self.assertIs(arena.get(DummyModelD, dummy._identifier), dummy)
+
+    def test_identifiers_unique_across_worlds(self):
+        class DummyModelE(BaseModel):
+            def serialize(self):
+                pass
+
+        with Arena().activate():
+            first = DummyModelE()
+        second = DummyModelE()
+        self.assertNotEqual(first._identifier, second._identifier)
+        self.assertNotEqual(first, second)
+        self.assertIsNot(first.arena, second.arena)
+
+
+class BaseModelTakeInTestCase(TestCase):
+    def setUp(self):
+        self.arena = Arena()
+        with self.arena.activate():
+            self.location = Location('Hall', '')
+            self.location.exits = [Exit(north, self.location)]
+        self.location.mark_clean()
+
+    def test_items_join_world_of_list(self):
+        item = Item('sword')
+        self.assertIs(item.arena, default_arena)
+        self.assertNotIn(item, self.location.items)
+        self.location.items.append(item)
+        self.assertIs(item.arena, self.arena)
+        self.assertIs(self.arena.get(Item, item._identifier), item)
+        self.assertIsNone(default_arena.get(Item, item._identifier))
+        self.assertIn(item, self.arena.dirty)
+        self.assertNotIn(item, default_arena.dirty)
+
+    def test_held_objects_join_too(self):
+        portal = Direction('portal', 'p')
+        exit = Exit(portal, Location('Void', '', items=[Item('dust')]))
+        self.location.exits.append(exit)
+        destination = exit.destination
+        for obj in (exit, portal, destination, destination.items[0]):
+            self.assertIs(obj.arena, self.arena)
+        self.assertNotEqual(portal, north)
+
+    def test_attributes_take_in_objects(self):
+        portal = Direction('portal', 'p')
+        self.location.exits[0].direction = portal
+        self.assertIs(portal.arena, self.arena)
+
+    def test_canonical_instances_stay_shared(self):
+        self.location.exits.append(Exit(north, self.location))
+        self.assertIs(north.arena, default_arena)
+
+    def test_objects_of_default_arena_stay(self):
+        location = Location('Hall', '')
+        item = Item('sword')
+        location.items.append(item)
+        self.assertIs(item.arena, default_arena)
 
 
 class BaseModelEquivalenceTestCase(TestCase):
@@ -102,6 +179,26 @@ class BaseModelEquivalenceTestCase(TestCase):
         self.assertFalse(dummy_1.__eq__(dummy_2))
         self.assertFalse(dummy_2.__eq__(dummy_1))
 
+    def test_equal_objects_hash_equally(self):
+        dummy_1 = self.EqualityModel(_identifier=4)
+        dummy_2 = self.EqualityModel(_identifier=4)
+        self.assertEqual(hash(dummy_1), hash(dummy_2))
+        self.assertEqual(len({dummy_1, dummy_2}), 1)
+
+    def test_hash_distinguishes_classes(self):
+        dummy_1 = self.EqualityModel(_identifier=7)
+        dummy_2 = self.OtherEqualityModel(_identifier=7)
+        self.assertEqual(len({dummy_1, dummy_2}), 2)
+
+    def test_subclass_not_equal(self):
+        class EqualitySubModel(self.EqualityModel):
+            pass
+
+        dummy_1 = self.EqualityModel(_identifier=4)
+        dummy_2 = EqualitySubModel(_identifier=4)
+        self.assertFalse(dummy_1.__eq__(dummy_2))
+        self.assertFalse(dummy_2.__eq__(dummy_1))
+
     def test_neq_returns_opposite_of_eq(self):
         dummy_1 = self.EqualityModel(_identifier=4)
         dummy_2 = self.EqualityModel(_identifier=4)
@@ -111,6 +208,45 @@ class BaseModelEquivalenceTestCase(TestCase):
             self.assertTrue(dummy_1.__neq__(dummy_2))
 
 
+class BaseModelDirtyTrackingTestCase(TestCase):
+    class TrackedModel(BaseModel):
+        def __init__(self, name, _identifier=None):
+            self.name = name
+            super().__init__(_identifier=_identifier)
+
+        def serialize(self):
+            pass
+
+    def setUp(self):
+        self.arena = Arena()
+        activation = self.arena.activate()
+        activation.__enter__()
+        self.addCleanup(activation.__exit__, None, None, None)
+
+    def test_new_object_is_dirty(self):
+        dummy = self.TrackedModel('new')
+        self.assertTrue(dummy.is_dirty)
+
+    def test_mark_clean(self):
+        dummy = self.TrackedModel('clean')
+        dummy.mark_clean()
+        self.assertFalse(dummy.is_dirty)
+        self.assertNotIn(dummy, self.arena.dirty)
+
+    def test_setting_attribute_marks_dirty(self):
+        dummy = self.TrackedModel('before')
+        dummy.mark_clean()
+        dummy.name = 'after'
+        self.assertTrue(dummy.is_dirty)
+
+    def test_dirty_objects_kept_in_order(self):
+        dummy_1 = self.TrackedModel('first')
+        dummy_2 = self.TrackedModel('second')
+        dummy_1.mark_clean()
+        dummy_1.name = 'first again'
+        self.assertEqual(list(self.arena.dirty), [dummy_2, dummy_1])
+
+
 class SerializedReferenceTestCase(TestCase):
     def test_init_sets_keys(self):
         ref = SerializedReference('foo.bar.baz', '42')
@@ -119,3 +255,28 @@ class SerializedReferenceTestCase(TestCase):
     def test_str(self):
         ref = SerializedReference('path.to.class', '77')
         self.assertEqual(str(ref), '<SerializedReference: path.to.class 77>')
+
+
+class LazyReferenceTestCase(TestCase):
+    def setUp(self):
+        self.item = Item('lamp')
+        self.lazy = LazyReference(
+            Item,
+            self.item._identifier,
+            lambda model_cls, identifier: self.item
+        )
+
+    def test_resolve(self):
+        self.assertIs(self.lazy.resolve(), self.item)
+
+    def test_equals_object_referenced(self):
+        self.assertEqual(self.lazy, self.item)
+        self.assertEqual(self.item, self.lazy)
+        self.assertEqual(hash(self.lazy), hash(self.item))
+
+    def test_not_equal_to_other_objects(self):
+        self.assertNotEqual(self.lazy, Item('lamp'))
+        self.assertNotEqual(Item('lamp'), self.lazy)
+
+    def test_reference(self):
+        self.assertEqual(self.lazy.reference, self.item.reference)
@@ -0,0 +1,246 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from adventure.models import Direction, Exit, Item, Location
+from adventure.models.base import LazyReference
+from adventure.models.containers import (
+    ExitList, IndexedList, LazyList, NamedObjectList, TrackedList
+)
+
+
+class IndexedListTestCase(TestCase):
+    def test_index_keys_raises_not_implemented_error(self):
+        with self.assertRaises(NotImplementedError):
+            IndexedList(['foo']).find('foo')
+
+    def test_index_built_lazily(self):
+        indexed = NamedObjectList([Item('lamp')])
+        self.assertIsNone(indexed._index)
+        indexed.find('lamp')
+        self.assertIsNotNone(indexed._index)
+
+
+class TrackedListTestCase(TestCase):
+    def setUp(self):
+        self.owner = Location('Cupboard', 'Cramped')
+        self.owner.mark_clean()
+        self.tracked = TrackedList(['broom'], owner=self.owner)
+
+    def test_mutation_marks_owner_dirty(self):
+        mutations = (
+            lambda tracked: tracked.append('mop'),
+            lambda tracked: tracked.extend(['mop']),
+            lambda tracked: tracked.remove('broom'),
+            lambda tracked: tracked.pop(),
+            lambda tracked: tracked.insert(0, 'mop'),
+            lambda tracked: tracked.clear(),
+            lambda tracked: tracked.__setitem__(0, 'mop'),
+            lambda tracked: tracked.__delitem__(0),
+        )
+        for mutate in mutations:
+            tracked = TrackedList(['broom'], owner=self.owner)
+            self.owner.mark_clean()
+            mutate(tracked)
+            self.assertTrue(self.owner.is_dirty)
+
+    def test_lookup_leaves_owner_clean(self):
+        self.assertIn('broom', self.tracked)
+        self.assertFalse(self.owner.is_dirty)
+
+    def test_copy_is_detached(self):
+        copied = copy.copy(self.tracked)
+        copied.append('mop')
+        self.assertFalse(self.owner.is_dirty)
+
+    def test_location_lists_owned_by_location(self):
+        self.owner.items.append(Item('bucket'))
+        self.assertTrue(self.owner.is_dirty)
+
+
+class LazyListTestCase(TestCase):
+    def setUp(self):
+        self.owner = Location('Cupboard', 'Cramped')
+        self.attic = Location('Attic', 'Dusty')
+        self.resolved = []
+
+        def resolve(model_cls, identifier):
+            self.resolved.append(identifier)
+            return self.attic
+
+        self.lazy = LazyList(
+            [self.owner, LazyReference(Location, self.attic._identifier,
+                                       resolve)],
+            owner=self.owner
+        )
+        self.owner.mark_clean()
+
+    def test_membership_does_not_resolve(self):
+        self.assertIn(self.attic, self.lazy)
+        self.assertEqual(self.resolved, [])
+
+    def test_access_resolves_once(self):
+        self.assertIs(self.lazy[1], self.attic)
+        self.assertIs(self.lazy[-1], self.attic)
+        self.assertEqual(self.resolved, [self.attic._identifier])
+
+    def test_iteration_resolves(self):
+        self.assertEqual(list(self.lazy), [self.owner, self.attic])
+        self.assertIs(self.lazy[1:][0], self.attic)
+
+    def test_resolving_leaves_owner_clean(self):
+        list(self.lazy)
+        self.assertFalse(self.owner.is_dirty)
+
+
+class NamedObjectListTestCase(TestCase):
+    def setUp(self):
+        self.lamp = Item('lamp', synonym_names=['lantern'])
+        self.key = Item('key', synonym_names=['skeleton key'])
+        self.named_objects = NamedObjectList([self.lamp, self.key])
+
+    def test_find_by_name(self):
+        self.assertIs(self.named_objects.find('lamp'), self.lamp)
+        self.assertIs(self.named_objects.find('key'), self.key)
+
+    def test_rename_updates_index(self):
+        self.named_objects.find('lamp')
+        self.lamp.name = 'torch'
+        self.assertIsNone(self.named_objects.find('lamp'))
+        self.assertIs(self.named_objects.find('torch'), self.lamp)
+        self.named_objects.remove(self.lamp)
+        self.assertIsNone(self.named_objects.find('torch'))
+
+    def test_synonym_change_updates_index(self):
+        self.named_objects.find('lamp')
+        self.lamp.synonym_names = ['torch']
+        self.assertIsNone(self.named_objects.find('lantern'))
+        self.assertIs(self.named_objects.find('torch'), self.lamp)
+
+    def test_synonym_edit_in_place_updates_index(self):
+        self.named_objects.find('lamp')
+        self.lamp.mark_clean()
+        self.lamp.synonym_names.append('torch')
+        self.assertIs(self.named_objects.find('torch'), self.lamp)
+        self.lamp.synonym_names.remove('lantern')
+        self.assertIsNone(self.named_objects.find('lantern'))
+        self.assertTrue(self.lamp.is_dirty)
+
+    def test_rename_leaves_other_indexes_alone(self):
+        other_objects = NamedObjectList([self.key])
+        other_objects.find('key')
+        other_index = other_objects._index
+        self.named_objects.find('lamp')
+        self.lamp.name = 'torch'
+        self.assertIs(other_objects._index, other_index)
+        self.assertIs(self.named_objects.find('torch'), self.lamp)
+
+    def test_removed_objects_forget_list(self):
+        self.named_objects.find('lamp')
+        self.named_objects.remove(self.lamp)
+        self.lamp.name = 'torch'
+        self.assertIsNone(self.named_objects.find('torch'))
+        self.assertEqual(len(self.lamp._holders), 0)
+
+    def test_find_by_synonym(self):
+        self.assertIs(self.named_objects.find('lantern'), self.lamp)
+        self.assertIs(self.named_objects.find('skeleton key'), self.key)
+
+    def test_find_missing(self):
+        self.assertIsNone(self.named_objects.find('sword'))
+
+    def test_last_added_takes_precedence(self):
+        other_lamp = Item('lamp')
+        self.named_objects.append(other_lamp)
+        self.assertIs(self.named_objects.find('lamp'), other_lamp)
+        self.assertIs(self.named_objects.find('lantern'), self.lamp)
+
+    def test_append_updates_index(self):
+        self.named_objects.find('lamp')
+        sword = Item('sword')
+        self.named_objects.append(sword)
+        self.assertIs(self.named_objects.find('sword'), sword)
+
+    def test_extend_updates_index(self):
+        self.named_objects.find('lamp')
+        sword = Item('sword')
+        self.named_objects += [sword]
+        self.assertIs(self.named_objects.find('sword'), sword)
+
+    def test_remove_updates_index(self):
+        self.named_objects.find('lamp')
+        self.named_objects.remove(self.lamp)
+        self.assertIsNone(self.named_objects.find('lamp'))
+        self.assertIsNone(self.named_objects.find('lantern'))
+        self.assertIs(self.named_objects.find('key'), self.key)
+
+    def test_remove_missing(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.named_objects.remove(Item('sword'))
+            self.named_objects.find('lamp')
+        self.assertEqual(self.named_objects, [self.lamp, self.key])
+
+    def test_pop_updates_index(self):
+        self.named_objects.find('lamp')
+        self.assertIs(self.named_objects.pop(), self.key)
+        self.assertIsNone(self.named_objects.find('key'))
+
+    def test_contains(self):
+        self.assertIn(self.lamp, self.named_objects)
+        self.assertNotIn(Item('lamp'), self.named_objects)
+        self.assertNotIn(None, self.named_objects)
+
+    def test_contains_follows_mutation(self):
+        self.named_objects.append(self.lamp)
+        self.named_objects.remove(self.lamp)
+        self.assertIn(self.lamp, self.named_objects)
+        self.named_objects.remove(self.lamp)
+        self.assertNotIn(self.lamp, self.named_objects)
+
+    def test_wholesale_mutation_invalidates_index(self):
+        self.named_objects.find('lamp')
+        sword = Item('sword')
+        self.named_objects[0] = sword
+        self.assertIsNone(self.named_objects.find('lamp'))
+        self.assertIs(self.named_objects.find('sword'), sword)
+
+    def test_copy(self):
+        self.named_objects.find('lamp')
+        copied = copy.copy(self.named_objects)
+        copied.remove(self.lamp)
+        self.assertIs(self.named_objects.find('lamp'), self.lamp)
+        self.assertIsInstance(copied, NamedObjectList)
+
+    def test_pickle(self):
+        unpickled = pickle.loads(pickle.dumps(self.named_objects))
+        self.assertIsInstance(unpickled, NamedObjectList)
+        self.assertEqual(unpickled.find('lantern'), self.lamp)
+        (lamp, _) = unpickled
+        lamp.synonym_names.append('torch')
+        self.assertIs(unpickled.find('torch'), lamp)
+
+    def test_equals_list(self):
+        self.assertEqual(self.named_objects, [self.lamp, self.key])
+
+
+class ExitListTestCase(TestCase):
+    def setUp(self):
+        self.north = Exit(Direction('north', 'n'), Location('Attic', ''))
+        self.south = Exit(Direction('south', 's'), Location('Cellar', ''))
+        self.exits = ExitList([self.north, self.south])
+
+    def test_find_by_direction_name(self):
+        self.assertIs(self.exits.find('north'), self.north)
+
+    def test_find_by_direction_abbrev(self):
+        self.assertIs(self.exits.find('s'), self.south)
+
+    def test_find_missing(self):
+        self.assertIsNone(self.exits.find('up'))
+
+    def test_remove_updates_index(self):
+        self.exits.find('n')
+        self.exits.remove(self.north)
+        self.assertIsNone(self.exits.find('n'))
+        self.assertIsNone(self.exits.find('north'))
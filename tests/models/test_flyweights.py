@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from adventure.models import Arena, Direction, Gender
+from adventure.models.flyweights import FlyweightRegistry
+
+
+class FlyweightRegistryTestCase(TestCase):
+    def setUp(self):
+        self.registry = FlyweightRegistry()
+        self.direction = Direction('north', 'n', _identifier=7)
+        self.registry.register(self.direction)
+
+    def test_intern_matching_content(self):
+        arena = Arena()
+        with arena.activate():
+            direction = self.registry.intern(
+                Direction,
+                {'name': 'north', 'abbrev': 'n', '_identifier': 7}
+            )
+        self.assertIs(direction, self.direction)
+        # The identifier remains taken in the world sharing the instance
+        self.assertGreater(arena.allocate(Direction), 7)
+
+    def test_intern_different_content(self):
+        arena = Arena()
+        with arena.activate():
+            direction = self.registry.intern(
+                Direction,
+                {'name': 'north', 'abbrev': 'n', '_identifier': 8}
+            )
+        self.assertIsNot(direction, self.direction)
+        self.assertEqual(direction.name, 'north')
+        self.assertIs(direction.arena, arena)
+
+    def test_intern_keyed_by_class(self):
+        gender = self.registry.intern(
+            Gender,
+            {
+                'gender': 'north',
+                'subject_pronoun': 'n',
+                'object_pronoun': 'n',
+                'possessive_pronoun': 'n',
+                '_identifier': 7,
+            }
+        )
+        self.assertIsInstance(gender, Gender)
+
+    def test_sources_called_on_first_intern(self):
+        calls = []
+        self.registry.add_source(lambda: calls.append(None))
+        self.registry.intern(Direction, self.direction.serialize())
+        self.registry.intern(Direction, self.direction.serialize())
+        self.assertEqual(len(calls), 1)
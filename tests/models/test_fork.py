@@ -0,0 +1,147 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from adventure.exc import FrozenWorldError
+from adventure.models import Item
+from adventure.models.base import LazyReference
+from adventure.models.fork import MAX_FORK_DEPTH
+from tests.worlds import build_places
+
+
+class ForkTestCase(TestCase):
+    def setUp(self):
+        self.game = build_places()
+        self.arena = self.game.arena
+        self.player = self.game.player
+        self.start, self.other, _ = self.game.locations
+        self.direction = self.start.exits[0].direction
+        self.gender = self.start.people[0].gender
+        for obj in self.game.iterate_objects():
+            obj.mark_clean()
+
+    def test_copies_nothing_up_front(self):
+        fork = self.game.fork()
+        self.assertIsNot(fork, self.game)
+        self.assertIsNot(fork.arena, self.arena)
+        self.assertIsInstance(fork._player, LazyReference)
+        self.assertTrue(callable(fork._locations))
+
+    def test_copies_objects_when_reached(self):
+        fork = self.game.fork()
+        player = fork.player
+        self.assertIsNot(player, self.player)
+        self.assertEqual(player, self.player)
+        self.assertIs(player.arena, fork.arena)
+        self.assertIsInstance(player._location, LazyReference)
+        location = player.location
+        self.assertEqual(location, self.start)
+        self.assertIsNot(location.items[0], self.start.items[0])
+        self.assertIsInstance(location.exits[0]._destination, LazyReference)
+        # Directions and genders are shared
+        self.assertIs(location.exits[0].direction, self.direction)
+        self.assertIs(location.people[0].gender, self.gender)
+
+    def test_references_resolve_to_same_copy(self):
+        fork = self.game.fork()
+        location = fork.player.location
+        self.assertIs(location.exits[0].destination.exits[0].destination,
+                      location)
+        self.assertIs(fork.locations[0], location)
+
+    def test_changes_leave_original_unchanged(self):
+        fork = self.game.fork()
+        location = fork.player.location
+        item = location.items.find('object')
+        location.items.remove(item)
+        fork.player.inventory.append(item)
+        item.synonym_names.append('widget')
+        fork.player.location = location.exits[0].destination
+        self.assertEqual(len(self.start.items), 1)
+        self.assertEqual(len(self.player.inventory), 1)
+        self.assertEqual(self.start.items[0].synonym_names, ['object'])
+        self.assertIs(self.player.location, self.start)
+        self.assertFalse(any(obj.is_dirty for obj in
+                             self.game.iterate_objects()))
+        self.assertIn(fork.player, fork.arena.dirty)
+
+    def test_changes_survive_collection(self):
+        fork = self.game.fork()
+        location = fork.player.location
+        location.description = 'Changed'
+        fork.player.location = location.exits[0].destination
+        del location
+        gc.collect()
+        back = fork.player.location.exits[0].destination
+        self.assertEqual(back.description, 'Changed')
+
+    def test_fork_of_fork(self):
+        fork = self.game.fork()
+        fork.player.location.description = 'Changed'
+        fork.player.score = 5
+        second_fork = fork.fork()
+        self.assertEqual(second_fork.player.score, 5)
+        self.assertEqual(second_fork.player.location.description, 'Changed')
+        self.assertEqual(second_fork.locations[1].name, 'Place B')
+        self.assertEqual(self.start.description, 'This is place A.')
+
+    def test_long_chain_of_forks_collapsed(self):
+        fork = self.game.fork()
+        first_fork = weakref.ref(fork)
+        for depth in range(1, MAX_FORK_DEPTH + 3):
+            fork.player.score = depth
+            if depth == 2:
+                fork.player.location.description = 'Changed'
+                fork.player.inventory.append(fork.player.location.items.pop())
+            fork = fork.fork()
+            self.assertLessEqual(
+                len(fork.fork_resolver.layers), MAX_FORK_DEPTH
+            )
+        self.assertIsNone(first_fork())
+        self.assertEqual(fork.player.score, MAX_FORK_DEPTH + 2)
+        self.assertEqual(fork.player.location.description, 'Changed')
+        self.assertEqual(fork.player.location.items, [])
+        self.assertEqual(
+            [item.name for item in fork.player.inventory],
+            ['dagger', 'thing']
+        )
+        self.assertEqual(fork.locations[1].name, 'Place B')
+        self.assertEqual(self.start.description, 'This is place A.')
+
+    def test_placeholders_of_dropped_fork_raise(self):
+        player = self.game.fork().player
+        with self.assertRaises(ReferenceError):
+            player.location
+        self.start.description = 'Changed'
+
+    def test_original_frozen_once_forked(self):
+        fork = self.game.fork()
+        with self.assertRaises(FrozenWorldError):
+            self.start.description = 'Changed'
+        with self.assertRaises(FrozenWorldError):
+            self.start.items.pop()
+        with self.assertRaises(FrozenWorldError):
+            self.player.score = 5
+        with self.assertRaises(FrozenWorldError):
+            self.player.mark_dirty()
+        self.assertEqual(self.start.description, 'This is place A.')
+        self.assertEqual(len(self.start.items), 1)
+        self.assertEqual(self.player.score, 3)
+        self.assertEqual(fork.player.location.items[0].name, 'thing')
+
+    def test_original_thawed_once_forks_discarded(self):
+        fork = self.game.fork()
+        fork.player.location.description = 'Changed in fork'
+        del fork
+        self.start.description = 'Changed'
+        self.assertTrue(self.start.is_dirty)
+
+    def test_new_objects_get_new_identifiers(self):
+        fork = self.game.fork()
+        with fork.arena.activate():
+            item = Item('pebble')
+        identifiers = [
+            obj._identifier for obj in self.game.iterate_objects()
+            if isinstance(obj, Item)
+        ]
+        self.assertNotIn(item._identifier, identifiers)
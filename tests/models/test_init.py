@@ -0,0 +1,20 @@
+from unittest import TestCase
+
+import adventure.models
+from adventure.models.item import Item
+
+
+class ModelsPackageTestCase(TestCase):
+    def test_imports_models_on_access(self):
+        self.assertIs(adventure.models.Item, Item)
+        self.assertIn('Location', dir(adventure.models))
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from adventure.models import *', namespace)
+        for name in ('Arena', 'Game', 'Item', 'Location', 'Player'):
+            self.assertIs(namespace[name], getattr(adventure.models, name))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            adventure.models.Dragon
@@ -1,3 +1,4 @@
+from copy import copy
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -45,6 +46,17 @@ class ItemTestCase(TestCase):
             }
         )
 
+    def test_slotted(self):
+        item = Item('wrench')
+        self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            item.weight = 3
+
+    def test_copy(self):
+        item = Item('wrench', article='an old', synonym_names=['spanner'])
+        copied = copy(item)
+        self.assertEqual(copied.serialize(), item.serialize())
+
     def test_str(self):
         item = Item('wrench', _identifier=23)
         self.assertEqual(str(item), '<Item 23: wrench>')
@@ -1,7 +1,9 @@
+import copy
+import pickle
 from unittest import TestCase
 from unittest.mock import patch
 
-from adventure.models import Item, Person
+from adventure.models import Arena, Item, Person
 from adventure.models.location import Direction, Exit, Location
 
 
@@ -98,6 +100,23 @@ class LocationTestCase(TestCase):
             }
         )
 
+    def test_copied_lists_track_changes(self):
+        location = Location('Living Room', "It's a mess")
+        for copy_location in (
+                copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):
+            with Arena().activate():
+                copied = copy_location(location)
+                copied.mark_clean()
+                version = copied.version
+                copied.items.append(Item('thing'))
+            self.assertTrue(copied.is_dirty)
+            self.assertEqual(copied.version, version + 1)
+            copied.mark_clean()
+            with copied.arena.activate():
+                copied.exits.append(Exit(Direction('east', 'e'), location))
+            self.assertTrue(copied.is_dirty)
+            self.assertFalse(location.items)
+
 
 class LocationInitTestCase(TestCase):
     def test_set_parameters(self):
@@ -130,6 +149,58 @@ class LocationInitTestCase(TestCase):
             Location('Dungeon', 'Ew, was that a rat?', _identifier=27)
         mock_init.assert_called_once_with(_identifier=27)
 
+    def test_find_exit(self):
+        north = Exit(Direction('north', 'n'), Location('Attic', ''))
+        location = Location('Stairwell', 'Creaky', exits=[north])
+        self.assertIs(location.find_exit('north'), north)
+        self.assertIs(location.find_exit('n'), north)
+        self.assertIsNone(location.find_exit('south'))
+
+    def test_find_added_exit(self):
+        location = Location('Stairwell', 'Creaky')
+        self.assertIsNone(location.find_exit('up'))
+        up = Exit(Direction('up', 'u'), Location('Attic', ''))
+        location.exits.append(up)
+        self.assertIs(location.find_exit('up'), up)
+
+    def test_changes_increment_version(self):
+        location = Location('Stairwell', 'Creaky')
+        version = location.version
+        location.items.append(Item('rope'))
+        self.assertGreater(location.version, version)
+        version = location.version
+        location.description = 'Creakier'
+        self.assertGreater(location.version, version)
+
+    def test_contents_changes_increment_version(self):
+        rope = Item('rope')
+        location = Location('Stairwell', 'Creaky', items=[rope])
+        location.mark_clean()
+        version = location.version
+        rope.name = 'cord'
+        self.assertGreater(location.version, version)
+        self.assertFalse(location.is_dirty)
+
+    def test_exit_changes_recorded(self):
+        with Arena().activate() as arena:
+            location = Location('Stairwell', 'Creaky')
+            attic = Location('Attic', '')
+        arena.track_map_changes()
+        location.items.append(Item('rope'))
+        self.assertNotIn(location, arena.map_changes)
+        location.exits.append(Exit(Direction('up', 'u'), attic))
+        self.assertEqual(arena.map_changes[location], 1)
+        location.exits = []
+        self.assertEqual(arena.map_changes[location], 2)
+
+    def test_render_cache_untracked(self):
+        location = Location('Stairwell', 'Creaky')
+        location.mark_clean()
+        version = location.version
+        location.render_cache = (version, 'Creaky')
+        self.assertEqual(location.version, version)
+        self.assertFalse(location.is_dirty)
+
     def test_str(self):
         location = Location('Eyrie', 'You can see your house!', _identifier=6)
         self.assertEqual(str(location), '<Location 6: Eyrie>')
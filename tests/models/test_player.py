@@ -1,7 +1,8 @@
+import pickle
 from unittest import TestCase
 from unittest.mock import patch
 
-from adventure.models import Person, Player, Location, Item
+from adventure.models import Arena, Person, Player, Location, Item
 
 
 class PlayerTestCase(TestCase):
@@ -24,6 +25,14 @@ class PlayerTestCase(TestCase):
             }
         )
 
+    def test_unpickled_inventory_tracks_changes(self):
+        player = Player(self.location)
+        with Arena().activate():
+            unpickled = pickle.loads(pickle.dumps(player))
+            unpickled.mark_clean()
+            unpickled.inventory.append(Item('torch'))
+        self.assertTrue(unpickled.is_dirty)
+
     def test_str(self):
         player = Player(self.location, _identifier=4)
         self.assertEqual(str(player), '<Player 4>')
@@ -108,3 +117,26 @@ class FindVisibleObjectTestCase(TestCase):
             self.location_item.synonym_names[0]
         )
         self.assertEqual(obj, self.location_item)
+
+    def test_location_item_precedes_inventory_item(self):
+        other_item = Item('inventory_item')
+        self.location.items.append(other_item)
+        obj = self.player.find_visible_object('inventory_item')
+        self.assertIs(obj, other_item)
+
+    def test_index_follows_collection_changes(self):
+        self.player.find_visible_object(self.location_item.name)
+        self.location.items.remove(self.location_item)
+        self.player.inventory.append(self.location_item)
+        obj = self.player.find_visible_object(self.location_item.name)
+        self.assertIs(obj, self.location_item)
+        self.assertNotIn(self.location_item, self.location.items)
+
+    def test_index_follows_location_change(self):
+        other_item = Item('other_item')
+        self.player.location = Location('Hallway', '', items=[other_item])
+        self.assertIsNone(
+            self.player.find_visible_object(self.location_item.name)
+        )
+        obj = self.player.find_visible_object(other_item.name)
+        self.assertIs(obj, other_item)
@@ -0,0 +1,122 @@
+import tempfile
+from unittest import TestCase
+
+from adventure.batch import (
+    LOST, UNFINISHED, WON, BatchReport, BatchRunner, ScriptResult,
+    ScriptRunner
+)
+from adventure.commands.registry import CommandRegistry
+from adventure.loaders import GameSaver
+from adventure.models import Arena, Game, Item, Location, Player
+
+
+def make_game():
+    with Arena().activate():
+        location = Location(
+            'Elsinore',
+            'A drafty Danish castle.',
+            items=[Item('skull', is_gettable=True)]
+        )
+        return Game(
+            'Hamlet',
+            'Something is rotten.',
+            Player(location),
+            [location]
+        )
+
+
+def score(game):
+    game.player.score += 1
+
+
+def win(game):
+    game.is_over = game.is_won = True
+
+
+def lose(game):
+    game.is_over = True
+
+
+class ScriptRunnerTestCase(TestCase):
+    def setUp(self):
+        self.game = make_game()
+        test_registry = CommandRegistry()
+        for function in (score, win, lose):
+            test_registry.add_command(function.__name__, function)
+        self.runner = ScriptRunner(self.game, test_registry)
+
+    def test_outcomes(self):
+        self.assertEqual(self.runner.run(['score', 'win']).outcome, WON)
+        self.assertEqual(self.runner.run(['lose']).outcome, LOST)
+        self.assertEqual(self.runner.run(['score']).outcome, UNFINISHED)
+
+    def test_scripts_start_from_same_state(self):
+        self.runner.run(['score', 'score'])
+        result = self.runner.run(['score'])
+        self.assertEqual(result.score, 1)
+        self.assertEqual(self.game.player.score, 0)
+
+    def test_stops_when_game_is_over(self):
+        result = self.runner.run(['score', 'win', 'score'])
+        self.assertEqual(result.score, 1)
+        self.assertEqual(result.command_count, 2)
+
+    def test_counts_errors(self):
+        result = self.runner.run(['score', 'dance', 'win now', '', 'score'])
+        self.assertEqual(result.command_count, 4)
+        self.assertEqual(result.error_count, 2)
+        self.assertEqual(result.score, 2)
+
+
+class BatchReportTestCase(TestCase):
+    def setUp(self):
+        self.report = BatchReport([
+            ScriptResult(WON, 10, 5, 0, 0.1),
+            ScriptResult(LOST, 2, 3, 1, 0.1),
+            ScriptResult(WON, 6, 4, 2, 0.1),
+        ], 0.5)
+
+    def test_totals(self):
+        self.assertEqual(self.report.script_count, 3)
+        self.assertEqual(self.report.command_count, 12)
+        self.assertEqual(self.report.error_count, 3)
+
+    def test_outcomes(self):
+        self.assertEqual(self.report.outcomes[WON], 2)
+        self.assertEqual(self.report.outcomes[LOST], 1)
+        self.assertEqual(self.report.outcomes[UNFINISHED], 0)
+
+    def test_mean_score(self):
+        self.assertEqual(self.report.mean_score, 6)
+
+    def test_throughput(self):
+        self.assertEqual(self.report.throughput, 6)
+
+    def test_empty(self):
+        report = BatchReport([], 0.0)
+        self.assertEqual(report.mean_score, 0.0)
+        self.assertEqual(report.throughput, 0.0)
+
+
+class BatchRunnerTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        GameSaver(make_game(), directory=self.directory).save('hamlet')
+
+    def test_run(self):
+        runner = BatchRunner('hamlet', directory=self.directory, processes=2)
+        scripts = [
+            ['get skull', 'look'],
+            ['dance'],
+            ['get skull', 'drop skull', 'inventory'],
+        ] * 3
+        report = runner.run(scripts)
+        self.assertEqual(report.script_count, len(scripts))
+        self.assertEqual(report.command_count, 18)
+        self.assertEqual(
+            [result.error_count for result in report.results],
+            [0, 1, 0] * 3
+        )
+        self.assertEqual(report.outcomes[UNFINISHED], len(scripts))
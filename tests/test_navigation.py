@@ -0,0 +1,251 @@
+import random
+from collections import deque
+from unittest import TestCase
+
+from adventure.models import Arena, Direction, Exit, Game, Location, Player
+from adventure.models.base import LazyReference
+from adventure.navigation import (
+    NavigationIndex, get_name_key, get_navigation
+)
+
+
+def build_map(location_count, exit_count, seed):
+    """Build a game on a random map, in an arena of its own."""
+    rng = random.Random(seed)
+    with Arena().activate():
+        locations = [
+            Location('Room {}'.format(number), '')
+            for number in range(location_count)
+        ]
+        for _ in range(exit_count):
+            origin, destination = rng.sample(locations, 2)
+            origin.exits.append(Exit(Direction('onward', 'o'), destination))
+        return Game('Maze', '', Player(locations[0]), locations)
+
+
+def get_distance(origin, destination):
+    """Return the length of a shortest route, found by plain search."""
+    distances = {origin: 0}
+    queue = deque((origin,))
+    while queue:
+        location = queue.popleft()
+        if location == destination:
+            return distances[location]
+        for exit in location.exits:
+            if exit.destination not in distances:
+                distances[exit.destination] = distances[location] + 1
+                queue.append(exit.destination)
+    return None
+
+
+class NavigationIndexTestCase(TestCase):
+    def setUp(self):
+        with Arena().activate():
+            self.hall = Location('Great Hall', '')
+            self.kitchen = Location('Kitchen', '')
+            self.cellar = Location('Cellar', '')
+            self.attic = Location('Attic', '')
+            self.down = Direction('down', 'd')
+            self.up = Direction('up', 'u')
+            self.hall.exits = [Exit(Direction('east', 'e'), self.kitchen)]
+            self.kitchen.exits = [Exit(self.down, self.cellar)]
+            self.cellar.exits = [Exit(self.up, self.kitchen)]
+            self.game = Game(
+                'House',
+                '',
+                Player(self.hall),
+                [self.hall, self.kitchen, self.cellar, self.attic]
+            )
+        self.navigation = NavigationIndex(self.game)
+
+    def get_directions(self, origin, destination):
+        route = self.navigation.find_route(origin, destination)
+        return None if route is None else [
+            exit.direction.name for exit in route
+        ]
+
+    def test_find_route(self):
+        self.assertEqual(
+            self.get_directions(self.hall, self.cellar),
+            ['east', 'down']
+        )
+        self.assertEqual(
+            self.get_directions(self.cellar, self.kitchen),
+            ['up']
+        )
+        self.assertEqual(self.get_directions(self.hall, self.hall), [])
+
+    def test_unreachable(self):
+        self.assertIsNone(self.navigation.find_route(self.cellar, self.hall))
+        self.assertIsNone(self.navigation.find_route(self.hall, self.attic))
+
+    def test_find_locations(self):
+        self.assertEqual(
+            self.navigation.find_locations('the great HALL'),
+            [self.hall]
+        )
+        self.assertEqual(self.navigation.find_locations('garden'), [])
+
+    def test_name_key(self):
+        self.assertEqual(get_name_key('The Great Hall'), 'great hall')
+        self.assertEqual(
+            get_name_key('Jack of the Woods'),
+            'jack of the woods'
+        )
+
+    def test_trees_cached(self):
+        self.navigation.find_route(self.hall, self.cellar)
+        hall = self.navigation.numbers[self.hall]
+        tree = self.navigation.trees[hall]
+        self.navigation.find_route(self.hall, self.kitchen)
+        self.assertIs(self.navigation.trees[hall], tree)
+
+    def test_added_exit(self):
+        self.navigation.find_route(self.hall, self.cellar)
+        self.navigation.find_route(self.cellar, self.kitchen)
+        self.hall.exits.append(Exit(self.down, self.cellar))
+        self.assertEqual(self.get_directions(self.hall, self.cellar), ['down'])
+        # Routes from the cellar cannot have changed
+        self.assertIn(
+            self.navigation.numbers[self.cellar],
+            self.navigation.trees
+        )
+
+    def test_removed_exit(self):
+        self.navigation.find_route(self.hall, self.cellar)
+        self.kitchen.exits.remove(self.kitchen.exits[0])
+        self.assertIsNone(self.navigation.find_route(self.hall, self.cellar))
+
+    def test_exit_to_new_location(self):
+        with self.game.arena.activate():
+            garden = Location('Garden', '', exits=[Exit(self.up, self.attic)])
+        self.navigation.find_route(self.hall, self.cellar)
+        self.cellar.exits = [Exit(Direction('out', 'o'), garden)]
+        self.assertEqual(
+            self.get_directions(self.hall, self.attic),
+            ['east', 'down', 'out', 'up']
+        )
+        self.assertEqual(self.navigation.find_locations('garden'), [garden])
+
+    def test_untracked_until_indexed(self):
+        self.assertIsNone(Arena().map_changes)
+        self.assertIsNotNone(self.game.arena.map_changes)
+
+    def test_get_navigation(self):
+        self.game.mark_clean()
+        navigation = get_navigation(self.game)
+        self.assertIs(get_navigation(self.game), navigation)
+        self.assertFalse(self.game.is_dirty)
+        self.assertIsNone(self.game.fork().navigation)
+
+
+class ShortestRouteTestCase(TestCase):
+    """Compares routes with those found by plain search, on random maps."""
+
+    def check_routes(self, navigation, game, rng):
+        for _ in range(40):
+            origin, destination = rng.sample(list(game.locations), 2)
+            route = navigation.find_route(origin, destination)
+            distance = get_distance(origin, destination)
+            if distance is None:
+                self.assertIsNone(route)
+                continue
+            self.assertEqual(len(route), distance)
+            location = origin
+            for exit in route:
+                self.assertIn(exit, location.exits)
+                location = exit.destination
+            self.assertEqual(location, destination)
+
+    def check_map(self, fork=False, **kwargs):
+        rng = random.Random(1)
+        game = build_map(60, 120, seed=2)
+        if fork:
+            # Forks copy locations as they are reached, and so are indexed
+            # lazily
+            game = game.fork()
+        navigation = NavigationIndex(game, **kwargs)
+        self.assertEqual(navigation.lazy, fork)
+        self.check_routes(navigation, game, rng)
+        for _ in range(20):
+            location = rng.choice(game.locations)
+            if location.exits and rng.random() < 0.5:
+                location.exits.remove(rng.choice(location.exits))
+            else:
+                with game.arena.activate():
+                    location.exits.append(Exit(
+                        Direction('onward', 'o'),
+                        rng.choice(game.locations)
+                    ))
+            self.check_routes(navigation, game, rng)
+
+    def test_all_pairs(self):
+        self.check_map()
+
+    def test_search_between(self):
+        self.check_map(all_pairs_limit=0)
+
+    def test_search_between_without_route_cache(self):
+        self.check_map(all_pairs_limit=0, route_cache_size=0)
+
+    def test_lazy_all_pairs(self):
+        self.check_map(fork=True)
+
+    def test_lazy_search(self):
+        self.check_map(fork=True, all_pairs_limit=0)
+
+    def test_lazy_search_without_route_cache(self):
+        self.check_map(fork=True, all_pairs_limit=0, route_cache_size=0)
+
+
+class LazyNavigationTestCase(TestCase):
+    def setUp(self):
+        with Arena().activate():
+            self.locations = [
+                Location('Room {}'.format(number), '') for number in range(6)
+            ]
+            onward = Direction('onward', 'o')
+            for origin, destination in zip(self.locations, self.locations[1:]):
+                origin.exits.append(Exit(onward, destination))
+            self.locations[0].exits.append(
+                Exit(Direction('back', 'b'), self.locations[3])
+            )
+            game = Game('Corridor', '', Player(self.locations[0]),
+                        self.locations)
+        self.fork = game.fork()
+        self.navigation = NavigationIndex(self.fork)
+
+    def get_copied(self):
+        return [
+            location.name for location in self.locations
+            if self.fork.arena.get(Location, location._identifier)
+        ]
+
+    def test_find_route_to_name(self):
+        route = self.navigation.find_route_to_name(
+            self.fork.player.location,
+            'room 3'
+        )
+        self.assertEqual([exit.direction.name for exit in route], ['back'])
+        self.assertEqual(self.get_copied(), ['Room 0', 'Room 1', 'Room 3'])
+
+    def test_find_route_builds_nearer_locations_only(self):
+        destination = list.__getitem__(self.fork.locations, 2)
+        self.assertIsInstance(destination, LazyReference)
+        route = self.navigation.find_route(
+            self.fork.player.location,
+            destination
+        )
+        self.assertEqual(len(route), 2)
+        self.assertEqual(self.get_copied(), ['Room 0', 'Room 1'])
+
+    def test_unknown_name(self):
+        self.assertIsNone(self.navigation.find_route_to_name(
+            self.fork.player.location,
+            'garden'
+        ))
+        self.assertEqual(self.navigation.find_locations('garden'), [])
+        self.assertEqual(
+            self.navigation.find_locations('room 5'),
+            [self.fork.locations[5]]
+        )
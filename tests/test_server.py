@@ -0,0 +1,123 @@
+import asyncio
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from adventure.commands.replay import CommandJournal
+from adventure.models import Game, Item, Location, Player
+from adventure.server import PROMPT, GameServer
+
+
+def make_game():
+    location = Location(
+        'Elsinore',
+        'A drafty Danish castle.',
+        items=[Item('skull')]
+    )
+    return Game('Hamlet', 'Something is rotten.', Player(location), [location])
+
+
+class GameServerTestCase(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game_server = GameServer(make_game)
+        self.server = await self.game_server.start(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        self.addAsyncCleanup(self.close, writer)
+        return reader, writer
+
+    @staticmethod
+    async def close(writer):
+        writer.close()
+        await writer.wait_closed()
+
+    @staticmethod
+    async def send(reader, writer, text):
+        writer.write('{}\n'.format(text).encode('utf-8'))
+        return await GameServerTestCase.read_reply(reader)
+
+    @staticmethod
+    async def read_reply(reader):
+        reply = await reader.readuntil(PROMPT.encode('utf-8'))
+        return reply.decode('utf-8')[:-len(PROMPT)]
+
+    async def test_welcome(self):
+        reader, _ = await self.connect()
+        self.assertEqual(
+            await self.read_reply(reader),
+            'Something is rotten.\nElsinore\nA drafty Danish castle.\n'
+            'You see a skull.\n'
+        )
+
+    async def test_command(self):
+        reader, writer = await self.connect()
+        await self.read_reply(reader)
+        self.assertEqual(
+            await self.send(reader, writer, 'get the skull'),
+            'You pick up the skull.\n'
+        )
+        self.assertEqual(
+            await self.send(reader, writer, 'inventory'),
+            'You are carrying a skull.\n'
+        )
+
+    async def test_unknown_command(self):
+        reader, writer = await self.connect()
+        await self.read_reply(reader)
+        self.assertEqual(
+            await self.send(reader, writer, 'dance'),
+            "I don't know how to do that.\n"
+        )
+
+    async def test_sessions_have_separate_games(self):
+        first_reader, first_writer = await self.connect()
+        second_reader, second_writer = await self.connect()
+        await self.read_reply(first_reader)
+        await self.read_reply(second_reader)
+        await self.send(first_reader, first_writer, 'get skull')
+        self.assertEqual(
+            await self.send(second_reader, second_writer, 'inventory'),
+            "You aren't carrying anything.\n"
+        )
+
+    async def test_quit_closes_connection(self):
+        reader, writer = await self.connect()
+        await self.read_reply(reader)
+        writer.write(b'quit\n')
+        self.assertEqual(await reader.read(), b'')
+
+
+class JournalingGameServerTestCase(GameServerTestCase):
+    async def asyncSetUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.journal_directory = directory.name
+        self.game_server = GameServer(
+            make_game,
+            journal_directory=self.journal_directory
+        )
+        self.server = await self.game_server.start(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def test_writes_journal_when_session_ends(self):
+        reader, writer = await self.connect()
+        await self.read_reply(reader)
+        await self.send(reader, writer, 'get the skull')
+        writer.write(b'quit\n')
+        await reader.read()
+        journal_path = os.path.join(
+            self.journal_directory,
+            'session-1.journal'
+        )
+        with open(journal_path) as journal_file:
+            journal = CommandJournal.load(journal_file)
+        self.assertEqual(
+            [(entry.verb, entry.words) for entry in journal],
+            [('get', ['skull'])]
+        )
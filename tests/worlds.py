@@ -0,0 +1,72 @@
+"""Small worlds shared by tests, and helpers to compare them."""
+from adventure.loaders import GameSaver
+from adventure.models import (
+    Arena, Direction, Exit, Game, Gender, Item, Location, Person, Player
+)
+
+
+def build_castle():
+    """Build a castle: a hall, where the player starts holding a key, with
+    a lamp, and a cellar below it, where Yorick is.
+
+    Return:
+        a Game object, in an arena of its own
+    """
+    with Arena().activate():
+        hall = Location('Hall', 'Echoing', items=[Item('lamp')])
+        cellar = Location(
+            'Cellar',
+            'Damp',
+            people=[Person('Yorick', '', Gender('male', 'he', 'him', 'his'))]
+        )
+        hall.exits = [Exit(Direction('down', 'd'), cellar)]
+        cellar.exits = [Exit(Direction('up', 'u'), hall)]
+        return Game('Castle', '', Player(hall, [Item('key')]), [hall, cellar])
+
+
+def build_places():
+    """Build three places in a row: place A, where the player starts holding
+    a dagger, with a thing and Macbeth; place B, with a skull and Yorick;
+    and place C, which only place B leads to.
+
+    Return:
+        a Game object, in an arena of its own
+    """
+    with Arena().activate():
+        gender = Gender('dinosaur', 'it', 'rawr', 'grhm?')
+        start = Location(
+            'Place A',
+            'This is place A.',
+            items=[Item('thing', synonym_names=['object'])],
+            people=[Person('Macbeth', 'Shifty guy', gender)],
+        )
+        other = Location(
+            'Place B',
+            'This is place B.',
+            items=[Item('skull', synonym_names=['bone'])],
+            people=[Person('Yorick', 'A fellow of infinite jest', gender)],
+            exits=[Exit(Direction('backwards', 'b'), start)],
+        )
+        far = Location('Place C', 'This is place C.')
+        other.exits.append(Exit(Direction('forwards', 'f'), far))
+        start.exits = [Exit(Direction('forwards', 'f'), other)]
+        player = Player(start, inventory=[Item('dagger')], score=3)
+        return Game(
+            'Serializable Game',
+            'Once upon a time',
+            player=player,
+            locations=[start, other, far],
+        )
+
+
+def serialize(game):
+    """Return every object of a game, serialized by section.
+
+    Arguments:
+        game (Game): a game
+
+    Return:
+        a dict, as written to save files
+    """
+    game_objs = GameSaver(game)._extract_all_game_objects()
+    return GameSaver._serialize_game_objects(game, **game_objs)